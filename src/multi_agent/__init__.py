@@ -4,35 +4,71 @@ A Python framework for orchestrating AI agents with tool integration,
 state machine-based execution, and fault tolerance.
 """
 
-from .agent import BaseAgent
-from .config import (
-    AgentConfig,
-    LLMConfig,
-    MCPServerConfig,
-    WorkflowConfig,
-    load_agent_config,
-    load_mcp_servers_config,
-    load_workflow_config,
-)
-from .execution import ExecutableTask, Orchestrator
-from .models import (
-    Agent,
-    Checkpoint,
-    Message,
-    State,
-    SubAgentSession,
-    Task,
-    TaskStatus,
-    Tool,
-    ToolCall,
-    TraceLog,
-    Workflow,
-)
-from .state import StateMachine, StateManager, create_initial_state
-from .tools import MCPToolManager, ToolExecutor
-from .tracing import Tracer
+import importlib
+from typing import TYPE_CHECKING, Any
 
-__version__ = "0.1.0"
+from ._version import __version__
+
+if TYPE_CHECKING:
+    from .agent import BaseAgent
+    from .config import (
+        AgentConfig,
+        LLMConfig,
+        MCPServerConfig,
+        WorkflowConfig,
+        load_agent_config,
+        load_mcp_servers_config,
+        load_workflow_config,
+    )
+    from .execution import ExecutableTask, Orchestrator
+    from .models import (
+        Agent,
+        Checkpoint,
+        Message,
+        State,
+        SubAgentSession,
+        Task,
+        TaskStatus,
+        Tool,
+        ToolCall,
+        TraceLog,
+        Workflow,
+    )
+    from .state import StateMachine, StateManager, create_initial_state
+    from .tools import MCPToolManager, ToolExecutor
+    from .tracing import Tracer
+
+# Public names are imported from their subpackage on first access, so
+# importing the package (e.g. for the CLI) doesn't load models or execution
+_LAZY_EXPORTS = {
+    "BaseAgent": ".agent",
+    "AgentConfig": ".config",
+    "LLMConfig": ".config",
+    "MCPServerConfig": ".config",
+    "WorkflowConfig": ".config",
+    "load_agent_config": ".config",
+    "load_mcp_servers_config": ".config",
+    "load_workflow_config": ".config",
+    "ExecutableTask": ".execution",
+    "Orchestrator": ".execution",
+    "Agent": ".models",
+    "Checkpoint": ".models",
+    "Message": ".models",
+    "State": ".models",
+    "SubAgentSession": ".models",
+    "Task": ".models",
+    "TaskStatus": ".models",
+    "Tool": ".models",
+    "ToolCall": ".models",
+    "TraceLog": ".models",
+    "Workflow": ".models",
+    "StateMachine": ".state",
+    "StateManager": ".state",
+    "create_initial_state": ".state",
+    "MCPToolManager": ".tools",
+    "ToolExecutor": ".tools",
+    "Tracer": ".tracing",
+}
 
 __all__ = [
     # Version
@@ -72,3 +108,17 @@ __all__ = [
     # Tracing
     "Tracer",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names lazily on attribute access."""
+    if name in _LAZY_EXPORTS:
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """List lazy exports alongside the module's loaded attributes."""
+    return sorted({*globals(), *_LAZY_EXPORTS})
@@ -0,0 +1,6 @@
+"""Allow running the CLI with ``python -m multi_agent``."""
+
+from .cli.main import main
+
+if __name__ == "__main__":
+    main()
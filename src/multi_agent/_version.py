@@ -0,0 +1,3 @@
+"""Version information for multi-agent framework."""
+
+__version__ = "0.1.0"
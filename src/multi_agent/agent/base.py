@@ -169,6 +169,7 @@ class BaseAgent:
         self.llm_client = LLMClient(agent.llm_config)
         self._context_limit_retries = 0
         self._max_context_limit_retries = 3
+        self._static_tools = self._build_tool_definitions()
 
     @classmethod
     def from_config(cls, config: AgentConfig, tool_executor: Optional[ToolExecutor] = None) -> "BaseAgent":
@@ -329,7 +330,7 @@ class BaseAgent:
         messages = state.messages
         if len(messages) > 15:
             # Keep system messages and recent messages
-            system_messages = [m for m in messages if m.is_system()]
+            system_messages = state.system_messages
             recent_messages = messages[-10:] if len(messages) > 10 else messages
 
             # Create new state with reduced message history
@@ -373,7 +374,7 @@ class BaseAgent:
                         "type": "function",
                         "function": {
                             "name": tc.tool,
-                            "arguments": json.dumps(tc.arguments),
+                            "arguments": tc.arguments_json(),
                         },
                     }
                     for tc in msg.tool_calls
@@ -400,26 +401,52 @@ class BaseAgent:
         Returns:
             List of tool definitions
         """
+        return self._static_tools
+
+    def _build_tool_definitions(self) -> list[dict[str, Any]]:
+        """Build tool definitions for the agent's configured tools.
+
+        Called once at construction so misconfigured tool names surface
+        before any LLM call is made.
+
+        Returns:
+            List of tool definitions
+
+        Raises:
+            ValueError: If a configured tool is not registered
+        """
         if not self.tool_executor:
             return []
 
-        tools: list[dict[str, Any]] = []
+        # Index MCP tools by name (first server wins)
+        tools_by_name: dict[str, Any] = {}
+        if self.tool_executor.manager:
+            for tool in self.tool_executor.manager.list_tools():
+                tools_by_name.setdefault(tool.name, tool)
+
+        builtin_registry = self.tool_executor.builtin_registry
+        missing = [
+            name
+            for name in self.agent.tools
+            if name not in tools_by_name and not (builtin_registry and builtin_registry.has(name))
+        ]
+        if missing:
+            raise ValueError(f"Agent {self.agent.name} references unknown tools: {', '.join(missing)}")
 
+        tools: list[dict[str, Any]] = []
         for tool_name in self.agent.tools:
-            # Find tool (could be on any server)
-            for tool in self.tool_executor.manager.list_tools():
-                if tool.name == tool_name:
-                    tools.append(
-                        {
-                            "type": "function",
-                            "function": {
-                                "name": tool.name,
-                                "description": tool.description,
-                                "parameters": tool.input_schema,
-                            },
-                        }
-                    )
-                    break
+            tool = tools_by_name.get(tool_name)
+            if tool:
+                tools.append(
+                    {
+                        "type": "function",
+                        "function": {
+                            "name": tool.name,
+                            "description": tool.description,
+                            "parameters": tool.input_schema,
+                        },
+                    }
+                )
 
         return tools
 
@@ -529,8 +556,5 @@ class BaseAgent:
             return ""
 
         # Get last assistant message content
-        for msg in reversed(state.messages):
-            if msg.is_from_assistant():
-                return msg.content
-
-        return ""
+        last_assistant = state.last_assistant_message
+        return last_assistant.content if last_assistant else ""
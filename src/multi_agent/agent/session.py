@@ -3,6 +3,8 @@
 This module provides session management for isolated sub-agent executions.
 """
 
+import asyncio
+from collections import OrderedDict
 from typing import Optional
 
 from pydantic import BaseModel
@@ -12,15 +14,23 @@ from ..models import Message, State, SubAgentSession
 from ..state import StateManager
 from ..tools import ToolExecutor
 from ..tracing import Tracer
-from ..utils import generate_session_id, get_logger
+from ..utils import env_number, generate_session_id, get_logger
 
 logger = get_logger(__name__)
 
+# Upper-cased labels for the standard message roles
+_ROLE_UPPER = {"user": "USER", "assistant": "ASSISTANT", "tool": "TOOL", "system": "SYSTEM"}
+
+# Default number of sessions kept in memory (MULTI_AGENT_SESSION_CACHE_SIZE overrides)
+DEFAULT_SESSION_CACHE_SIZE = 256
+
 
 class SubAgentSessionManager:
     """Manages sub-agent sessions with isolation guarantees.
 
     Each session maintains separate message history and state from the parent agent.
+    Only the most recently used sessions are kept in memory; evicted sessions
+    are reloaded from the state manager on demand.
     """
 
     def __init__(
@@ -28,6 +38,7 @@ class SubAgentSessionManager:
         parent_task_id: str,
         state_manager: StateManager,
         tracer: Tracer,
+        max_cached_sessions: Optional[int] = None,
     ) -> None:
         """Initialize the session manager.
 
@@ -35,11 +46,20 @@ class SubAgentSessionManager:
             parent_task_id: Parent task ID
             state_manager: State manager for persistence
             tracer: Trace logger
+            max_cached_sessions: Maximum sessions kept in memory
+                (defaults to MULTI_AGENT_SESSION_CACHE_SIZE or 256)
         """
         self.parent_task_id = parent_task_id
         self.state_manager = state_manager
         self.tracer = tracer
-        self.sessions: dict[str, SubAgentSession] = {}
+        if max_cached_sessions is None:
+            max_cached_sessions = env_number(
+                "MULTI_AGENT_SESSION_CACHE_SIZE", DEFAULT_SESSION_CACHE_SIZE, int
+            )
+        self.max_cached_sessions = max(1, max_cached_sessions)
+        self.sessions: OrderedDict[str, SubAgentSession] = OrderedDict()
+        # Finished sessions awaiting persistence by flush()
+        self._dirty: dict[str, SubAgentSession] = {}
 
     async def create_session(
         self,
@@ -57,21 +77,16 @@ class SubAgentSessionManager:
         """
         session_id = generate_session_id()
 
-        # Create initial state with isolated message history
-        from ..state.base import create_initial_state
-
-        initial_state = create_initial_state(agent.agent.name, task_description)
-
+        # message_history and status use the model defaults ([] and "running"),
+        # which skips validating them on every session creation
         session = SubAgentSession(
             session_id=session_id,
             parent_task_id=self.parent_task_id,
             agent_name=agent.agent.name,
             task_description=task_description,
-            message_history=[],
-            status="running",
         )
 
-        self.sessions[session_id] = session
+        self._cache_session(session)
 
         # Log session creation
         self.tracer.log_sub_agent_session(
@@ -79,6 +94,7 @@ class SubAgentSessionManager:
             agent=agent.agent.name,
             message_count=0,
             status="running",
+            save=False,
         )
 
         logger.info(f"Created sub-agent session: {session_id} for agent {agent.agent.name}")
@@ -117,31 +133,59 @@ class SubAgentSessionManager:
                 agent=session.agent_name,
                 message_count=len(result.state.messages),
                 status="completed",
+                save=False,
             )
 
-            # Save session
-            self.state_manager.save_session(session)
+            # Persisted in batch by flush()
+            self._dirty[session.session_id] = session
 
             logger.info(f"Completed sub-agent session: {session.session_id}")
 
             return result.output
 
         except Exception as e:
-            logger.error(f"Sub-agent session failed: {session.session_id} - {e}")
-            session.fail(str(e))
+            self.fail_session(session, str(e))
+            raise
 
-            # Log failure
-            self.tracer.log_sub_agent_session(
-                session_id=session.session_id,
-                agent=session.agent_name,
-                message_count=len(session.message_history),
-                status="failed",
-            )
+    def fail_session(self, session: SubAgentSession, error: str) -> None:
+        """Mark a session failed, trace it and queue it for the next flush.
 
-            # Save session
-            self.state_manager.save_session(session)
+        Also used by callers that abandon a session from outside, e.g. when
+        a delegation deadline cancels execute_session.
 
-            raise
+        Args:
+            session: Session that failed
+            error: Error message
+        """
+        logger.error(f"Sub-agent session failed: {session.session_id} - {error}")
+        session.fail(error)
+
+        # Log failure
+        self.tracer.log_sub_agent_session(
+            session_id=session.session_id,
+            agent=session.agent_name,
+            message_count=len(session.message_history),
+            status="failed",
+            save=False,
+        )
+
+        # Persisted in batch by flush()
+        self._dirty[session.session_id] = session
+
+    async def flush(self) -> None:
+        """Persist all finished sessions and buffered trace records.
+
+        Sessions are written in one batch off the event loop thread; the
+        trace is saved once for all session records logged since the last flush.
+        """
+        self.tracer.flush()
+
+        if not self._dirty:
+            return
+
+        sessions = list(self._dirty.values())
+        self._dirty.clear()
+        await asyncio.to_thread(self.state_manager.save_sessions_batch, sessions)
 
     def get_session(self, session_id: str) -> Optional[SubAgentSession]:
         """Get a session by ID.
@@ -152,7 +196,27 @@ class SubAgentSessionManager:
         Returns:
             Session or None if not found
         """
-        return self.sessions.get(session_id)
+        session = self.sessions.get(session_id)
+        if session is not None:
+            self.sessions.move_to_end(session_id)
+            return session
+
+        # Evicted or never cached: fall back to pending, then persisted sessions
+        session = self._dirty.get(session_id) or self.state_manager.load_session(session_id)
+        if session is not None:
+            self._cache_session(session)
+        return session
+
+    def _cache_session(self, session: SubAgentSession) -> None:
+        """Cache a session, evicting the least recently used ones.
+
+        Args:
+            session: Session to cache
+        """
+        self.sessions[session.session_id] = session
+        self.sessions.move_to_end(session.session_id)
+        while len(self.sessions) > self.max_cached_sessions:
+            self.sessions.popitem(last=False)
 
     def generate_summary(self, session: SubAgentSession) -> str:
         """Generate a summary of the session for the parent agent.
@@ -163,12 +227,7 @@ class SubAgentSessionManager:
         Returns:
             Session summary
         """
-        if session.is_completed:
-            return session.summary or f"Task completed: {session.task_description}"
-        elif session.is_failed:
-            return session.summary or f"Task failed: {session.task_description}"
-        else:
-            return f"Task in progress: {session.task_description} ({session.message_count} messages)"
+        return _compute_summary_text(session)
 
     def get_session_messages(self, session: SubAgentSession) -> list[Message]:
         """Get messages from a session.
@@ -195,22 +254,24 @@ class SubAgentSessionManager:
         Returns:
             Summary message
         """
-        summary = self.generate_summary(session)
+        return create_summary_message(session, include_details)
 
-        if include_details and session.message_history:
-            # Add key details from the conversation
-            details = []
-            for msg in session.message_history[-5:]:  # Last 5 messages
-                role = msg.role.upper()
-                content_preview = msg.content[:100] + "..." if len(msg.content) > 100 else msg.content
-                details.append(f"{role}: {content_preview}")
 
-            summary += "\n\nRecent messages:\n" + "\n".join(details)
+def _compute_summary_text(session: SubAgentSession) -> str:
+    """Compute the one-line summary text for a session.
 
-        return Message(
-            role="assistant",
-            content=summary,
-        )
+    Args:
+        session: Session to summarize
+
+    Returns:
+        Session summary
+    """
+    if session.is_completed:
+        return session.summary or f"Task completed: {session.task_description}"
+    elif session.is_failed:
+        return session.summary or f"Task failed: {session.task_description}"
+    else:
+        return f"Task in progress: {session.task_description} ({session.message_count} messages)"
 
 
 def create_summary_message(
@@ -228,24 +289,26 @@ def create_summary_message(
     Returns:
         Summary message
     """
-    if session.is_completed:
-        summary = session.summary or f"Task completed: {session.task_description}"
-    elif session.is_failed:
-        summary = session.summary or f"Task failed: {session.task_description}"
-    else:
-        summary = f"Task in progress: {session.task_description} ({session.message_count} messages)"
+    cache_key = (session.status, session.message_count, include_details)
+    cached = session._summary_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    summary = _compute_summary_text(session)
 
     if include_details and session.message_history:
-        # Add key details from the conversation
-        details = []
-        for msg in session.message_history[-5:]:  # Last 5 messages
-            role = msg.role.upper()
-            content_preview = msg.content[:100] + "..." if len(msg.content) > 100 else msg.content
-            details.append(f"{role}: {content_preview}")
+        # Add key details from the conversation (last 5 messages)
+        details = "\n".join(
+            f"{_ROLE_UPPER.get(msg.role) or msg.role.upper()}: "
+            f"{msg.content if len(msg.content) <= 100 else msg.content[:100] + '...'}"
+            for msg in session.message_history[-5:]
+        )
 
-        summary += "\n\nRecent messages:\n" + "\n".join(details)
+        summary += "\n\nRecent messages:\n" + details
 
-    return Message(
+    message = Message(
         role="assistant",
         content=summary,
     )
+    session._summary_cache[cache_key] = message
+    return message
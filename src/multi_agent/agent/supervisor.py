@@ -3,22 +3,26 @@
 This module provides the Supervisor agent for coordinating sub-agents.
 """
 
+import asyncio
+from dataclasses import dataclass
 from typing import Any, Optional
 
-from pydantic import BaseModel, ConfigDict
-
 from ..agent.base import AgentExecutionResult, BaseAgent
 from ..agent.session import SubAgentSessionManager, create_summary_message
 from ..models import Agent, Message, State, ToolCall
 from ..state import StateManager
 from ..tools import ToolExecutor
 from ..tracing import Tracer
-from ..utils import get_logger
+from ..utils import env_number, get_logger
 
 logger = get_logger(__name__)
 
+# Default limit on concurrently running sub-agents (MULTI_AGENT_MAX_CONCURRENT_SUBAGENTS overrides)
+DEFAULT_MAX_CONCURRENT_SUBAGENTS = 8
+
 
-class SubAgentTool(BaseModel):
+@dataclass(slots=True, frozen=True)
+class SubAgentTool:
     """Tool wrapper for sub-agent invocation.
 
     Attributes:
@@ -27,8 +31,6 @@ class SubAgentTool(BaseModel):
         description: Tool description
     """
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
-
     name: str
     agent: BaseAgent
     description: str
@@ -67,6 +69,21 @@ class SupervisorAgent(BaseAgent):
                     description=f"Delegate task to {name} agent",
                 )
             )
+        self._sub_agent_tool_definitions = self._build_sub_agent_tool_definitions()
+        # Delegation tool name -> sub-agent, for a single lookup per tool call
+        self._delegate_tool_names: dict[str, BaseAgent] = {
+            sub_tool.name: sub_tool.agent for sub_tool in self.sub_agent_tools
+        }
+
+        # Bound concurrent sub-agent runs so a wide fan-out doesn't flood the LLM provider
+        max_concurrent = env_number(
+            "MULTI_AGENT_MAX_CONCURRENT_SUBAGENTS", DEFAULT_MAX_CONCURRENT_SUBAGENTS, int
+        )
+        self._delegation_semaphore = asyncio.Semaphore(max(1, max_concurrent))
+        # Optional per-sub-agent deadline in seconds (unset means no deadline)
+        self._delegation_timeout: Optional[float] = env_number(
+            "MULTI_AGENT_SUBAGENT_TIMEOUT", None, float
+        )
 
         # Session manager
         self.session_manager: Optional[SubAgentSessionManager] = None
@@ -88,7 +105,11 @@ class SupervisorAgent(BaseAgent):
             Execution result
         """
         self.session_manager = session_manager
-        return await super().execute(task_description, initial_state)
+        try:
+            return await super().execute(task_description, initial_state)
+        finally:
+            # Persist the sub-agent sessions finished during this run in one batch
+            await session_manager.flush()
 
     async def _reasoning_step(self, state: State) -> State:
         """Execute reasoning step with sub-agent delegation.
@@ -136,6 +157,16 @@ class SupervisorAgent(BaseAgent):
     def _prepare_sub_agent_tools(self) -> list[dict[str, Any]]:
         """Prepare sub-agent tools for LLM.
 
+        Returns:
+            List of sub-agent tool definitions
+        """
+        return self._sub_agent_tool_definitions
+
+    def _build_sub_agent_tool_definitions(self) -> list[dict[str, Any]]:
+        """Build sub-agent tool definitions.
+
+        Sub-agents are fixed at construction, so this runs once in __init__.
+
         Returns:
             List of sub-agent tool definitions
         """
@@ -171,6 +202,11 @@ class SupervisorAgent(BaseAgent):
     ) -> State:
         """Execute tool calls with sub-agent delegation support.
 
+        All calls in a turn run concurrently, so sub-agent delegations take
+        max(sub-agent time) rather than the sum. Result messages are appended
+        in the original tool call order. At most MULTI_AGENT_MAX_CONCURRENT_SUBAGENTS
+        (default 8) sub-agents run at once.
+
         Args:
             state: Current state
             tool_calls: Tool calls from LLM
@@ -178,97 +214,133 @@ class SupervisorAgent(BaseAgent):
         Returns:
             Updated state
         """
-        from ..models import ToolCall
-
+        handlers = []
         for tool_call_dict in tool_calls:
-            tool_call = ToolCall(**tool_call_dict)
+            tool_name = tool_call_dict["tool"]
 
-            # Check if this is a sub-agent delegation
-            if tool_call.tool.startswith("delegate_"):
-                await self._handle_sub_agent_delegation(state, tool_call)
+            # Check if this is a sub-agent delegation (unknown delegate_* names report an error)
+            sub_agent = self._delegate_tool_names.get(tool_name)
+            if sub_agent is not None or tool_name.startswith("delegate_"):
+                handlers.append(self._handle_sub_agent_delegation(state, tool_call_dict, sub_agent))
             else:
                 # Handle regular tool calls
-                await self._handle_regular_tool_call(state, tool_call)
+                handlers.append(self._handle_regular_tool_call(state, tool_call_dict))
+
+        results = await asyncio.gather(*handlers, return_exceptions=True)
+
+        new_messages: list[Message] = []
+        for tool_call_dict, result in zip(tool_calls, results, strict=True):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                logger.error(f"Tool call {tool_call_dict['tool']} failed: {result}")
+                new_messages.append(
+                    Message(
+                        role="tool",
+                        content=f"Tool execution failed: {str(result)}",
+                        tool_calls=[ToolCall(**tool_call_dict)],
+                    )
+                )
+            else:
+                new_messages.extend(result)
 
-        return state
+        return state.add_messages(new_messages)
 
     async def _handle_sub_agent_delegation(
         self,
         state: State,
-        tool_call: ToolCall,
-    ) -> None:
+        tool_call_dict: dict[str, Any],
+        sub_agent: Optional[BaseAgent],
+    ) -> list[Message]:
         """Handle sub-agent delegation.
 
         Args:
             state: Current state
-            tool_call: Tool call to handle
-        """
-        # Find sub-agent
-        agent_name = tool_call.tool.replace("delegate_", "")
-        sub_agent = self.sub_agents.get(agent_name)
+            tool_call_dict: Tool call from LLM
+            sub_agent: Sub-agent resolved from the tool name, or None if unknown
 
-        if not sub_agent:
-            error_msg = f"Sub-agent not found: {agent_name}"
+        Returns:
+            Messages to append to the state
+        """
+        if sub_agent is None:
+            error_msg = f"Sub-agent not found: {tool_call_dict['tool'].removeprefix('delegate_')}"
             logger.warning(error_msg)
             error_message = Message(
                 role="tool",
                 content=f"Error: {error_msg}",
             )
-            state.add_message(error_message)
-            return
+            return [error_message]
 
         if not self.session_manager:
             logger.warning("No session manager available for sub-agent delegation")
-            return
+            return []
 
         try:
             # Create and execute session
-            task_description = tool_call.arguments.get("task", "")
+            task_description = (tool_call_dict.get("arguments") or {}).get("task", "")
             session = await self.session_manager.create_session(sub_agent, task_description)
 
-            result = await self.session_manager.execute_session(session, sub_agent)
+            async with self._delegation_semaphore:
+                result = await asyncio.wait_for(
+                    self.session_manager.execute_session(session, sub_agent),
+                    timeout=self._delegation_timeout,
+                )
 
             # Add result as tool message
             result_message = Message(
                 role="tool",
                 content=result,
-                tool_calls=[tool_call],
+                tool_calls=[ToolCall(**tool_call_dict)],
             )
-            state.add_message(result_message)
+            return [result_message]
+
+        except asyncio.TimeoutError:
+            error_msg = f"Sub-agent timed out after {self._delegation_timeout}s: {sub_agent.agent.name}"
+            # wait_for cancelled execute_session, so it never recorded the failure
+            self.session_manager.fail_session(session, error_msg)
+            error_message = Message(
+                role="tool",
+                content=f"Sub-agent execution failed: {error_msg}",
+                tool_calls=[ToolCall(**tool_call_dict)],
+            )
+            return [error_message]
 
         except Exception as e:
             logger.error(f"Sub-agent delegation failed: {e}")
             error_message = Message(
                 role="tool",
                 content=f"Sub-agent execution failed: {str(e)}",
-                tool_calls=[tool_call],
+                tool_calls=[ToolCall(**tool_call_dict)],
             )
-            state.add_message(error_message)
+            return [error_message]
 
     async def _handle_regular_tool_call(
         self,
         state: State,
-        tool_call: ToolCall,
-    ) -> None:
+        tool_call_dict: dict[str, Any],
+    ) -> list[Message]:
         """Handle regular (non-sub-agent) tool calls.
 
         Args:
             state: Current state
-            tool_call: Tool call to handle
+            tool_call_dict: Tool call from LLM
+
+        Returns:
+            Messages to append to the state
         """
         if not self.tool_executor:
-            error_msg = f"Tool executor not available for: {tool_call.tool}"
+            error_msg = f"Tool executor not available for: {tool_call_dict['tool']}"
             logger.warning(error_msg)
             error_message = Message(
                 role="tool",
                 content=f"Error: {error_msg}",
-                tool_calls=[tool_call],
+                tool_calls=[ToolCall(**tool_call_dict)],
             )
-            state.add_message(error_message)
-            return
+            return [error_message]
 
-        # Use parent class method for regular tools
-        await super()._execute_tool_calls(state, [tool_call.model_dump()])
+        # Use parent class method for regular tools (it builds the ToolCall itself)
+        updated_state = await super()._execute_tool_calls(state, [tool_call_dict])
+        return updated_state.messages[len(state.messages):]
 
     def aggregate_results(self, sessions: list) -> str:
         """Aggregate results from multiple sub-agent sessions.
@@ -279,11 +351,10 @@ class SupervisorAgent(BaseAgent):
         Returns:
             Aggregated results summary
         """
-        summaries: list[str] = []
+        if not self.session_manager or not sessions:
+            return "\n\nAggregated Results:\n"
 
-        for session in sessions:
-            if self.session_manager:
-                summary = self.session_manager.generate_summary(session)
-                summaries.append(f"- {session.agent_name}: {summary}")
+        generate_summary = self.session_manager.generate_summary
+        summaries = [f"- {session.agent_name}: {generate_summary(session)}" for session in sessions]
 
         return "\n\nAggregated Results:\n" + "\n".join(summaries)
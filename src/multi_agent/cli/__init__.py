@@ -3,9 +3,23 @@
 This module provides command-line interface for task and trace management.
 """
 
-from .checkpoint import checkpoint_cli
+import importlib
+from typing import Any
+
 from .main import main
-from .task import task_cli
-from .trace import trace_cli
+
+# Command groups are imported on first access so the CLI entry point stays light
+_LAZY_EXPORTS = {
+    "task_cli": ".task",
+    "trace_cli": ".trace",
+    "checkpoint_cli": ".checkpoint",
+}
 
 __all__ = ["main", "task_cli", "trace_cli", "checkpoint_cli"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import command groups lazily on attribute access."""
+    if name in _LAZY_EXPORTS:
+        return getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,8 +3,10 @@
 This module provides command-line interface for HITL checkpoint operations.
 """
 
-import json
-from datetime import datetime
+import asyncio
+import fnmatch
+from collections.abc import Iterator
+from itertools import islice
 from pathlib import Path
 from typing import Optional
 
@@ -12,11 +14,23 @@ import click
 from tabulate import tabulate
 
 from ..config.paths import get_default_config_dir
-from ..execution.hitl import CheckpointMetadata, list_all_checkpoints, load_checkpoint_global
-from ..utils import get_logger
+from ..execution.hitl import (
+    CheckpointSummary,
+    list_all_checkpoints_async,
+    list_checkpoint_summaries_async,
+    load_checkpoint_global,
+    save_checkpoint_file,
+)
+from ..utils import get_logger, json_dumps
 
 logger = get_logger(__name__)
 
+# Number of checkpoint rows rendered per table chunk in list_checkpoints
+LIST_BATCH_SIZE = 100
+
+# Display format for checkpoint creation times
+CREATED_FORMAT = "%Y-%m-%d %H:%M:%S"
+
 
 def get_checkpoints_dir(task_id: str) -> Path:
     """Get the checkpoints directory for a task.
@@ -38,36 +52,50 @@ def list_checkpoints(task_id: str, json_output: bool = False) -> None:
         task_id: Task ID
         json_output: Output as JSON instead of table
     """
-    checkpoints = list_all_checkpoints(task_id)
+    if json_output:
+        checkpoints = asyncio.run(list_all_checkpoints_async(task_id))
+        if not checkpoints:
+            click.echo(f"No checkpoints found for task: {task_id}")
+            return
 
-    if not checkpoints:
+        click.echo(json_dumps([c.model_dump(mode="json") for c in checkpoints], indent=True, default=str))
+        return
+
+    # The table only shows summary fields, so skip loading each checkpoint's state
+    summaries = asyncio.run(list_checkpoint_summaries_async(task_id))
+    if not summaries:
         click.echo(f"No checkpoints found for task: {task_id}")
         return
 
-    if json_output:
-        click.echo(json.dumps([c.model_dump(mode="json") for c in checkpoints], indent=2, default=str))
-    else:
-        rows = []
-        for cp in checkpoints:
-            created = cp.created_at.isoformat()
-            try:
-                dt = datetime.fromisoformat(created)
-                created = dt.strftime("%Y-%m-%d %H:%M:%S")
-            except:
-                pass
+    headers: list[str] = ["Checkpoint ID", "Seq", "Node", "Feedback", "Created"]
+    rows = _checkpoint_rows(summaries)
+
+    # Render in fixed-size batches so output starts before all rows are built
+    while batch := list(islice(rows, LIST_BATCH_SIZE)):
+        click.echo(tabulate(batch, headers=headers, tablefmt="grid"))
+        headers = []
 
-            feedback = cp.human_feedback[:30] + "..." if cp.human_feedback and len(cp.human_feedback) > 30 else cp.human_feedback or "-"
 
-            rows.append([
-                cp.checkpoint_id[:12],
-                cp.sequence_number,
-                cp.node_name,
-                feedback,
-                created,
-            ])
+def _checkpoint_rows(checkpoints: list[CheckpointSummary]) -> Iterator[list]:
+    """Yield table rows for checkpoints.
 
-        headers = ["Checkpoint ID", "Seq", "Node", "Feedback", "Created"]
-        click.echo(tabulate(rows, headers=headers, tablefmt="grid"))
+    Args:
+        checkpoints: Checkpoints to render
+
+    Yields:
+        Table row for each checkpoint
+    """
+    for cp in checkpoints:
+        created = cp.created_at.strftime(CREATED_FORMAT)
+        feedback = cp.human_feedback[:30] + "..." if cp.human_feedback and len(cp.human_feedback) > 30 else cp.human_feedback or "-"
+
+        yield [
+            cp.checkpoint_id[:12],
+            cp.sequence_number,
+            cp.node_name,
+            feedback,
+            created,
+        ]
 
 
 def show_checkpoint(task_id: str, checkpoint_id: str, json_output: bool = False) -> None:
@@ -121,10 +149,9 @@ def resume_checkpoint(task_id: str, checkpoint_id: str, feedback: str) -> None:
     checkpoint_file = checkpoints_dir / f"{checkpoint_id}.json"
 
     try:
-        # Add feedback to checkpoint
-        data = json.loads(checkpoint_file.read_text(encoding="utf-8"))
-        data["human_feedback"] = feedback
-        checkpoint_file.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        # Add feedback to the already-loaded checkpoint and write it back once
+        checkpoint.human_feedback = feedback
+        save_checkpoint_file(checkpoint_file, checkpoint)
 
         click.echo(f"Checkpoint {checkpoint_id} updated with feedback.")
         click.echo(f"Feedback: {feedback}")
@@ -159,6 +186,69 @@ def delete_checkpoint(task_id: str, checkpoint_id: str, confirm: bool = True) ->
         click.echo(f"Error deleting checkpoint: {e}", err=True)
 
 
+def delete_checkpoints_batch(task_id: str, checkpoint_ids: list[str]) -> list[str]:
+    """Delete several checkpoints with concurrent unlinks.
+
+    Args:
+        task_id: Task ID
+        checkpoint_ids: Checkpoint IDs to delete
+
+    Returns:
+        IDs of the checkpoints that were deleted
+    """
+    checkpoints_dir = get_checkpoints_dir(task_id)
+
+    async def unlink_all() -> list[bool]:
+        async def unlink(checkpoint_id: str) -> bool:
+            try:
+                await asyncio.to_thread((checkpoints_dir / f"{checkpoint_id}.json").unlink)
+                return True
+            except Exception as e:
+                logger.error(f"Failed to delete checkpoint {checkpoint_id}: {e}")
+                return False
+
+        return await asyncio.gather(*(unlink(checkpoint_id) for checkpoint_id in checkpoint_ids))
+
+    results = asyncio.run(unlink_all())
+    return [
+        checkpoint_id
+        for checkpoint_id, deleted in zip(checkpoint_ids, results, strict=True)
+        if deleted
+    ]
+
+
+def delete_all_checkpoints(task_id: str, pattern: str = "*", confirm: bool = True) -> None:
+    """Delete all checkpoints whose ID matches a glob pattern.
+
+    Args:
+        task_id: Task ID
+        pattern: Glob pattern matched against checkpoint IDs
+        confirm: Ask for confirmation
+    """
+    checkpoints_dir = get_checkpoints_dir(task_id)
+
+    if not checkpoints_dir.exists():
+        click.echo(f"No checkpoints found for task: {task_id}")
+        return
+
+    checkpoint_ids = [
+        f.stem
+        for f in checkpoints_dir.glob("*.json")
+        if not f.name.startswith(".") and fnmatch.fnmatchcase(f.stem, pattern)
+    ]
+
+    if not checkpoint_ids:
+        click.echo(f"No checkpoints matching '{pattern}' for task: {task_id}")
+        return
+
+    if confirm:
+        if not click.confirm(f"Delete {len(checkpoint_ids)} checkpoint(s)?"):
+            return
+
+    deleted = delete_checkpoints_batch(task_id, checkpoint_ids)
+    click.echo(f"Deleted {len(deleted)} of {len(checkpoint_ids)} checkpoint(s).")
+
+
 @click.group()
 def checkpoint_cli() -> None:
     """Checkpoint management commands."""
@@ -200,5 +290,14 @@ def delete_cmd(task_id: str, checkpoint_id: str, yes: bool) -> None:
     delete_checkpoint(task_id, checkpoint_id, confirm=not yes)
 
 
+@checkpoint_cli.command("delete-all")
+@click.argument("task_id")
+@click.option("--pattern", "-p", default="*", help="Glob pattern for checkpoint IDs")
+@click.option("--yes", "-y", is_flag=True, help="Skip confirmation")
+def delete_all_cmd(task_id: str, pattern: str, yes: bool) -> None:
+    """Delete all checkpoints matching a pattern."""
+    delete_all_checkpoints(task_id, pattern, confirm=not yes)
+
+
 if __name__ == "__main__":
     checkpoint_cli()
@@ -3,16 +3,77 @@
 This module provides the command-line interface for all framework operations.
 """
 
-import click
+import importlib
+import os
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+from itertools import islice
 from pathlib import Path
+from typing import Any, Optional
+
+import click
+
+from .._version import __version__
+
+# Worker threads used by cleanup to delete expired task directories
+CLEANUP_WORKERS = 8
+
 
-from .. import __version__
-from .checkpoint import checkpoint_cli
-from .task import task_cli
-from .trace import trace_cli
+class LazyGroup(click.Group):
+    """Click group that imports subcommand modules only when they are used.
 
+    Subcommands are registered as "module:attribute" import paths, so running
+    one command doesn't import the others (and their tabulate/loader imports).
+    """
 
-@click.group()
+    def __init__(
+        self,
+        *args: Any,
+        lazy_subcommands: Optional[dict[str, str]] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the group.
+
+        Args:
+            lazy_subcommands: Mapping of command name to "module:attribute" import path
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """List eager and lazy command names without importing anything."""
+        return sorted([*super().list_commands(ctx), *self.lazy_subcommands])
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        """Get a command, importing it first if it is lazy."""
+        if cmd_name in self.lazy_subcommands:
+            return self._load_command(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load_command(self, cmd_name: str) -> click.Command:
+        """Import a lazy subcommand.
+
+        Args:
+            cmd_name: Command name
+
+        Returns:
+            Imported command
+        """
+        module_name, attr_name = self.lazy_subcommands[cmd_name].split(":")
+        command = getattr(importlib.import_module(module_name), attr_name)
+        if not isinstance(command, click.Command):
+            raise ValueError(f"Lazy command {cmd_name} did not resolve to a click.Command: {command!r}")
+        return command
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "task": "multi_agent.cli.task:task_cli",
+        "trace": "multi_agent.cli.trace:trace_cli",
+        "checkpoint": "multi_agent.cli.checkpoint:checkpoint_cli",
+    },
+)
 @click.version_option(version=__version__)
 @click.option("--config-dir", type=click.Path(exists=True), help="Configuration directory")
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose output")
@@ -28,16 +89,65 @@ def main(ctx: click.Context, config_dir: Path, verbose: bool) -> None:
     ctx.obj["verbose"] = verbose
 
 
-# Add command groups
-main.add_command(task_cli, name="task")
-main.add_command(trace_cli, name="trace")
-main.add_command(checkpoint_cli, name="checkpoint")
+def _iter_agent_summaries(agents_dir: Path) -> Iterator[dict[str, str]]:
+    """Yield listing summaries for agent configs, skipping unreadable files.
+
+    Args:
+        agents_dir: Directory containing agent YAML files
+
+    Yields:
+        Dicts with the agent's name, role and model
+    """
+    from ..config.paths import list_config_files
+    from ..config.loader import load_config_file, load_yaml_header
+
+    for agent_file in list_config_files(agents_dir, (".yaml",)):
+        # The listing only needs three fields, so skip full validation and,
+        # when they come first, parsing the rest of the file
+        try:
+            data = load_yaml_header(agent_file)
+            if not {"name", "role", "llm_config"} <= data.keys():
+                data = load_config_file(agent_file)
+            yield {
+                "name": str(data["name"]),
+                "role": str(data["role"]),
+                "model": str(data["llm_config"]["model"]),
+            }
+        except Exception:
+            pass
+
+
+def _iter_workflow_summaries(workflows_dir: Path) -> Iterator[dict[str, Any]]:
+    """Yield listing summaries for workflow files, skipping unloadable files.
+
+    Args:
+        workflows_dir: Directory containing workflow YAML files
+
+    Yields:
+        Dicts with the workflow's name, patterns, node count and validity
+    """
+    from ..config.paths import list_config_files
+    from ..execution import load_workflow_from_file, validate_workflow
+
+    for workflow_file in list_config_files(workflows_dir):
+        try:
+            workflow = load_workflow_from_file(workflow_file)
+            errors = validate_workflow(workflow)
+            yield {
+                "name": workflow.name,
+                "patterns": ", ".join(workflow.patterns) if workflow.patterns else "-",
+                "nodes": workflow.node_count,
+                "valid": len(errors) == 0,
+            }
+        except Exception:
+            pass
 
 
 @main.command()
 @click.argument("name", required=False)
 @click.option("--format", "output_format", type=click.Choice(["table", "json"]), default="table", help="Output format")
-def agents(name: str, output_format: str) -> None:
+@click.option("--limit", "-l", type=int, default=None, help="Maximum number of agents to list")
+def agents(name: str, output_format: str, limit: Optional[int]) -> None:
     """List or show agent configurations.
 
     If NAME is provided, show that agent's configuration.
@@ -45,7 +155,7 @@ def agents(name: str, output_format: str) -> None:
     """
     from ..config.paths import get_default_config_dir
     from ..config.loader import load_agent_config
-    import json
+    from ..utils import json_dumps
     from tabulate import tabulate
 
     config_dir = get_default_config_dir()
@@ -75,21 +185,12 @@ def agents(name: str, output_format: str) -> None:
         except Exception as e:
             click.echo(f"Error loading agent: {e}", err=True)
     else:
-        # List all agents
-        agents = []
-        for agent_file in sorted(agents_dir.glob("*.yaml")):
-            try:
-                config = load_agent_config(agent_file)
-                agents.append({
-                    "name": config.name,
-                    "role": config.role,
-                    "model": config.llm_config.model,
-                })
-            except Exception:
-                pass
+        # List agents, reading no more files than the limit needs
+        limit = None if limit is None else max(limit, 0)
+        agents = list(islice(_iter_agent_summaries(agents_dir), limit))
 
         if output_format == "json":
-            click.echo(json.dumps(agents, indent=2))
+            click.echo(json_dumps(agents, indent=True))
         else:
             if agents:
                 rows = [[a["name"], a["role"], a["model"]] for a in agents]
@@ -101,7 +202,8 @@ def agents(name: str, output_format: str) -> None:
 @main.command()
 @click.argument("name", required=False)
 @click.option("--format", "output_format", type=click.Choice(["table", "json"]), default="table", help="Output format")
-def workflows(name: str, output_format: str) -> None:
+@click.option("--limit", "-l", type=int, default=None, help="Maximum number of workflows to list")
+def workflows(name: str, output_format: str, limit: Optional[int]) -> None:
     """List or show workflow configurations.
 
     If NAME is provided, show that workflow's configuration.
@@ -109,7 +211,7 @@ def workflows(name: str, output_format: str) -> None:
     """
     from ..config.paths import get_default_config_dir
     from ..execution import load_workflow_from_file, validate_workflow
-    import json
+    from ..utils import json_dumps
     from tabulate import tabulate
 
     config_dir = get_default_config_dir()
@@ -136,7 +238,7 @@ def workflows(name: str, output_format: str) -> None:
             if output_format == "json":
                 output = workflow.model_dump(mode="json")
                 output["validation_errors"] = errors
-                click.echo(json.dumps(output, indent=2, default=str))
+                click.echo(json_dumps(output, indent=True, default=str))
             else:
                 click.echo(f"Workflow: {workflow.name}")
                 click.echo(f"Entry Point: {workflow.entry_point}")
@@ -153,23 +255,12 @@ def workflows(name: str, output_format: str) -> None:
         except Exception as e:
             click.echo(f"Error loading workflow: {e}", err=True)
     else:
-        # List all workflows
-        workflows_list = []
-        for workflow_file in sorted((workflows_dir.glob("*.yaml")) + list(workflows_dir.glob("*.yml"))):
-            try:
-                workflow = load_workflow_from_file(workflow_file)
-                errors = validate_workflow(workflow)
-                workflows_list.append({
-                    "name": workflow.name,
-                    "patterns": ", ".join(workflow.patterns) if workflow.patterns else "-",
-                    "nodes": workflow.node_count,
-                    "valid": len(errors) == 0,
-                })
-            except Exception:
-                pass
+        # List workflows, loading no more files than the limit needs
+        limit = None if limit is None else max(limit, 0)
+        workflows_list = list(islice(_iter_workflow_summaries(workflows_dir), limit))
 
         if output_format == "json":
-            click.echo(json.dumps(workflows_list, indent=2))
+            click.echo(json_dumps(workflows_list, indent=True))
         else:
             if workflows_list:
                 rows = [[
@@ -189,7 +280,7 @@ def mcp(output_format: str) -> None:
     """List configured MCP servers and their tools."""
     from ..config.paths import get_default_config_dir
     from ..config.loader import load_mcp_servers_config
-    import json
+    from ..utils import json_dumps
     from tabulate import tabulate
 
     config_dir = get_default_config_dir()
@@ -211,7 +302,7 @@ def mcp(output_format: str) -> None:
                     "command": config.command if config.transport == "stdio" else None,
                     "url": config.url if config.transport == "sse" else None,
                 })
-            click.echo(json.dumps(output, indent=2))
+            click.echo(json_dumps(output, indent=True))
         else:
             rows = []
             for name, config in servers_config.items():
@@ -237,8 +328,9 @@ def cleanup(seconds: int, dry_run: bool) -> None:
 
     Removes tasks older than the specified number of seconds.
     """
-    from ..config.paths import get_default_config_dir
-    from datetime import datetime, timedelta
+    from ..config.paths import get_default_config_dir, get_dir_size, remove_dir
+    from ..utils import json_loads
+    from concurrent.futures import ThreadPoolExecutor
 
     config_dir = get_default_config_dir()
     tasks_dir = config_dir / "tasks"
@@ -250,36 +342,42 @@ def cleanup(seconds: int, dry_run: bool) -> None:
     cutoff = datetime.now() - timedelta(seconds=seconds)
     deleted_count = 0
     total_size = 0
+    expired = []
 
-    for task_dir in tasks_dir.iterdir():
-        if not task_dir.is_dir():
-            continue
+    with os.scandir(tasks_dir) as entries:
+        task_dirs = [Path(entry.path) for entry in entries if entry.is_dir()]
 
+    for task_dir in task_dirs:
         # Check task file for timestamp
         task_file = task_dir / "task.json"
         if not task_file.exists():
             continue
 
         try:
-            import json
-            data = json.loads(task_file.read_text(encoding="utf-8"))
+            data = json_loads(task_file.read_bytes())
             created_at = data.get("created_at")
             if created_at:
                 created_dt = datetime.fromisoformat(created_at)
                 if created_dt < cutoff:
-                    # Calculate size
-                    size = sum(f.stat().st_size for f in task_dir.rglob("*") if f.is_file())
-
                     if dry_run:
+                        size = get_dir_size(task_dir)
                         click.echo(f"Would delete: {task_dir.name} ({size / 1024:.1f} KB)")
                     else:
-                        import shutil
-                        shutil.rmtree(task_dir)
-                        deleted_count += 1
-                        total_size += size
+                        expired.append(task_dir)
         except Exception as e:
             click.echo(f"Error processing {task_dir.name}: {e}", err=True)
 
+    # Each tree is removed independently, so overlap the unlink syscalls
+    if expired:
+        with ThreadPoolExecutor(max_workers=CLEANUP_WORKERS) as executor:
+            futures = [executor.submit(remove_dir, task_dir) for task_dir in expired]
+            for task_dir, future in zip(expired, futures, strict=True):
+                try:
+                    total_size += future.result()
+                    deleted_count += 1
+                except Exception as e:
+                    click.echo(f"Error processing {task_dir.name}: {e}", err=True)
+
     if dry_run:
         click.echo(f"\nDry run complete. Use --no-dry-run to actually delete.")
     else:
@@ -3,19 +3,22 @@
 This module provides command-line interface for listing and inspecting tasks.
 """
 
-import json
+from collections.abc import Iterator
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 import click
-from tabulate import tabulate
 
-from ..config.paths import get_default_config_dir
-from ..utils import get_logger
+from ..config.paths import get_default_config_dir, list_task_dirs
+from ..utils import get_logger, json_dumps, json_loads
 
 logger = get_logger(__name__)
 
+# Display format for task creation times
+CREATED_FORMAT = "%Y-%m-%d %H:%M"
+
 
 def get_tasks_dir() -> Path:
     """Get the tasks directory.
@@ -45,47 +48,27 @@ def list_tasks(
     tasks_dir = get_tasks_dir()
     if not tasks_dir.exists():
         if json_output:
-            click.echo(json.dumps({"tasks": []}))
+            click.echo(json_dumps({"tasks": []}))
         return
 
-    tasks_data = []
-    for task_dir in sorted(tasks_dir.iterdir(), key=lambda p: p.stat().st_mtime, reverse=True):
-        if not task_dir.is_dir():
-            continue
-
-        task_file = task_dir / "task.json"
-        if not task_file.exists():
-            continue
-
-        try:
-            data = json.loads(task_file.read_text(encoding="utf-8"))
-            tasks_data.append(data)
-        except Exception as e:
-            logger.warning(f"Failed to read task {task_dir.name}: {e}")
-
-    # Apply filters
-    if status:
-        tasks_data = [t for t in tasks_data if t.get("status") == status]
-
-    if agent:
-        tasks_data = [t for t in tasks_data if t.get("agent_name") == agent]
-
-    # Limit results
-    tasks_data = tasks_data[:limit]
+    # Tasks are read newest first and only until the limit is reached
+    matching = (
+        data
+        for data in _iter_tasks(tasks_dir)
+        if (not status or data.get("status") == status)
+        and (not agent or data.get("agent_name") == agent)
+    )
+    tasks_data = list(islice(matching, max(limit, 0)))
 
     if json_output:
-        click.echo(json.dumps({"tasks": tasks_data}, indent=2))
+        click.echo(json_dumps({"tasks": tasks_data}, indent=True))
     else:
+        from tabulate import tabulate
+
         # Format as table
         rows = []
         for task in tasks_data:
-            created = task.get("created_at", "")
-            if created:
-                try:
-                    dt = datetime.fromisoformat(created)
-                    created = dt.strftime("%Y-%m-%d %H:%M")
-                except:
-                    pass
+            created = _format_created(str(task.get("created_at") or ""))
 
             rows.append([
                 task.get("task_id", "")[:12],
@@ -102,6 +85,47 @@ def list_tasks(
             click.echo("No tasks found.")
 
 
+def _format_created(created: str) -> str:
+    """Format an ISO-8601 timestamp as "YYYY-MM-DD HH:MM".
+
+    Timestamps written by the framework are sliced directly; anything else
+    goes through datetime.fromisoformat and is returned unchanged if invalid.
+
+    Args:
+        created: ISO-8601 timestamp string
+
+    Returns:
+        Formatted timestamp
+    """
+    if len(created) >= 16 and created[10] in "T " and created[13] == ":":
+        return f"{created[:10]} {created[11:16]}"
+
+    try:
+        return datetime.fromisoformat(created).strftime(CREATED_FORMAT)
+    except ValueError:
+        return created
+
+
+def _iter_tasks(tasks_dir: Path) -> Iterator[dict[str, Any]]:
+    """Yield task data, most recently modified task first.
+
+    Args:
+        tasks_dir: Tasks directory
+
+    Yields:
+        Parsed task.json contents for each task
+    """
+    for task_dir in list_task_dirs(tasks_dir):
+        task_file = task_dir / "task.json"
+        if not task_file.exists():
+            continue
+
+        try:
+            yield json_loads(task_file.read_bytes())
+        except Exception as e:
+            logger.warning(f"Failed to read task {task_dir.name}: {e}")
+
+
 def show_task(task_id: str, json_output: bool = False) -> None:
     """Show detailed information about a task.
 
@@ -122,10 +146,10 @@ def show_task(task_id: str, json_output: bool = False) -> None:
         return
 
     try:
-        data = json.loads(task_file.read_text(encoding="utf-8"))
+        data = json_loads(task_file.read_bytes())
 
         if json_output:
-            click.echo(json.dumps(data, indent=2))
+            click.echo(json_dumps(data, indent=True))
         else:
             click.echo(f"Task: {data.get('task_id')}")
             click.echo(f"Status: {data.get('status')}")
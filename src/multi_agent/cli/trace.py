@@ -3,20 +3,27 @@
 This module provides command-line interface for viewing and searching trace logs.
 """
 
-import json
+import functools
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 import click
-from tabulate import tabulate
 
-from ..config.paths import get_default_config_dir
+from ..config.paths import get_default_config_dir, list_task_dirs
 from ..models import TraceLog
-from ..utils import get_logger
+from ..utils import get_logger, json_loads
 
 logger = get_logger(__name__)
 
+# Display format for trace creation times
+CREATED_FORMAT = "%Y-%m-%d %H:%M"
+
+# Icons shown next to each step in show_trace
+_STATUS_ICONS = {"info": "ℹ️", "warning": "⚠️", "error": "❌"}
+
 
 def get_tasks_dir() -> Path:
     """Get the tasks directory.
@@ -45,8 +52,8 @@ def load_trace(task_id: str) -> Optional[TraceLog]:
         return None
 
     try:
-        data = json.loads(trace_file.read_text(encoding="utf-8"))
-        return TraceLog(**data)
+        data = json_loads(trace_file.read_bytes())
+        return TraceLog.model_validate(data)
     except Exception as e:
         logger.error(f"Failed to load trace: {e}")
         return None
@@ -75,34 +82,40 @@ def show_trace(task_id: str, agent: Optional[str] = None, json_output: bool = Fa
 
     if json_output:
         click.echo(trace.model_dump_json(indent=2))
-    else:
-        click.echo(f"Trace for task: {trace.task_id}")
-        click.echo(f"Total steps: {trace.step_count}")
-        click.echo(f"Total duration: {trace.total_duration_ms}ms")
-        click.echo(f"Created: {trace.created_at.isoformat()}")
-        click.echo(f"Updated: {trace.updated_at.isoformat()}")
-        click.echo("")
+        return
+
+    # Build the whole report and write it once
+    lines: list[str] = [
+        f"Trace for task: {trace.task_id}",
+        f"Total steps: {trace.step_count}",
+        f"Total duration: {trace.total_duration_ms}ms",
+        f"Created: {trace.created_at.isoformat()}",
+        f"Updated: {trace.updated_at.isoformat()}",
+        "",
+    ]
+
+    for step in trace.steps:
+        status_icon = _STATUS_ICONS.get(step.status, "•")
+        lines.append(f"{status_icon} [{step.timestamp.isoformat()}] {step.step_name} ({step.agent})")
+        lines.append(f"  Status: {step.status}")
+        lines.append(f"  Message: {step.message}")
 
-        for step in trace.steps:
-            status_icon = {"info": "ℹ️", "warning": "⚠️", "error": "❌"}.get(step.status, "•")
-            click.echo(f"{status_icon} [{step.timestamp.isoformat()}] {step.step_name} ({step.agent})")
-            click.echo(f"  Status: {step.status}")
-            click.echo(f"  Message: {step.message}")
+        if step.tool_calls:
+            lines.append(f"  Tool calls ({len(step.tool_calls)}):")
+            for tc in step.tool_calls:
+                status = "✓" if not tc.error else "✗"
+                lines.append(f"    {status} {tc.server}:{tc.tool} ({tc.duration_ms}ms)")
+                if tc.error:
+                    lines.append(f"      Error: {tc.error}")
 
-            if step.tool_calls:
-                click.echo(f"  Tool calls ({len(step.tool_calls)}):")
-                for tc in step.tool_calls:
-                    status = "✓" if not tc.error else "✗"
-                    click.echo(f"    {status} {tc.server}:{tc.tool} ({tc.duration_ms}ms)")
-                    if tc.error:
-                        click.echo(f"      Error: {tc.error}")
+        lines.append("")
 
-            click.echo("")
+    if trace.sub_agent_sessions:
+        lines.append("Sub-agent sessions:")
+        for session_id, info in trace.sub_agent_sessions.items():
+            lines.append(f"  {session_id}: {info.agent} ({info.message_count} messages, {info.status})")
 
-        if trace.sub_agent_sessions:
-            click.echo("Sub-agent sessions:")
-            for session_id, info in trace.sub_agent_sessions.items():
-                click.echo(f"  {session_id}: {info.agent} ({info.message_count} messages, {info.status})")
+    click.echo("\n".join(lines))
 
 
 def search_traces(
@@ -126,70 +139,34 @@ def search_traces(
         click.echo("No tasks found.")
         return
 
+    scan = functools.partial(_scan_trace, status=status, agent=agent, tool=tool, has_errors=has_errors)
     results = []
 
-    for task_dir in sorted(tasks_dir.iterdir(), key=lambda p: p.stat().st_mtime, reverse=True):
-        if not task_dir.is_dir():
-            continue
-
-        trace_file = task_dir / "trace.json"
-        if not trace_file.exists():
-            continue
-
-        try:
-            data = json.loads(trace_file.read_text(encoding="utf-8"))
-            trace = TraceLog(**data)
-
-            # Apply filters
-            steps = trace.steps
-
-            if status:
-                steps = [s for s in steps if s.status == status]
-
-            if agent:
-                steps = [s for s in steps if s.agent == agent]
-
-            if tool:
-                server, tool_name = tool.split(":") if ":" in tool else (None, tool)
-                steps = [
-                    s for s in steps
-                    if any(tc.tool == tool_name and (not server or tc.server == server) for tc in s.tool_calls)
-                ]
-
-            if has_errors:
-                steps = [s for s in steps if s.status == "error" or any(tc.error for tc in s.tool_calls)]
+    # Reads and parses overlap across worker threads; map() keeps newest-first order
+    with ThreadPoolExecutor() as executor:
+        for result in executor.map(scan, list_task_dirs(tasks_dir)):
+            if result is None:
+                continue
 
-            if steps:
-                results.append({
-                    "task_id": trace.task_id,
-                    "matching_steps": len(steps),
-                    "total_steps": trace.step_count,
-                    "created": trace.created_at.isoformat(),
-                })
-
-        except Exception as e:
-            logger.warning(f"Failed to search trace {task_dir.name}: {e}")
+            results.append(result)
+            if 0 < limit <= len(results):
+                executor.shutdown(wait=False, cancel_futures=True)
+                break
 
     # Limit results
     results = results[:limit]
 
     # Display results
     if results:
+        from tabulate import tabulate
+
         rows = []
         for r in results:
-            created = r.get("created", "")
-            if created:
-                try:
-                    dt = datetime.fromisoformat(created)
-                    created = dt.strftime("%Y-%m-%d %H:%M")
-                except:
-                    pass
-
             rows.append([
                 r["task_id"][:12],
                 r["matching_steps"],
                 r["total_steps"],
-                created,
+                r["created"].strftime(CREATED_FORMAT),
             ])
 
         headers = ["Task ID", "Matching Steps", "Total Steps", "Created"]
@@ -198,6 +175,132 @@ def search_traces(
         click.echo("No matching traces found.")
 
 
+def _scan_trace(
+    task_dir: Path,
+    status: Optional[str],
+    agent: Optional[str],
+    tool: Optional[str],
+    has_errors: bool,
+) -> Optional[dict[str, Any]]:
+    """Search one task's trace log.
+
+    Args:
+        task_dir: Task directory
+        status: Filter by step status
+        agent: Filter by agent name
+        tool: Filter by tool name (server:tool format)
+        has_errors: Only match traces with errors
+
+    Returns:
+        Search result for the trace, or None if it has no matching steps
+    """
+    trace_file = task_dir / "trace.json"
+    if not trace_file.exists():
+        return None
+
+    try:
+        data = json_loads(trace_file.read_bytes())
+        raw_steps = data.get("steps") or []
+
+        # Without filters every step matches, so answer from the raw data
+        if not (status or agent or tool or has_errors):
+            if not raw_steps:
+                return None
+            return {
+                "task_id": data["task_id"],
+                "matching_steps": len(raw_steps),
+                "total_steps": len(raw_steps),
+                "created": datetime.fromisoformat(data["created_at"]),
+            }
+
+        # Skip validating traces that can't match any filter
+        if not _may_match(raw_steps, status, agent, tool, has_errors):
+            return None
+
+        trace = TraceLog.model_validate(data)
+
+        # Apply filters
+        steps = trace.steps
+
+        if status:
+            steps = [s for s in steps if s.status == status]
+
+        if agent:
+            steps = [s for s in steps if s.agent == agent]
+
+        if tool:
+            server, tool_name = tool.split(":") if ":" in tool else (None, tool)
+            steps = [
+                s for s in steps
+                if any(tc.tool == tool_name and (not server or tc.server == server) for tc in s.tool_calls)
+            ]
+
+        if has_errors:
+            steps = [s for s in steps if s.status == "error" or any(tc.error for tc in s.tool_calls)]
+
+        if steps:
+            return {
+                "task_id": trace.task_id,
+                "matching_steps": len(steps),
+                "total_steps": trace.step_count,
+                "created": trace.created_at,
+            }
+
+    except Exception as e:
+        logger.warning(f"Failed to search trace {task_dir.name}: {e}")
+
+    return None
+
+
+def _may_match(
+    raw_steps: list[dict[str, Any]],
+    status: Optional[str],
+    agent: Optional[str],
+    tool: Optional[str],
+    has_errors: bool,
+) -> bool:
+    """Check raw trace steps for possible matches before validation.
+
+    Each filter is checked independently, so a True result only means the
+    trace might match; a False result means it can't.
+
+    Args:
+        raw_steps: Unvalidated step dicts from trace.json
+        status: Filter by step status
+        agent: Filter by agent name
+        tool: Filter by tool name (server:tool format)
+        has_errors: Only match traces with errors
+
+    Returns:
+        False if no step can satisfy the filters
+    """
+    if not raw_steps:
+        return False
+
+    if status and not any(s.get("status") == status for s in raw_steps):
+        return False
+
+    if agent and not any(s.get("agent") == agent for s in raw_steps):
+        return False
+
+    if tool:
+        server, tool_name = tool.split(":") if ":" in tool else (None, tool)
+        if not any(
+            tc.get("tool") == tool_name and (not server or tc.get("server") == server)
+            for s in raw_steps
+            for tc in s.get("tool_calls") or []
+        ):
+            return False
+
+    if has_errors and not any(
+        s.get("status") == "error" or any(tc.get("error") for tc in s.get("tool_calls") or [])
+        for s in raw_steps
+    ):
+        return False
+
+    return True
+
+
 def show_errors(task_id: str) -> None:
     """Show errors from a trace log.
 
@@ -244,54 +347,50 @@ def show_tool_summary(task_id: str) -> None:
         click.echo(f"Trace not found for task: {task_id}", err=True)
         return
 
-    # Collect tool call stats
-    total_calls = 0
-    failed_calls = 0
-    total_duration = 0
-    by_tool: dict[str, dict[str, int]] = {}
+    # Collect tool call stats: (server, tool) -> [count, errors, duration_ms]
+    by_tool: defaultdict[tuple[str, str], list[int]] = defaultdict(lambda: [0, 0, 0])
 
     for step in trace.steps:
         for tc in step.tool_calls:
-            total_calls += 1
-            total_duration += tc.duration_ms
-
+            stats = by_tool[(tc.server, tc.tool)]
+            stats[0] += 1
+            stats[2] += tc.duration_ms
             if tc.error:
-                failed_calls += 1
+                stats[1] += 1
 
-            key = f"{tc.server}:{tc.tool}"
-            if key not in by_tool:
-                by_tool[key] = {"count": 0, "errors": 0, "duration_ms": 0}
+    total_calls = sum(stats[0] for stats in by_tool.values())
+    failed_calls = sum(stats[1] for stats in by_tool.values())
+    total_duration = sum(stats[2] for stats in by_tool.values())
 
-            by_tool[key]["count"] += 1
-            by_tool[key]["duration_ms"] += tc.duration_ms
-            if tc.error:
-                by_tool[key]["errors"] += 1
-
-    click.echo(f"Tool call summary for task: {task_id}")
-    click.echo("")
+    lines: list[str] = [f"Tool call summary for task: {task_id}", ""]
 
     if total_calls == 0:
-        click.echo("No tool calls recorded.")
+        lines.append("No tool calls recorded.")
+        click.echo("\n".join(lines))
         return
 
-    click.echo(f"Total calls: {total_calls}")
-    click.echo(f"Failed calls: {failed_calls}")
-    click.echo(f"Success rate: {(total_calls - failed_calls) / total_calls * 100:.1f}%")
-    click.echo(f"Total duration: {total_duration}ms")
-    click.echo("")
+    lines.append(f"Total calls: {total_calls}")
+    lines.append(f"Failed calls: {failed_calls}")
+    lines.append(f"Success rate: {(total_calls - failed_calls) / total_calls * 100:.1f}%")
+    lines.append(f"Total duration: {total_duration}ms")
+    lines.append("")
 
     if by_tool:
+        from tabulate import tabulate
+
         rows = []
-        for tool, stats in sorted(by_tool.items()):
+        for (server, tool), (count, errors, duration_ms) in sorted(by_tool.items()):
             rows.append([
-                tool,
-                stats["count"],
-                stats["errors"],
-                f"{stats['duration_ms']}ms",
+                f"{server}:{tool}",
+                count,
+                errors,
+                f"{duration_ms}ms",
             ])
 
         headers = ["Tool", "Calls", "Errors", "Total Duration"]
-        click.echo(tabulate(rows, headers=headers, tablefmt="grid"))
+        lines.append(tabulate(rows, headers=headers, tablefmt="grid"))
+
+    click.echo("\n".join(lines))
 
 
 @click.group()
@@ -1,20 +1,29 @@
 """Configuration management for multi-agent framework."""
 
 from .loader import (
+    clear_config_cache,
+    find_all_config_headers,
     load_agent_config,
+    load_all_agent_configs,
+    load_all_workflow_configs,
     load_config_file,
     load_mcp_servers_config,
     load_retention_policy,
     load_tool_overrides,
     load_workflow_config,
+    load_yaml_header,
 )
 from .paths import (
     get_agents_dir,
     get_config_subdir,
     get_default_config_dir,
+    get_dir_size,
     get_task_dir,
     get_tasks_dir,
     get_workflows_dir,
+    list_config_files,
+    list_task_dirs,
+    remove_dir,
     resolve_config_path,
 )
 from .schemas import (
@@ -31,10 +40,15 @@ __all__ = [
     # Loader
     "load_agent_config",
     "load_workflow_config",
+    "load_all_agent_configs",
+    "load_all_workflow_configs",
     "load_mcp_servers_config",
     "load_retention_policy",
     "load_tool_overrides",
     "load_config_file",
+    "load_yaml_header",
+    "find_all_config_headers",
+    "clear_config_cache",
     # Paths
     "get_default_config_dir",
     "get_agents_dir",
@@ -42,6 +56,10 @@ __all__ = [
     "get_config_subdir",
     "get_tasks_dir",
     "get_task_dir",
+    "list_config_files",
+    "list_task_dirs",
+    "get_dir_size",
+    "remove_dir",
     "resolve_config_path",
     # Schemas
     "AgentConfig",
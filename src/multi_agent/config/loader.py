@@ -4,14 +4,23 @@ This module provides functionality for loading YAML and JSON configurations
 with environment variable expansion support.
 """
 
+import copy
+import functools
 import os
 import re
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, TypeVar
 
 import yaml
 from pydantic import ValidationError
 
+from ..utils import json_loads
+from .paths import get_default_config_dir, list_config_files
 from .schemas import (
     AgentConfig,
     MCPServerConfig,
@@ -19,74 +28,219 @@ from .schemas import (
     WorkflowConfig,
     validate_agent_config,
     validate_mcp_server_config,
+    validate_retention_policy,
     validate_workflow_config,
 )
 
+try:
+    # libyaml-backed parser, several times faster than the pure-Python one
+    from yaml import CSafeLoader as YAMLLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as YAMLLoader
+
+
+# Parsed config files, least recently used first: (path, config type) -> (mtime_ns, size, data)
+_config_data_cache: OrderedDict[tuple[str, str], tuple[int, int, Any]] = OrderedDict()
+
+# Validated config objects, least recently used first:
+# (path, schema) -> (mtime_ns, size, referenced env var values, config object)
+_validated_config_cache: OrderedDict[tuple[str, str], tuple[int, int, tuple[tuple[str, str | None], ...], Any]] = (
+    OrderedDict()
+)
+
+# Config directory listings: directory -> (mtime_ns, config name -> path)
+_config_dir_cache: dict[str, tuple[int, Mapping[str, Path]]] = {}
+
+# Maximum number of parsed (and, separately, validated) config files kept in memory
+CONFIG_CACHE_MAX_ENTRIES = 100
+
+# Guards both caches so configs can be loaded from several threads
+_cache_lock = threading.Lock()
+
+# Worker threads used by load_all_agent_configs / load_all_workflow_configs
+CONFIG_LOAD_WORKERS = 8
+
+T = TypeVar("T")
+
+# Config type -> subdirectory of the config dir, for find_all_configs
+_TYPE_SUBDIRS = MappingProxyType({
+    "agents": "agents",
+    "workflows": "workflows",
+    "mcp_servers": "config",
+})
+
+# Bytes read by load_yaml_header before cutting the file short
+HEADER_MAX_BYTES = 4096
+
+# Start of a top-level mapping key (not indented, a comment, a list item,
+# a flow collection or a document marker)
+_TOP_LEVEL_LINE = re.compile(rb"^[^\s#\-.\[{]", re.MULTILINE)
 
 # Pattern for environment variable substitution: ${VAR_NAME} or ${VAR_NAME:-default}
 ENV_VAR_PATTERN = re.compile(r"\$\{([^}:]+)(?::-([^}]*))?\}")
 
 
+def _replace_env_var(env: dict[str, str | None], match: re.Match[str]) -> str:
+    """Substitute one ${VAR} or ${VAR:-default} reference.
+
+    Args:
+        env: Variables already looked up in this expansion pass (None if unset)
+        match: ENV_VAR_PATTERN match
+
+    Returns:
+        The variable's value, or the default if it isn't set
+    """
+    name = match.group(1)
+    if name in env:
+        value = env[name]
+    else:
+        value = env[name] = os.environ.get(name)
+    if value is None:
+        default = match.group(2)
+        return default if default is not None else ""
+    return value
+
+
 def _expand_env_vars(value: Any) -> Any:
-    """Recursively expand environment variables in a value.
+    """Expand environment variables in a value, mutating containers in place.
 
-    Supports ${VAR} and ${VAR:-default} syntax.
+    Supports ${VAR} and ${VAR:-default} syntax. Only use this on data the
+    caller owns; see _expand_env_vars_copy for shared data.
 
     Args:
         value: The value to expand (can be str, dict, list)
 
     Returns:
-        The value with environment variables expanded
+        The expanded value (the same object for dicts and lists)
     """
+    # Each variable is looked up in os.environ once per pass
+    replace = functools.partial(_replace_env_var, {})
+
     if isinstance(value, str):
-        def replace_env_var(match: re.Match[str]) -> str:
-            var_name = match.group(1)
-            default = match.group(2) if match.group(2) is not None else ""
-            return os.environ.get(var_name, default)
+        return ENV_VAR_PATTERN.sub(replace, value) if "${" in value else value
+
+    stack = [value] if isinstance(value, (dict, list)) else []
+    while stack:
+        node = stack.pop()
+        for key, item in node.items() if isinstance(node, dict) else enumerate(node):
+            if isinstance(item, str):
+                # Most strings have no references; skip the regex for those
+                if "${" in item:
+                    node[key] = ENV_VAR_PATTERN.sub(replace, item)
+            elif isinstance(item, (dict, list)):
+                stack.append(item)
+
+    return value
+
+
+def _expand_env_vars_copy(value: Any, replace: Callable[[re.Match[str]], str] | None = None) -> Any:
+    """Return a copy of a value with environment variables expanded.
+
+    Copying and expanding in a single pass is cheaper than a deepcopy followed
+    by _expand_env_vars, so this is used for cached data that must not change.
+
+    Args:
+        value: The value to expand (can be str, dict, list)
+        replace: Substitution callback shared across the pass (internal)
+
+    Returns:
+        New containers with environment variables expanded
+    """
+    if replace is None:
+        # Each variable is looked up in os.environ once per pass
+        replace = functools.partial(_replace_env_var, {})
 
-        return ENV_VAR_PATTERN.sub(replace_env_var, value)
+    if isinstance(value, str):
+        if "${" not in value:
+            return value
+        return ENV_VAR_PATTERN.sub(replace, value)
 
     elif isinstance(value, dict):
-        return {k: _expand_env_vars(v) for k, v in value.items()}
+        expand = _expand_env_vars_copy
+        return {k: expand(v, replace) for k, v in value.items()}
 
     elif isinstance(value, list):
-        return [_expand_env_vars(item) for item in value]
+        expand = _expand_env_vars_copy
+        return [expand(item, replace) for item in value]
 
     return value
 
 
-def get_default_config_dir() -> Path:
-    """Get the default configuration directory path.
+def _as_path(file_path: str | Path) -> Path:
+    """Return file_path as a Path, without re-wrapping one that already is."""
+    return file_path if isinstance(file_path, Path) else Path(file_path)
 
-    Returns ~/.multi-agent/ directory, creating it if it doesn't exist.
+
+def load_yaml_file(file_path: str | Path) -> dict[str, Any]:
+    """Load a YAML file and return its contents as a dictionary.
+
+    Args:
+        file_path: Path to the YAML file
 
     Returns:
-        Path to the default configuration directory
+        Dictionary containing the YAML contents
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        yaml.YAMLError: If the file is not valid YAML
     """
-    config_dir = Path.home() / ".multi-agent"
-    config_dir.mkdir(parents=True, exist_ok=True)
-    return config_dir
+    try:
+        f = open(file_path, "r", encoding="utf-8")
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Configuration file not found: {file_path}") from None
 
+    with f:
+        return yaml.load(f, Loader=YAMLLoader) or {}
 
-def load_yaml_file(file_path: str | Path) -> dict[str, Any]:
-    """Load a YAML file and return its contents as a dictionary.
+
+def load_yaml_header(
+    file_path: str | Path,
+    max_bytes: int = HEADER_MAX_BYTES,
+    expand_env: bool = True,
+) -> dict[str, Any]:
+    """Load only the leading top-level keys of a YAML file.
+
+    Reads at most max_bytes and drops everything from the last top-level key
+    in that chunk onwards, so every key returned is complete. Keys past the
+    cut-off are missing; callers that need them should fall back to
+    load_config_file. Files that fit in max_bytes are parsed whole.
 
     Args:
         file_path: Path to the YAML file
+        max_bytes: Maximum number of bytes to read
+        expand_env: Whether to expand environment variables
 
     Returns:
-        Dictionary containing the YAML contents
+        Dictionary containing the leading keys
 
     Raises:
         FileNotFoundError: If the file doesn't exist
         yaml.YAMLError: If the file is not valid YAML
     """
-    path = Path(file_path)
-    if not path.exists():
-        raise FileNotFoundError(f"Configuration file not found: {file_path}")
+    path = _as_path(file_path)
+    try:
+        with open(path, "rb") as f:
+            chunk = f.read(max_bytes + 1)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Configuration file not found: {file_path}") from None
 
-    with open(path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+    data = None
+    cut = len(chunk)
+    if cut > max_bytes:
+        starts = [match.start() for match in _TOP_LEVEL_LINE.finditer(chunk, 0, max_bytes)]
+        cut = starts[-1] if starts else 0
+
+    if cut:
+        try:
+            data = yaml.load(chunk[:cut], Loader=YAMLLoader)
+        except yaml.YAMLError:
+            pass
+
+    # Layouts the cut can't handle (flow style, one huge first key, ...) get a full parse
+    if not isinstance(data, dict):
+        return load_config_file(path, "yaml", expand_env)
+
+    return _expand_env_vars(data) if expand_env else data
 
 
 def load_config_file(
@@ -108,8 +262,32 @@ def load_config_file(
         FileNotFoundError: If the file doesn't exist
         ValueError: If the file type is unsupported or invalid
     """
-    path = Path(file_path)
+    path = _as_path(file_path)
+    config = _read_config_data(path, _resolve_config_type(path, config_type))
+
+    # Expand environment variables into new containers, so the cached data is
+    # never handed out directly
+    if expand_env:
+        config = _expand_env_vars_copy(config)
+    else:
+        config = copy.deepcopy(config)
 
+    return config
+
+
+def _resolve_config_type(path: Path, config_type: str) -> str:
+    """Resolve the parser to use for a configuration file.
+
+    Args:
+        path: Path to the configuration file
+        config_type: Type of config ("yaml", "json", or "auto" to detect from extension)
+
+    Returns:
+        "yaml" or "json"
+
+    Raises:
+        ValueError: If the file type is unsupported or can't be detected
+    """
     # Auto-detect file type
     if config_type == "auto":
         suffix = path.suffix.lower()
@@ -120,24 +298,155 @@ def load_config_file(
         else:
             raise ValueError(f"Cannot detect config type from extension: {suffix}")
 
-    # Load based on type
-    if config_type == "yaml":
-        config = load_yaml_file(path)
-    elif config_type == "json":
-        import json
+    if config_type not in ("yaml", "json"):
+        raise ValueError(f"Unsupported config type: {config_type}")
+
+    return config_type
+
+
+def _read_config_data(path: Path, config_type: str) -> Any:
+    """Read and parse a configuration file, reusing the last parse if unchanged.
+
+    Parsed data is cached per file and reused while the file's mtime and size
+    are unchanged; the least recently used entries are evicted once the cache
+    holds CONFIG_CACHE_MAX_ENTRIES files. Environment variables are expanded
+    by the caller, so cached data stays valid when the environment changes.
+
+    Args:
+        path: Path to the configuration file
+        config_type: Type of config ("yaml" or "json")
+
+    Returns:
+        Parsed configuration data (shared; callers must not mutate it)
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+    """
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Configuration file not found: {path}") from None
 
-        with open(path, "r", encoding="utf-8") as f:
-            config = json.load(f)
+    key = (str(path.absolute()), config_type)
+    cached = _cache_lookup(_config_data_cache, key)
+    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2]
+
+    if config_type == "yaml":
+        data = load_yaml_file(path)
     else:
-        raise ValueError(f"Unsupported config type: {config_type}")
+        data = json_loads(path.read_bytes())
 
-    # Expand environment variables
-    if expand_env:
-        config = _expand_env_vars(config)
+    _cache_store(_config_data_cache, key, (stat.st_mtime_ns, stat.st_size, data))
+    return data
+
+
+def _cache_lookup(cache: OrderedDict[Any, tuple], key: Any) -> tuple | None:
+    """Get a config cache entry and mark it most recently used.
+
+    Args:
+        cache: _config_data_cache or _validated_config_cache
+        key: Cache key
+
+    Returns:
+        The entry, or None if the key isn't cached
+    """
+    with _cache_lock:
+        entry = cache.get(key)
+        if entry is not None:
+            cache.move_to_end(key)
+        return entry
+
+
+def _cache_store(cache: OrderedDict[Any, tuple], key: Any, entry: tuple) -> None:
+    """Store a config cache entry, evicting the least recently used beyond the limit.
+
+    Args:
+        cache: _config_data_cache or _validated_config_cache
+        key: Cache key
+        entry: Entry to store
+    """
+    with _cache_lock:
+        cache[key] = entry
+        cache.move_to_end(key)
+        while len(cache) > CONFIG_CACHE_MAX_ENTRIES:
+            cache.popitem(last=False)
+
+
+def _env_var_names(value: Any) -> set[str]:
+    """Collect the environment variables referenced in raw config data.
+
+    Args:
+        value: Unexpanded configuration data
+
+    Returns:
+        Names of all ${VAR} references
+    """
+    names: set[str] = set()
+    stack = [value]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, str):
+            if "${" in node:
+                names.update(match.group(1) for match in ENV_VAR_PATTERN.finditer(node))
+        elif isinstance(node, dict):
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+    return names
+
+
+def _load_validated_config(file_path: str | Path, schema: str, validate: Callable[[dict[str, Any]], T]) -> T:
+    """Load and validate a configuration file, reusing the last result if unchanged.
+
+    The validated object is reused while the file's mtime and size and the
+    values of the environment variables it references are unchanged. Cached
+    objects are shared between callers and must be treated as read-only.
 
+    Args:
+        file_path: Path to the configuration file
+        schema: Cache namespace for the validator ("agent", "workflow", ...)
+        validate: Builds the config object from expanded data
+
+    Returns:
+        Validated configuration object
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        ValidationError: If the configuration is invalid
+    """
+    path = _as_path(file_path)
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Configuration file not found: {file_path}") from None
+
+    key = (str(path.absolute()), schema)
+    cached = _cache_lookup(_validated_config_cache, key)
+    if (
+        cached is not None
+        and cached[0] == stat.st_mtime_ns
+        and cached[1] == stat.st_size
+        and all(os.environ.get(name) == env_value for name, env_value in cached[2])
+    ):
+        return cached[3]
+
+    data = _read_config_data(path, _resolve_config_type(path, "auto"))
+    env = tuple((name, os.environ.get(name)) for name in sorted(_env_var_names(data)))
+    config = validate(_expand_env_vars_copy(data))
+
+    _cache_store(_validated_config_cache, key, (stat.st_mtime_ns, stat.st_size, env, config))
     return config
 
 
+def clear_config_cache() -> None:
+    """Clear cached configuration file contents, validated configs and directory listings."""
+    with _cache_lock:
+        _config_data_cache.clear()
+        _validated_config_cache.clear()
+        _config_dir_cache.clear()
+
+
 def load_agent_config(file_path: str | Path) -> AgentConfig:
     """Load and validate an agent configuration file.
 
@@ -151,8 +460,7 @@ def load_agent_config(file_path: str | Path) -> AgentConfig:
         FileNotFoundError: If the file doesn't exist
         ValidationError: If the configuration is invalid
     """
-    config_data = load_config_file(file_path)
-    return validate_agent_config(config_data)
+    return _load_validated_config(file_path, "agent", validate_agent_config)
 
 
 def load_workflow_config(file_path: str | Path) -> WorkflowConfig:
@@ -168,8 +476,7 @@ def load_workflow_config(file_path: str | Path) -> WorkflowConfig:
         FileNotFoundError: If the file doesn't exist
         ValidationError: If the configuration is invalid
     """
-    config_data = load_config_file(file_path)
-    return validate_workflow_config(config_data)
+    return _load_validated_config(file_path, "workflow", validate_workflow_config)
 
 
 def load_mcp_servers_config(file_path: str | Path | None = None) -> dict[str, MCPServerConfig]:
@@ -188,8 +495,19 @@ def load_mcp_servers_config(file_path: str | Path | None = None) -> dict[str, MC
     if file_path is None:
         file_path = get_default_config_dir() / "config" / "mcp_servers.yaml"
 
-    config_data = load_config_file(file_path)
+    # Copy the mapping so callers can't change the cached one
+    return dict(_load_validated_config(file_path, "mcp_servers", _validate_mcp_servers_data))
+
+
+def _validate_mcp_servers_data(config_data: dict[str, Any]) -> dict[str, MCPServerConfig]:
+    """Validate MCP server config data, unwrapping the mcp_servers key if present.
 
+    Args:
+        config_data: Expanded configuration data
+
+    Returns:
+        Dictionary mapping server names to MCPServerConfig objects
+    """
     # Handle the mcp_servers wrapper structure from the contract
     if "mcp_servers" in config_data:
         servers_data = config_data["mcp_servers"]
@@ -216,13 +534,11 @@ def load_retention_policy(file_path: str | Path | None = None) -> RetentionPolic
         file_path = get_default_config_dir() / "config" / "retention_policy.yaml"
 
     try:
-        config_data = load_config_file(file_path)
+        return _load_validated_config(file_path, "retention", validate_retention_policy)
     except FileNotFoundError:
         # Return default policy if file doesn't exist
         return RetentionPolicyConfig()
 
-    return RetentionPolicyConfig(**config_data)
-
 
 def load_tool_overrides(file_path: str | Path | None = None) -> dict[str, Any]:
     """Load tool override configuration (timeouts, fallbacks, retry rules).
@@ -244,44 +560,116 @@ def load_tool_overrides(file_path: str | Path | None = None) -> dict[str, Any]:
     except FileNotFoundError:
         return {}
 
-    # Expand environment variables in override configs
+    # Expand environment variables in override configs (the data is our own copy)
     return _expand_env_vars(config_data)
 
 
 def find_all_configs(
     config_dir: Path | None = None,
     config_type: str = "agents",
-) -> dict[str, Path]:
+) -> Mapping[str, Path]:
     """Find all configuration files of a specific type in the config directory.
 
+    Results are cached per directory and rescanned only when the directory's
+    mtime changes, i.e. when files are added, removed or renamed.
+
     Args:
         config_dir: Configuration directory (default: ~/.multi-agent/)
         config_type: Type of configs to find ("agents", "workflows", "mcp_servers")
 
     Returns:
-        Dictionary mapping config names to their file paths
+        Read-only mapping of config names to their file paths
     """
     if config_dir is None:
         config_dir = get_default_config_dir()
 
-    type_subdirs = {
-        "agents": "agents",
-        "workflows": "workflows",
-        "mcp_servers": "config",
+    subdir_name = _TYPE_SUBDIRS.get(config_type)
+    if subdir_name is None:
+        raise ValueError(f"Unknown config type: {config_type}")
+
+    subdir = config_dir / subdir_name
+    try:
+        mtime_ns = subdir.stat().st_mtime_ns
+    except FileNotFoundError:
+        return MappingProxyType({})
+
+    key = str(subdir)
+    cached = _config_dir_cache.get(key)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    # One directory scan; sorted order puts name.yml after name.yaml, so .yml wins as before
+    configs = MappingProxyType({file_path.stem: file_path for file_path in list_config_files(subdir)})
+    _config_dir_cache[key] = (mtime_ns, configs)
+    return configs
+
+
+def find_all_config_headers(
+    config_dir: Path | None = None,
+    config_type: str = "agents",
+    max_bytes: int = HEADER_MAX_BYTES,
+) -> dict[str, tuple[Path, dict[str, Any]]]:
+    """Find configuration files and parse only their leading keys.
+
+    Meant for listings that show a few fields (name, role, ...) without
+    parsing whole files; see load_yaml_header for what is returned.
+
+    Args:
+        config_dir: Configuration directory (default: ~/.multi-agent/)
+        config_type: Type of configs to find ("agents", "workflows", "mcp_servers")
+        max_bytes: Maximum number of bytes to read per file
+
+    Returns:
+        Dictionary mapping config names to their file paths and header data
+    """
+    return {
+        name: (file_path, load_yaml_header(file_path, max_bytes))
+        for name, file_path in find_all_configs(config_dir, config_type).items()
     }
 
-    if config_type not in type_subdirs:
-        raise ValueError(f"Unknown config type: {config_type}")
 
-    subdir = config_dir / type_subdirs[config_type]
-    if not subdir.exists():
-        return {}
+def load_all_agent_configs(config_dir: Path | None = None) -> dict[str, AgentConfig]:
+    """Load and validate every agent configuration, parsing files in parallel.
 
-    configs: dict[str, Path] = {}
-    for file_path in subdir.glob("*.yaml"):
-        configs[file_path.stem] = file_path
+    Args:
+        config_dir: Configuration directory (default: ~/.multi-agent/)
 
-    for file_path in subdir.glob("*.yml"):
-        configs[file_path.stem] = file_path
+    Returns:
+        Dictionary mapping agent config names to validated AgentConfig objects
 
-    return configs
+    Raises:
+        ValidationError: If any configuration is invalid
+    """
+    return _load_all_configs(find_all_configs(config_dir, "agents"), load_agent_config)
+
+
+def load_all_workflow_configs(config_dir: Path | None = None) -> dict[str, WorkflowConfig]:
+    """Load and validate every workflow configuration, parsing files in parallel.
+
+    Args:
+        config_dir: Configuration directory (default: ~/.multi-agent/)
+
+    Returns:
+        Dictionary mapping workflow config names to validated WorkflowConfig objects
+
+    Raises:
+        ValidationError: If any configuration is invalid
+    """
+    return _load_all_configs(find_all_configs(config_dir, "workflows"), load_workflow_config)
+
+
+def _load_all_configs(paths: Mapping[str, Path], load: Callable[[Path], T]) -> dict[str, T]:
+    """Load a set of configuration files on a thread pool.
+
+    Args:
+        paths: Mapping of config names to file paths
+        load: Loader for a single file
+
+    Returns:
+        Dictionary mapping config names to loaded configs
+    """
+    if len(paths) <= 1:
+        return {name: load(path) for name, path in paths.items()}
+
+    with ThreadPoolExecutor(max_workers=min(CONFIG_LOAD_WORKERS, len(paths))) as executor:
+        return dict(zip(paths, executor.map(load, paths.values()), strict=True))
@@ -3,21 +3,56 @@
 This module provides utilities for detecting and managing configuration paths.
 """
 
+import functools
 import os
+import stat
 from pathlib import Path
+from types import MappingProxyType
 
+# Config type -> subdirectory of the config dir, for resolve_config_path
+_TYPE_DIRS = MappingProxyType({
+    "agents": "agents",
+    "workflows": "workflows",
+    "mcp_servers": "config",
+    "config": "config",
+})
 
+# Directories this process has already created, so repeat lookups skip mkdir
+_ensured_dirs: set[Path] = set()
+
+
+def _ensure_dir(path: Path) -> Path:
+    """Create a directory (and its parents) once per process.
+
+    Args:
+        path: Directory to create
+
+    Returns:
+        The same path
+    """
+    if path not in _ensured_dirs:
+        path.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(path)
+    return path
+
+
+@functools.lru_cache(maxsize=1)
+def _home_dir() -> Path:
+    """Get the user's home directory, resolved once per process."""
+    return Path.home()
+
+
+@functools.lru_cache(maxsize=1)
 def get_default_config_dir() -> Path:
     """Get the default configuration directory path.
 
     Returns ~/.multi-agent/ directory, creating it if it doesn't exist.
+    The directory is resolved once per process.
 
     Returns:
         Path to the default configuration directory
     """
-    config_dir = Path.home() / ".multi-agent"
-    config_dir.mkdir(parents=True, exist_ok=True)
-    return config_dir
+    return _ensure_dir(_home_dir() / ".multi-agent")
 
 
 def get_agents_dir(config_dir: Path | None = None) -> Path:
@@ -32,8 +67,7 @@ def get_agents_dir(config_dir: Path | None = None) -> Path:
     if config_dir is None:
         config_dir = get_default_config_dir()
     agents_dir = config_dir / "agents"
-    agents_dir.mkdir(parents=True, exist_ok=True)
-    return agents_dir
+    return _ensure_dir(agents_dir)
 
 
 def get_workflows_dir(config_dir: Path | None = None) -> Path:
@@ -48,8 +82,7 @@ def get_workflows_dir(config_dir: Path | None = None) -> Path:
     if config_dir is None:
         config_dir = get_default_config_dir()
     workflows_dir = config_dir / "workflows"
-    workflows_dir.mkdir(parents=True, exist_ok=True)
-    return workflows_dir
+    return _ensure_dir(workflows_dir)
 
 
 def get_config_subdir(config_dir: Path | None = None) -> Path:
@@ -64,8 +97,7 @@ def get_config_subdir(config_dir: Path | None = None) -> Path:
     if config_dir is None:
         config_dir = get_default_config_dir()
     subdir = config_dir / "config"
-    subdir.mkdir(parents=True, exist_ok=True)
-    return subdir
+    return _ensure_dir(subdir)
 
 
 def get_tasks_dir(config_dir: Path | None = None) -> Path:
@@ -80,8 +112,7 @@ def get_tasks_dir(config_dir: Path | None = None) -> Path:
     if config_dir is None:
         config_dir = get_default_config_dir()
     tasks_dir = config_dir / "tasks"
-    tasks_dir.mkdir(parents=True, exist_ok=True)
-    return tasks_dir
+    return _ensure_dir(tasks_dir)
 
 
 def get_task_dir(task_id: str, config_dir: Path | None = None) -> Path:
@@ -96,10 +127,95 @@ def get_task_dir(task_id: str, config_dir: Path | None = None) -> Path:
     """
     tasks_dir = get_tasks_dir(config_dir)
     task_dir = tasks_dir / task_id
+    # Not memoized: task directories are deleted by cleanup while processes run
     task_dir.mkdir(parents=True, exist_ok=True)
     return task_dir
 
 
+def list_task_dirs(tasks_dir: Path) -> list[Path]:
+    """List task directories, most recently modified first.
+
+    Uses os.scandir so directory checks come from the directory listing
+    and each entry is stat'ed at most once.
+
+    Args:
+        tasks_dir: Tasks storage directory
+
+    Returns:
+        Task directory paths sorted by modification time, newest first
+    """
+    with os.scandir(tasks_dir) as entries:
+        dirs = [(entry.stat().st_mtime, entry.path) for entry in entries if entry.is_dir()]
+    dirs.sort(key=lambda item: item[0], reverse=True)
+    return [Path(path) for _, path in dirs]
+
+
+def list_config_files(directory: Path, suffixes: tuple[str, ...] = (".yaml", ".yml")) -> list[Path]:
+    """List configuration files in a directory with a single scan.
+
+    Args:
+        directory: Directory to scan
+        suffixes: File name suffixes to include
+
+    Returns:
+        Sorted paths of matching files
+    """
+    with os.scandir(directory) as entries:
+        return sorted(Path(entry.path) for entry in entries if entry.name.endswith(suffixes) and entry.is_file())
+
+
+def get_dir_size(path: Path) -> int:
+    """Get the total size of the files under a directory.
+
+    Args:
+        path: Directory to measure
+
+    Returns:
+        Total size in bytes
+    """
+    total = 0
+    pending: list[str | os.PathLike[str]] = [path]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.is_file():
+                    total += entry.stat().st_size
+    return total
+
+
+def remove_dir(path: Path) -> int:
+    """Delete a directory tree, bottom-up, and report how much it held.
+
+    Args:
+        path: Directory to delete
+
+    Returns:
+        Total size in bytes of the regular files removed
+
+    Raises:
+        OSError: If any part of the tree can't be removed
+    """
+    total = 0
+    for root, dirs, files in os.walk(path, topdown=False):
+        for name in files:
+            file_path = os.path.join(root, name)
+            st = os.lstat(file_path)
+            if stat.S_ISREG(st.st_mode):
+                total += st.st_size
+            os.unlink(file_path)
+        for name in dirs:
+            dir_path = os.path.join(root, name)
+            # os.walk lists symlinks to directories as dirs without descending
+            if os.path.islink(dir_path):
+                os.unlink(dir_path)
+            else:
+                os.rmdir(dir_path)
+    os.rmdir(path)
+    return total
+
+
 def resolve_config_path(
     config_name: str,
     config_type: str = "agents",
@@ -122,17 +238,11 @@ def resolve_config_path(
         config_dir = get_default_config_dir()
 
     # Determine the subdirectory based on type
-    type_dirs = {
-        "agents": "agents",
-        "workflows": "workflows",
-        "mcp_servers": "config",
-        "config": "config",
-    }
-
-    if config_type not in type_dirs:
+    subdir_name = _TYPE_DIRS.get(config_type)
+    if subdir_name is None:
         raise ValueError(f"Unknown config type: {config_type}")
 
-    subdir = config_dir / type_dirs[config_type]
+    subdir = config_dir / subdir_name
 
     # Try different extensions
     for ext in [".yaml", ".yml", ".json"]:
@@ -157,13 +267,12 @@ def get_data_dir() -> Path:
         Path to the data directory
     """
     if os.name == "nt":  # Windows
-        data_dir = Path(os.environ.get("APPDATA", Path.home() / "AppData" / "Roaming"))
+        data_dir = Path(os.environ.get("APPDATA", _home_dir() / "AppData" / "Roaming"))
     else:
-        data_dir = Path(os.environ.get("XDG_DATA_HOME", Path.home() / ".local" / "share"))
+        data_dir = Path(os.environ.get("XDG_DATA_HOME", _home_dir() / ".local" / "share"))
 
     app_data_dir = data_dir / "multi-agent"
-    app_data_dir.mkdir(parents=True, exist_ok=True)
-    return app_data_dir
+    return _ensure_dir(app_data_dir)
 
 
 def get_cache_dir() -> Path:
@@ -175,10 +284,9 @@ def get_cache_dir() -> Path:
         Path to the cache directory
     """
     if os.name == "nt":  # Windows
-        cache_dir = Path(os.environ.get("TEMP", Path.home() / "AppData" / "Local" / "Temp"))
+        cache_dir = Path(os.environ.get("TEMP", _home_dir() / "AppData" / "Local" / "Temp"))
     else:
-        cache_dir = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+        cache_dir = Path(os.environ.get("XDG_CACHE_HOME", _home_dir() / ".cache"))
 
     app_cache_dir = cache_dir / "multi-agent"
-    app_cache_dir.mkdir(parents=True, exist_ok=True)
-    return app_cache_dir
+    return _ensure_dir(app_cache_dir)
@@ -5,12 +5,18 @@ This module defines Pydantic models for validating configuration data.
 
 from typing import Any, Literal
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator, model_validator
+
+# Config models are read-only once loaded (the loader shares cached instances)
+# and reject unknown keys so typos in config files surface as errors
+_FROZEN_STRICT = ConfigDict(frozen=True, extra="forbid")
 
 
 class LLMConfig(BaseModel):
     """Configuration for LLM endpoint."""
 
+    model_config = _FROZEN_STRICT
+
     endpoint: str = Field(..., description="API base URL")
     model: str = Field(..., description="Model identifier")
     api_key_env: str = Field(..., description="Environment variable name containing API key")
@@ -24,6 +30,8 @@ class LLMConfig(BaseModel):
 class AgentConfig(BaseModel):
     """Configuration for an AI agent."""
 
+    model_config = _FROZEN_STRICT
+
     name: str = Field(..., pattern=r"^[a-z][a-z0-9_]*$", description="Unique agent identifier")
     role: str = Field(..., description="Agent's role/purpose")
     system_prompt: str = Field(..., description="System instruction for LLM")
@@ -36,6 +44,8 @@ class AgentConfig(BaseModel):
 class MCPServerConfigStdio(BaseModel):
     """Configuration for stdio transport."""
 
+    model_config = _FROZEN_STRICT
+
     command: str = Field(..., description="Executable path")
     args: list[str] = Field(default_factory=list, description="Command arguments")
     env: dict[str, str] = Field(default_factory=dict, description="Environment variables")
@@ -44,6 +54,8 @@ class MCPServerConfigStdio(BaseModel):
 class MCPServerConfigSSE(BaseModel):
     """Configuration for SSE transport."""
 
+    model_config = _FROZEN_STRICT
+
     url: str = Field(..., description="SSE endpoint URL")
     headers: dict[str, str] = Field(default_factory=dict, description="HTTP headers")
 
@@ -64,6 +76,8 @@ class MCPServerConfigStreamableHTTP(BaseModel):
         session_ttl: Session time-to-live in seconds
     """
 
+    model_config = _FROZEN_STRICT
+
     url: str = Field(..., description="MCP endpoint URL")
     headers: dict[str, str] = Field(default_factory=dict, description="HTTP headers")
     timeout: int = Field(default=30, ge=1, description="Request timeout in seconds")
@@ -83,6 +97,8 @@ class MCPServerConfigStreamableHTTP(BaseModel):
 class MCPServerConfigCustom(BaseModel):
     """Configuration for custom transport."""
 
+    model_config = _FROZEN_STRICT
+
     class_path: str = Field(..., description="Python class path (module.submodule:ClassName)")
     init_params: dict[str, Any] = Field(default_factory=dict, description="Initialization parameters")
 
@@ -90,6 +106,8 @@ class MCPServerConfigCustom(BaseModel):
 class MCPServerConfig(BaseModel):
     """Configuration for an MCP server connection."""
 
+    model_config = _FROZEN_STRICT
+
     description: str | None = Field(None, description="Server description")
     transport: Literal["stdio", "sse", "streamable-http", "custom"] = Field(..., description="Transport type")
     config: MCPServerConfigStdio | MCPServerConfigSSE | MCPServerConfigStreamableHTTP | MCPServerConfigCustom = Field(
@@ -97,27 +115,61 @@ class MCPServerConfig(BaseModel):
     )
     enabled: bool = Field(default=True, description="Whether this server is enabled")
 
-    @field_validator("config")
+    @model_validator(mode="before")
     @classmethod
-    def validate_config_matches_transport(
-        cls, v: MCPServerConfigStdio | MCPServerConfigSSE | MCPServerConfigStreamableHTTP | MCPServerConfigCustom, info
-    ) -> MCPServerConfigStdio | MCPServerConfigSSE | MCPServerConfigStreamableHTTP | MCPServerConfigCustom:
-        """Validate that config type matches transport type."""
-        transport = info.data.get("transport")
-        if transport == "stdio" and not isinstance(v, MCPServerConfigStdio):
-            raise ValueError("stdio transport requires MCPServerConfigStdio config")
-        if transport == "sse" and not isinstance(v, MCPServerConfigSSE):
-            raise ValueError("sse transport requires MCPServerConfigSSE config")
-        if transport == "streamable-http" and not isinstance(v, MCPServerConfigStreamableHTTP):
-            raise ValueError("streamable-http transport requires MCPServerConfigStreamableHTTP config")
-        if transport == "custom" and not isinstance(v, MCPServerConfigCustom):
-            raise ValueError("custom transport requires MCPServerConfigCustom config")
-        return v
+    def validate_config_for_transport(cls, data: Any) -> Any:
+        """Validate the config against the declared transport's model only.
+
+        Picking the model from the transport up front means the config union
+        isn't tried member by member.
+        """
+        if not isinstance(data, dict):
+            return data
+
+        transport = data.get("transport")
+        config_model = _TRANSPORT_CONFIGS.get(transport) if isinstance(transport, str) else None
+        config = data.get("config")
+        if config_model is None or config is None:
+            # Let field validation report the bad transport or missing config
+            return data
+
+        if isinstance(config, BaseModel):
+            if not isinstance(config, config_model):
+                raise ValueError(f"{transport} transport requires {config_model.__name__} config")
+            return data
+
+        try:
+            return {**data, "config": config_model.model_validate(config)}
+        except ValidationError as e:
+            # Report errors under "config", as if the field had been validated in place
+            raise ValidationError.from_exception_data(
+                cls.__name__,
+                [
+                    {
+                        "type": error["type"],
+                        "loc": ("config", *error["loc"]),
+                        "input": error["input"],
+                        "ctx": error.get("ctx", {}),
+                    }
+                    for error in e.errors()
+                ],
+            ) from None
+
+
+# Transport name -> model for its transport-specific config
+_TRANSPORT_CONFIGS: dict[str, type[BaseModel]] = {
+    "stdio": MCPServerConfigStdio,
+    "sse": MCPServerConfigSSE,
+    "streamable-http": MCPServerConfigStreamableHTTP,
+    "custom": MCPServerConfigCustom,
+}
 
 
 class RetentionPolicyConfig(BaseModel):
     """Configuration for data retention policies."""
 
+    model_config = _FROZEN_STRICT
+
     default_days: int = Field(default=7, ge=0, description="Default retention days")
     by_task: dict[str, int] = Field(default_factory=dict, description="Retention by task type")
     by_status: dict[str, int] = Field(
@@ -128,6 +180,8 @@ class RetentionPolicyConfig(BaseModel):
 class NodeDef(BaseModel):
     """Definition of a workflow node."""
 
+    model_config = _FROZEN_STRICT
+
     type: Literal["agent", "tool", "condition", "human", "parallel"] = Field(
         ..., description="Node type"
     )
@@ -146,12 +200,14 @@ class EdgeDef(BaseModel):
     to: str | dict[str, str] = Field(..., description="Target node or conditional routing")
     condition: str | None = Field(None, description="Optional condition expression")
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(frozen=True, extra="forbid", populate_by_name=True)
 
 
 class WorkflowConfig(BaseModel):
     """Configuration for a workflow."""
 
+    model_config = _FROZEN_STRICT
+
     name: str = Field(..., description="Workflow identifier")
     description: str | None = Field(None, description="Workflow description")
     patterns: list[Literal["react", "reflection", "cot", "debate", "tot"]] = Field(
@@ -179,7 +235,7 @@ def validate_agent_config(data: dict[str, Any]) -> AgentConfig:
     Raises:
         ValidationError: If the configuration is invalid
     """
-    return AgentConfig(**data)
+    return AgentConfig.model_validate(data)
 
 
 def validate_mcp_server_config(data: dict[str, Any]) -> dict[str, MCPServerConfig]:
@@ -194,7 +250,8 @@ def validate_mcp_server_config(data: dict[str, Any]) -> dict[str, MCPServerConfi
     Raises:
         ValidationError: If the configuration is invalid
     """
-    return {name: MCPServerConfig(**config) for name, config in data.items()}
+    validate = MCPServerConfig.model_validate
+    return {name: validate(config) for name, config in data.items()}
 
 
 def validate_workflow_config(data: dict[str, Any]) -> WorkflowConfig:
@@ -209,7 +266,7 @@ def validate_workflow_config(data: dict[str, Any]) -> WorkflowConfig:
     Raises:
         ValidationError: If the configuration is invalid
     """
-    return WorkflowConfig(**data)
+    return WorkflowConfig.model_validate(data)
 
 
 def validate_retention_policy(data: dict[str, Any]) -> RetentionPolicyConfig:
@@ -224,4 +281,4 @@ def validate_retention_policy(data: dict[str, Any]) -> RetentionPolicyConfig:
     Raises:
         ValidationError: If the configuration is invalid
     """
-    return RetentionPolicyConfig(**data)
+    return RetentionPolicyConfig.model_validate(data)
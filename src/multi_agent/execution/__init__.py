@@ -1,29 +1,66 @@
 """Execution module for multi-agent framework."""
 
-from .hitl import (
-    HITLManager,
-    InterruptibleWorkflow,
-    CheckpointMetadata,
-    load_checkpoint_global,
-    list_all_checkpoints,
-)
-from .orchestrator import Orchestrator, OrchestratorConfig, TaskQueue
-from .parallel import (
-    DependencyAnalyzer,
-    FIFOQueue,
-    ParallelExecutor,
-    TaskDependency,
-    analyze_and_execute_parallel,
-)
-from .task import ExecutableTask, TaskExecutionContext, TaskResult
-from .workflow import (
-    WorkflowExecutor,
-    create_workflow_from_pattern,
-    find_workflow_files,
-    load_workflow_from_config,
-    load_workflow_from_file,
-    validate_workflow,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .hitl import (
+        HITLManager,
+        InterruptibleWorkflow,
+        CheckpointMetadata,
+        CheckpointSummary,
+        load_checkpoint_global,
+        list_all_checkpoints,
+        list_all_checkpoints_async,
+        list_checkpoint_summaries_async,
+    )
+    from .orchestrator import Orchestrator, OrchestratorConfig, TaskQueue
+    from .parallel import (
+        DependencyAnalyzer,
+        FIFOQueue,
+        ParallelExecutor,
+        TaskDependency,
+        analyze_and_execute_parallel,
+    )
+    from .task import ExecutableTask, TaskExecutionContext, TaskResult
+    from .workflow import (
+        WorkflowExecutor,
+        create_workflow_from_pattern,
+        find_workflow_files,
+        load_workflow_from_config,
+        load_workflow_from_file,
+        validate_workflow,
+    )
+
+# Public names are imported from their submodule on first access, so using one
+# part of the execution package doesn't import the others
+_LAZY_EXPORTS = {
+    "HITLManager": ".hitl",
+    "InterruptibleWorkflow": ".hitl",
+    "CheckpointMetadata": ".hitl",
+    "CheckpointSummary": ".hitl",
+    "load_checkpoint_global": ".hitl",
+    "list_all_checkpoints": ".hitl",
+    "list_all_checkpoints_async": ".hitl",
+    "list_checkpoint_summaries_async": ".hitl",
+    "Orchestrator": ".orchestrator",
+    "OrchestratorConfig": ".orchestrator",
+    "TaskQueue": ".orchestrator",
+    "DependencyAnalyzer": ".parallel",
+    "FIFOQueue": ".parallel",
+    "ParallelExecutor": ".parallel",
+    "TaskDependency": ".parallel",
+    "analyze_and_execute_parallel": ".parallel",
+    "ExecutableTask": ".task",
+    "TaskExecutionContext": ".task",
+    "TaskResult": ".task",
+    "WorkflowExecutor": ".workflow",
+    "create_workflow_from_pattern": ".workflow",
+    "find_workflow_files": ".workflow",
+    "load_workflow_from_config": ".workflow",
+    "load_workflow_from_file": ".workflow",
+    "validate_workflow": ".workflow",
+}
 
 __all__ = [
     "Orchestrator",
@@ -35,8 +72,11 @@ __all__ = [
     "HITLManager",
     "InterruptibleWorkflow",
     "CheckpointMetadata",
+    "CheckpointSummary",
     "load_checkpoint_global",
     "list_all_checkpoints",
+    "list_all_checkpoints_async",
+    "list_checkpoint_summaries_async",
     "WorkflowExecutor",
     "load_workflow_from_file",
     "load_workflow_from_config",
@@ -49,3 +89,17 @@ __all__ = [
     "FIFOQueue",
     "analyze_and_execute_parallel",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names lazily on attribute access."""
+    if name in _LAZY_EXPORTS:
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """List lazy exports alongside the module's loaded attributes."""
+    return sorted({*globals(), *_LAZY_EXPORTS})
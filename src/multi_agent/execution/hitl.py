@@ -3,30 +3,50 @@
 This module provides checkpoint-based pause/resume functionality for long-running tasks.
 """
 
-import json
+import asyncio
+import os
+import threading
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Optional, TypeVar, overload
 
 from pydantic import BaseModel
 
 from ..config.paths import get_default_config_dir
-from ..models import Agent, Checkpoint, State
+from ..models import Agent, Checkpoint, Message, State
 from ..state import StateManager
-from ..utils import get_logger, generate_uuid
+from ..utils import get_logger, generate_uuid, json_dumps
 
 logger = get_logger(__name__)
 
+# Index entry recorded in place of a checkpoint ID once that checkpoint is deleted
+INDEX_TOMBSTONE = "DEL"
 
-class CheckpointMetadata(BaseModel):
-    """Metadata about a checkpoint.
+# Bytes read from the end of the index when looking up the latest checkpoint
+INDEX_TAIL_BYTES = 4096
+
+# Checkpoint file -> (mtime_ns, size, metadata), least recently used first
+_checkpoint_cache: OrderedDict[Path, tuple[int, int, "CheckpointMetadata"]] = OrderedDict()
+
+# Maximum number of parsed checkpoints kept in _checkpoint_cache
+CHECKPOINT_CACHE_MAX_ENTRIES = 256
+
+# Guards _checkpoint_cache, which async listings fill from worker threads
+_checkpoint_cache_lock = threading.Lock()
+
+
+class CheckpointSummary(BaseModel):
+    """Checkpoint metadata without the checkpoint state.
+
+    Loading a summary from a checkpoint file skips validating the state,
+    which is most of the cost of loading a checkpoint.
 
     Attributes:
         checkpoint_id: Unique checkpoint identifier
         task_id: Associated task ID
         sequence_number: Checkpoint sequence number
         node_name: Node where checkpoint was created
-        state: Checkpoint state
         created_at: Creation timestamp
         human_feedback: Human feedback if provided
     """
@@ -35,11 +55,23 @@ class CheckpointMetadata(BaseModel):
     task_id: str
     sequence_number: int
     node_name: str
-    state: State
     created_at: datetime
     human_feedback: Optional[str] = None
 
 
+class CheckpointMetadata(CheckpointSummary):
+    """Metadata about a checkpoint.
+
+    Attributes:
+        state: Checkpoint state
+    """
+
+    state: State
+
+
+CheckpointT = TypeVar("CheckpointT", bound=CheckpointSummary)
+
+
 class HITLManager:
     """Manages human-in-the-loop checkpoints and pause/resume functionality.
 
@@ -57,26 +89,88 @@ class HITLManager:
         self.state_manager = state_manager
         self._checkpoints_dir = state_manager.task_dir / "checkpoints"
         self._checkpoints_dir.mkdir(parents=True, exist_ok=True)
+        self._index_file = self._checkpoints_dir / ".index"
+        if not self._index_file.exists():
+            self._rebuild_index()
         self._sequence_counter = self._load_sequence_counter()
 
     def _load_sequence_counter(self) -> int:
         """Load the current sequence counter.
 
+        The counter is the highest sequence in the index, tombstones included,
+        so deleted sequence numbers are not reused. A ``.sequence`` file left
+        by older versions is still honoured.
+
         Returns:
             Current sequence number
         """
+        counter = 0
         counter_file = self._checkpoints_dir / ".sequence"
         if counter_file.exists():
             try:
-                return int(counter_file.read_text(encoding="utf-8").strip())
+                counter = int(counter_file.read_text(encoding="utf-8").strip())
             except Exception:
                 pass
-        return 0
+        for line in self._index_file.read_bytes().splitlines():
+            try:
+                counter = max(counter, int(line.partition(b"\t")[0]))
+            except ValueError:
+                continue
+        return counter
 
-    def _save_sequence_counter(self) -> None:
-        """Save the current sequence counter."""
-        counter_file = self._checkpoints_dir / ".sequence"
-        counter_file.write_text(str(self._sequence_counter), encoding="utf-8")
+    def _read_index(self) -> dict[int, str]:
+        """Read the sequence index.
+
+        The index is an append-only file with one tab-separated
+        ``sequence checkpoint_id`` line per checkpoint and a tombstone line per
+        deleted checkpoint, so lookups by sequence read one small file instead
+        of every checkpoint.
+
+        Returns:
+            Mapping of sequence number to checkpoint ID for live checkpoints
+        """
+        try:
+            lines = self._index_file.read_text(encoding="utf-8").splitlines()
+        except FileNotFoundError:
+            return self._rebuild_index()
+
+        index: dict[int, str] = {}
+        for line in lines:
+            sequence, _, checkpoint_id = line.partition("\t")
+            try:
+                sequence_number = int(sequence)
+            except ValueError:
+                continue
+            if checkpoint_id == INDEX_TOMBSTONE:
+                index.pop(sequence_number, None)
+            elif checkpoint_id:
+                index[sequence_number] = checkpoint_id
+        return index
+
+    def _append_index(self, sequence_number: int, checkpoint_id: str) -> None:
+        """Append an entry to the sequence index.
+
+        Args:
+            sequence_number: Checkpoint sequence number
+            checkpoint_id: Checkpoint ID, or the tombstone marker
+        """
+        with open(self._index_file, "a", encoding="utf-8") as f:
+            f.write(f"{sequence_number}\t{checkpoint_id}\n")
+
+    def _rebuild_index(self) -> dict[int, str]:
+        """Rebuild the sequence index from the checkpoint files on disk.
+
+        Used for checkpoint directories written before the index existed.
+
+        Returns:
+            Mapping of sequence number to checkpoint ID
+        """
+        index = {c.sequence_number: c.checkpoint_id for c in self.list_checkpoints()}
+        self._index_file.write_text(
+            "".join(f"{sequence}\t{checkpoint_id}\n" for sequence, checkpoint_id in index.items()),
+            encoding="utf-8",
+        )
+        return index
 
     def create_checkpoint(
         self,
@@ -95,16 +189,15 @@ class HITLManager:
             Created checkpoint
         """
         self._sequence_counter += 1
-        self._save_sequence_counter()
 
         checkpoint_id = generate_uuid()
 
         checkpoint = Checkpoint(
             checkpoint_id=checkpoint_id,
             task_id=self.task_id,
-            sequence_number=self._sequence_counter,
             state=state,
-            human_feedback=human_feedback,
+            position=node_name,
+            sequence=self._sequence_counter,
             created_at=datetime.now(),
         )
 
@@ -119,11 +212,11 @@ class HITLManager:
             human_feedback=human_feedback,
         )
 
-        checkpoint_file = self._checkpoints_dir / f"{checkpoint_id}.json"
-        checkpoint_file.write_text(metadata.model_dump_json(indent=2), encoding="utf-8")
-
-        # Save state for quick resume
-        self.state_manager.save_state(state)
+        # Dump the state once for both the checkpoint file and the quick-resume state file
+        state_data = state.model_dump(mode="json")
+        save_checkpoint_file(self._checkpoints_dir / f"{checkpoint_id}.json", metadata, state_data)
+        self.state_manager.save_state(state, json_dumps(state_data))
+        self._append_index(self._sequence_counter, checkpoint_id)
 
         logger.info(f"Created checkpoint {checkpoint_id} at node {node_name} (sequence {self._sequence_counter})")
 
@@ -135,23 +228,17 @@ class HITLManager:
         Returns:
             List of checkpoint metadata, sorted by sequence number
         """
-        checkpoints: list[CheckpointMetadata] = []
+        return _load_checkpoints(_list_checkpoint_files(self._checkpoints_dir))
 
-        for checkpoint_file in sorted(self._checkpoints_dir.glob("*.json")):
-            if checkpoint_file.name.startswith("."):
-                continue
+    async def list_checkpoints_async(self) -> list[CheckpointMetadata]:
+        """List all checkpoints for this task without blocking the event loop.
 
-            try:
-                data = json.loads(checkpoint_file.read_text(encoding="utf-8"))
-                # Convert state dict back to State model
-                if "state" in data and isinstance(data["state"], dict):
-                    from ..state.serializer import StateSerializer
-                    data["state"] = State.model_validate(data["state"])
-                checkpoints.append(CheckpointMetadata(**data))
-            except Exception as e:
-                logger.warning(f"Failed to load checkpoint {checkpoint_file.name}: {e}")
-
-        return sorted(checkpoints, key=lambda c: c.sequence_number)
+        Returns:
+            List of checkpoint metadata, sorted by sequence number
+        """
+        return await _load_checkpoints_async(
+            _list_checkpoint_files(self._checkpoints_dir), CheckpointMetadata
+        )
 
     def load_checkpoint(self, checkpoint_id: str) -> Optional[CheckpointMetadata]:
         """Load a specific checkpoint.
@@ -164,15 +251,10 @@ class HITLManager:
         """
         checkpoint_file = self._checkpoints_dir / f"{checkpoint_id}.json"
 
-        if not checkpoint_file.exists():
-            return None
-
         try:
-            data = json.loads(checkpoint_file.read_text(encoding="utf-8"))
-            # Convert state dict back to State model
-            if "state" in data and isinstance(data["state"], dict):
-                data["state"] = State.model_validate(data["state"])
-            return CheckpointMetadata(**data)
+            return _load_checkpoint_file(checkpoint_file)
+        except FileNotFoundError:
+            return None
         except Exception as e:
             logger.error(f"Failed to load checkpoint {checkpoint_id}: {e}")
             return None
@@ -186,10 +268,10 @@ class HITLManager:
         Returns:
             Checkpoint metadata or None if not found
         """
-        for checkpoint in self.list_checkpoints():
-            if checkpoint.sequence_number == sequence_number:
-                return checkpoint
-        return None
+        checkpoint_id = self._read_index().get(sequence_number)
+        if checkpoint_id is None:
+            return None
+        return self.load_checkpoint(checkpoint_id)
 
     def load_latest_checkpoint(self) -> Optional[CheckpointMetadata]:
         """Load the most recent checkpoint.
@@ -197,8 +279,52 @@ class HITLManager:
         Returns:
             Latest checkpoint metadata or None if no checkpoints exist
         """
-        checkpoints = self.list_checkpoints()
-        return checkpoints[-1] if checkpoints else None
+        lines, complete = self._read_index_tail()
+        checkpoint = self._latest_indexed_checkpoint(lines)
+        if checkpoint is None and not complete:
+            checkpoint = self._latest_indexed_checkpoint(self._index_file.read_bytes().splitlines())
+        return checkpoint
+
+    def _read_index_tail(self) -> tuple[list[bytes], bool]:
+        """Read the last lines of the sequence index.
+
+        Returns:
+            The complete lines within INDEX_TAIL_BYTES of the end of the index,
+            and whether they cover the whole index
+        """
+        if not self._index_file.exists():
+            self._rebuild_index()
+        with open(self._index_file, "rb") as f:
+            size = f.seek(0, os.SEEK_END)
+            f.seek(max(0, size - INDEX_TAIL_BYTES))
+            lines = f.read().splitlines()
+        if size > INDEX_TAIL_BYTES:
+            # The first line read may start mid-entry
+            return lines[1:], False
+        return lines, True
+
+    def _latest_indexed_checkpoint(self, lines: list[bytes]) -> Optional[CheckpointMetadata]:
+        """Load the newest live checkpoint listed in some index lines.
+
+        Args:
+            lines: Index lines, oldest first
+
+        Returns:
+            Latest checkpoint metadata or None if none of the lines names one
+        """
+        seen: set[bytes] = set()
+        for line in reversed(lines):
+            sequence, _, checkpoint_id = line.partition(b"\t")
+            if not checkpoint_id or sequence in seen:
+                continue
+            seen.add(sequence)
+            if checkpoint_id == INDEX_TOMBSTONE.encode():
+                continue
+            # Entries can outlive their files when checkpoints are deleted outside this manager
+            checkpoint = self.load_checkpoint(checkpoint_id.decode("utf-8"))
+            if checkpoint is not None:
+                return checkpoint
+        return None
 
     def resume_from_checkpoint(
         self,
@@ -222,8 +348,6 @@ class HITLManager:
 
         # Add feedback if provided
         if feedback:
-            from ..models import Message
-
             feedback_message = Message(
                 role="human",
                 content=feedback,
@@ -233,8 +357,7 @@ class HITLManager:
 
             # Update checkpoint with feedback
             checkpoint.human_feedback = feedback
-            checkpoint_file = self._checkpoints_dir / f"{checkpoint_id}.json"
-            checkpoint_file.write_text(checkpoint.model_dump_json(indent=2), encoding="utf-8")
+            save_checkpoint_file(self._checkpoints_dir / f"{checkpoint_id}.json", checkpoint)
 
             logger.info(f"Resumed from checkpoint {checkpoint_id} with feedback")
             return updated_state
@@ -258,6 +381,10 @@ class HITLManager:
 
         try:
             checkpoint_file.unlink()
+            _forget_checkpoint_file(checkpoint_file)
+            for sequence_number, indexed_id in self._read_index().items():
+                if indexed_id == checkpoint_id:
+                    self._append_index(sequence_number, INDEX_TOMBSTONE)
             logger.info(f"Deleted checkpoint {checkpoint_id}")
             return True
         except Exception as e:
@@ -362,19 +489,43 @@ def load_checkpoint_global(task_id: str, checkpoint_id: str) -> Optional[Checkpo
     config_dir = get_default_config_dir()
     checkpoint_file = config_dir / "tasks" / task_id / "checkpoints" / f"{checkpoint_id}.json"
 
-    if not checkpoint_file.exists():
-        return None
-
     try:
-        data = json.loads(checkpoint_file.read_text(encoding="utf-8"))
-        if "state" in data and isinstance(data["state"], dict):
-            data["state"] = State.model_validate(data["state"])
-        return CheckpointMetadata(**data)
+        return _load_checkpoint_file(checkpoint_file)
+    except FileNotFoundError:
+        return None
     except Exception as e:
         logger.error(f"Failed to load checkpoint {checkpoint_id}: {e}")
         return None
 
 
+def save_checkpoint_file(
+    path: Path,
+    metadata: CheckpointMetadata,
+    state_data: Optional[dict[str, Any]] = None,
+) -> None:
+    """Write checkpoint metadata to a checkpoint file.
+
+    The file is written compactly: it is read back by code, not by people,
+    and indentation adds roughly a quarter to its size. It is written to a
+    temporary file first and renamed into place, so a crash mid-write never
+    leaves a truncated checkpoint.
+
+    Args:
+        path: Checkpoint file path
+        metadata: Checkpoint metadata to write
+        state_data: The metadata's state already dumped in JSON mode, reused
+            instead of dumping it again
+    """
+    if state_data is None:
+        data = metadata.model_dump(mode="json")
+    else:
+        data = metadata.model_dump(mode="json", exclude={"state"})
+        data["state"] = state_data
+    temp_path = path.with_suffix(f"{path.suffix}.tmp")
+    temp_path.write_text(json_dumps(data), encoding="utf-8")
+    temp_path.replace(path)
+
+
 def list_all_checkpoints(task_id: str) -> list[CheckpointMetadata]:
     """List all checkpoints for a task using global path.
 
@@ -384,24 +535,196 @@ def list_all_checkpoints(task_id: str) -> list[CheckpointMetadata]:
     Returns:
         List of checkpoint metadata
     """
-    config_dir = get_default_config_dir()
-    checkpoints_dir = config_dir / "tasks" / task_id / "checkpoints"
+    return _load_checkpoints(_checkpoint_files(task_id))
+
+
+async def list_all_checkpoints_async(task_id: str) -> list[CheckpointMetadata]:
+    """List all checkpoints for a task, loading the files concurrently.
+
+    Reads run in worker threads, so listing many checkpoints on slow or
+    network storage takes roughly one read latency instead of one per file.
+
+    Args:
+        task_id: Task ID
+
+    Returns:
+        List of checkpoint metadata
+    """
+    return await _load_checkpoints_async(_checkpoint_files(task_id), CheckpointMetadata)
+
+
+async def list_checkpoint_summaries_async(task_id: str) -> list[CheckpointSummary]:
+    """List checkpoint summaries for a task, loading the files concurrently.
+
+    Args:
+        task_id: Task ID
+
+    Returns:
+        List of checkpoint summaries, sorted by sequence number
+    """
+    return await _load_checkpoints_async(_checkpoint_files(task_id), CheckpointSummary)
+
+
+def _checkpoint_files(task_id: str) -> list[Path]:
+    """Get the checkpoint files for a task using global path.
 
-    if not checkpoints_dir.exists():
+    Args:
+        task_id: Task ID
+
+    Returns:
+        Checkpoint file paths (empty if the task has no checkpoints)
+    """
+    config_dir = get_default_config_dir()
+    try:
+        return _list_checkpoint_files(config_dir / "tasks" / task_id / "checkpoints")
+    except FileNotFoundError:
         return []
 
-    checkpoints: list[CheckpointMetadata] = []
 
-    for checkpoint_file in sorted(checkpoints_dir.glob("*.json")):
-        if checkpoint_file.name.startswith("."):
-            continue
+def _list_checkpoint_files(checkpoints_dir: Path) -> list[Path]:
+    """Get the checkpoint files in a checkpoints directory.
+
+    The files are returned in directory order; loaders sort what they load
+    by sequence number, so sorting the names first would be wasted work.
+
+    Args:
+        checkpoints_dir: Checkpoints directory
 
+    Returns:
+        Checkpoint file paths
+    """
+    with os.scandir(checkpoints_dir) as entries:
+        return [
+            Path(entry.path)
+            for entry in entries
+            if entry.name.endswith(".json") and not entry.name.startswith(".") and entry.is_file()
+        ]
+
+
+def _load_checkpoints(checkpoint_files: list[Path]) -> list[CheckpointMetadata]:
+    """Load checkpoint files, skipping any that can't be read.
+
+    Args:
+        checkpoint_files: Checkpoint file paths
+
+    Returns:
+        List of checkpoint metadata, sorted by sequence number
+    """
+    checkpoints: list[CheckpointMetadata] = []
+
+    for checkpoint_file in checkpoint_files:
         try:
-            data = json.loads(checkpoint_file.read_text(encoding="utf-8"))
-            if "state" in data and isinstance(data["state"], dict):
-                data["state"] = State.model_validate(data["state"])
-            checkpoints.append(CheckpointMetadata(**data))
+            checkpoints.append(_load_checkpoint_file(checkpoint_file))
         except Exception as e:
             logger.warning(f"Failed to load checkpoint {checkpoint_file.name}: {e}")
 
-    return sorted(checkpoints, key=lambda c: c.sequence_number)
+    checkpoints.sort(key=lambda c: c.sequence_number)
+    return checkpoints
+
+
+async def _load_checkpoints_async(
+    checkpoint_files: list[Path],
+    model: type[CheckpointT],
+) -> list[CheckpointT]:
+    """Load checkpoint files in worker threads, skipping any that can't be read.
+
+    Both the read and the parse run off the event loop.
+
+    Args:
+        checkpoint_files: Checkpoint file paths
+        model: Model to load each file as
+
+    Returns:
+        List of loaded checkpoints, sorted by sequence number
+    """
+    results = await asyncio.gather(
+        *(asyncio.to_thread(_load_checkpoint_file, f, model) for f in checkpoint_files),
+        return_exceptions=True,
+    )
+
+    checkpoints: list[CheckpointT] = []
+
+    for checkpoint_file, result in zip(checkpoint_files, results, strict=True):
+        if isinstance(result, Exception):
+            logger.warning(f"Failed to load checkpoint {checkpoint_file.name}: {result}")
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            checkpoints.append(result)
+
+    checkpoints.sort(key=lambda c: c.sequence_number)
+    return checkpoints
+
+
+@overload
+def _load_checkpoint_file(path: Path) -> CheckpointMetadata: ...
+
+
+@overload
+def _load_checkpoint_file(path: Path, model: type[CheckpointT]) -> CheckpointT: ...
+
+
+def _load_checkpoint_file(
+    path: Path,
+    model: type[CheckpointSummary] = CheckpointMetadata,
+) -> CheckpointSummary:
+    """Load checkpoint metadata from a checkpoint file.
+
+    Full metadata is cached per file and reused while the file's mtime and
+    size are unchanged. Each caller gets its own shallow copy, so setting a
+    field on the result doesn't change what other callers see.
+
+    Args:
+        path: Checkpoint file path
+        model: Model to load the file as (default: CheckpointMetadata)
+
+    Returns:
+        The loaded checkpoint, as an instance of model
+    """
+    if model is not CheckpointMetadata:
+        return _parse_checkpoint(path.read_bytes(), model)
+
+    stat = path.stat()
+    with _checkpoint_cache_lock:
+        cached = _checkpoint_cache.get(path)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            _checkpoint_cache.move_to_end(path)
+            return cached[2].model_copy()
+
+    checkpoint = _parse_checkpoint(path.read_bytes(), CheckpointMetadata)
+
+    with _checkpoint_cache_lock:
+        _checkpoint_cache[path] = (stat.st_mtime_ns, stat.st_size, checkpoint)
+        _checkpoint_cache.move_to_end(path)
+        while len(_checkpoint_cache) > CHECKPOINT_CACHE_MAX_ENTRIES:
+            _checkpoint_cache.popitem(last=False)
+
+    return checkpoint.model_copy()
+
+
+def _forget_checkpoint_file(path: Path) -> None:
+    """Drop a checkpoint file from the parsed checkpoint cache.
+
+    Args:
+        path: Checkpoint file path
+    """
+    with _checkpoint_cache_lock:
+        _checkpoint_cache.pop(path, None)
+
+
+def _parse_checkpoint(data: bytes, model: type[CheckpointT]) -> CheckpointT:
+    """Parse checkpoint metadata from a checkpoint file's contents.
+
+    The JSON is parsed and validated in a single pass, nested state
+    included, without building an intermediate dict. Fields the model
+    doesn't declare, such as the state for a summary, are not validated.
+
+    Args:
+        data: Raw checkpoint file contents
+        model: Model to parse the contents as, e.g. CheckpointMetadata for the
+            full checkpoint or CheckpointSummary to skip the state
+
+    Returns:
+        The parsed checkpoint, as an instance of model
+    """
+    return model.model_validate_json(data)
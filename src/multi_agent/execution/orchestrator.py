@@ -5,12 +5,14 @@ This module provides the main execution engine with FIFO queue management.
 
 import asyncio
 from collections import deque
+from collections.abc import Callable
 from typing import Any, Optional
 
 from pydantic import BaseModel
 
 from ..agent.base import BaseAgent
 from ..config import AgentConfig, load_agent_config
+from ..config.paths import resolve_config_path
 from ..models import Agent, Task, TaskStatus
 from ..tools import MCPToolManager, ToolExecutor
 from ..utils import get_logger
@@ -34,17 +36,27 @@ class OrchestratorConfig(BaseModel):
 
 
 class TaskQueue:
-    """FIFO queue for pending tasks."""
+    """FIFO queue for pending tasks.
 
-    def __init__(self, max_size: int = 1000) -> None:
+    Removal is O(1): a removed task is dropped from the ID lookup and its
+    deque entry is skipped when it reaches the front of the queue.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        on_remove: Optional[Callable[[str], None]] = None,
+    ) -> None:
         """Initialize the task queue.
 
         Args:
             max_size: Maximum queue size
+            on_remove: Called with the task ID when remove() drops a queued task
         """
-        self.queue: deque[ExecutableTask] = deque(maxlen=max_size)
+        self.queue: deque[ExecutableTask] = deque()
         self.max_size = max_size
-        self._pending: set[str] = set()
+        self.on_remove = on_remove
+        self._by_id: dict[str, ExecutableTask] = {}
 
     def put(self, task: ExecutableTask) -> bool:
         """Add a task to the queue.
@@ -55,16 +67,16 @@ class TaskQueue:
         Returns:
             True if task was queued, False if queue is full
         """
-        if len(self.queue) >= self.max_size:
+        if len(self._by_id) >= self.max_size:
             logger.warning(f"Task queue is full ({self.max_size}), rejecting task: {task.task_id}")
             return False
 
-        if task.task_id in self._pending:
+        if task.task_id in self._by_id:
             logger.warning(f"Task already in queue: {task.task_id}")
             return False
 
         self.queue.append(task)
-        self._pending.add(task.task_id)
+        self._by_id[task.task_id] = task
         return True
 
     def get(self) -> Optional[ExecutableTask]:
@@ -73,11 +85,12 @@ class TaskQueue:
         Returns:
             Next task or None if queue is empty
         """
-        if not self.queue:
+        task = self.peek()
+        if task is None:
             return None
 
-        task = self.queue.popleft()
-        self._pending.discard(task.task_id)
+        self.queue.popleft()
+        del self._by_id[task.task_id]
         return task
 
     def peek(self) -> Optional[ExecutableTask]:
@@ -86,7 +99,13 @@ class TaskQueue:
         Returns:
             Next task or None if queue is empty
         """
-        return self.queue[0] if self.queue else None
+        while self.queue:
+            task = self.queue[0]
+            if self._by_id.get(task.task_id) is task:
+                return task
+            # Entry for a removed task
+            self.queue.popleft()
+        return None
 
     def remove(self, task_id: str) -> bool:
         """Remove a task from the queue.
@@ -97,12 +116,27 @@ class TaskQueue:
         Returns:
             True if task was removed
         """
-        for i, task in enumerate(self.queue):
-            if task.task_id == task_id:
-                del self.queue[i]
-                self._pending.discard(task_id)
-                return True
-        return False
+        if self._by_id.pop(task_id, None) is None:
+            return False
+
+        # Drop entries for removed tasks once they outnumber the live ones
+        if len(self.queue) > 2 * len(self._by_id) + 1:
+            self.queue = deque(task for task in self.queue if self._by_id.get(task.task_id) is task)
+
+        if self.on_remove is not None:
+            self.on_remove(task_id)
+        return True
+
+    def __contains__(self, task_id: str) -> bool:
+        """Check if a task is waiting in the queue.
+
+        Args:
+            task_id: Task ID to check
+
+        Returns:
+            True if the task is queued
+        """
+        return task_id in self._by_id
 
     @property
     def size(self) -> int:
@@ -111,7 +145,7 @@ class TaskQueue:
         Returns:
             Number of tasks in queue
         """
-        return len(self.queue)
+        return len(self._by_id)
 
     @property
     def empty(self) -> bool:
@@ -120,7 +154,7 @@ class TaskQueue:
         Returns:
             True if queue is empty
         """
-        return len(self.queue) == 0
+        return not self._by_id
 
 
 class Orchestrator:
@@ -144,10 +178,14 @@ class Orchestrator:
         self.tool_manager = tool_manager or MCPToolManager()
         self.tool_executor = ToolExecutor(self.tool_manager)
 
-        self.queue = TaskQueue(max_size=self.config.queue_size)
+        self.queue = TaskQueue(max_size=self.config.queue_size, on_remove=self._abandon_dispatch)
         self._running_tasks: dict[str, asyncio.Task] = {}
         self._agents: dict[str, BaseAgent] = {}
         self._shutdown = False
+        # Set when a slot frees up or a task is queued, to wake the queue processor
+        self._queue_event = asyncio.Event()
+        # Resolved with the running asyncio task when a queued task is dispatched
+        self._dispatched: dict[str, asyncio.Future[asyncio.Task]] = {}
 
     async def initialize(self) -> None:
         """Initialize the orchestrator.
@@ -166,6 +204,14 @@ class Orchestrator:
         """
         logger.info("Shutting down orchestrator")
         self._shutdown = True
+        self._queue_event.set()
+
+        # Queued tasks will never start; release anyone waiting on them
+        while not self.queue.empty:
+            task = self.queue.get()
+            if task:
+                logger.info(f"Dropping queued task on shutdown: {task.task_id}")
+                self._abandon_dispatch(task.task_id)
 
         # Wait for running tasks
         if self._running_tasks:
@@ -208,6 +254,8 @@ class Orchestrator:
         if len(self._running_tasks) >= self.config.max_concurrent:
             if not self.queue.put(task):
                 raise RuntimeError("Task queue is full")
+            self._dispatched[task.task_id] = asyncio.get_running_loop().create_future()
+            self._queue_event.set()
             logger.info(f"Task queued: {task.task_id}")
         else:
             # Execute immediately
@@ -228,30 +276,38 @@ class Orchestrator:
         Raises:
             TimeoutError: If timeout is reached
             FileNotFoundError: If task not found
+            RuntimeError: If the task left the queue without being started
         """
-        start_time = asyncio.get_event_loop().time()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+
+        def remaining() -> float:
+            return max(deadline - loop.time(), 0)
 
         while True:
-            # Check if task is in running tasks
-            if task_id in self._running_tasks:
-                task = self._running_tasks[task_id]
-                try:
-                    result = await asyncio.wait_for(task, timeout=timeout)
-                    return result
-                except asyncio.TimeoutError:
-                    raise TimeoutError(f"Timeout waiting for task: {task_id}")
-
-            # Check if task is in queue
-            queued = False
-            for task in self.queue.queue:
-                if task.task_id == task_id:
-                    queued = True
-                    break
-
-            if queued:
-                # Wait and check again
-                await asyncio.sleep(0.1)
-                continue
+            try:
+                # Check if task is in running tasks
+                if task_id in self._running_tasks:
+                    task = self._running_tasks[task_id]
+                    return await asyncio.wait_for(task, timeout=remaining())
+
+                # Check if task is in queue; wait for it to start running, then for its result
+                dispatched = self._dispatched.get(task_id)
+                if dispatched is not None:
+                    try:
+                        task = await asyncio.wait_for(
+                            asyncio.shield(dispatched), timeout=remaining()
+                        )
+                    except asyncio.CancelledError:
+                        # Only the waiter itself being cancelled should propagate as such
+                        if not dispatched.cancelled():
+                            raise
+                        raise RuntimeError(
+                            f"Task was removed from the queue before it started: {task_id}"
+                        ) from None
+                    return await asyncio.wait_for(task, timeout=remaining())
+            except asyncio.TimeoutError:
+                raise TimeoutError(f"Timeout waiting for task: {task_id}")
 
             # Task might be completed, try to load from storage
             try:
@@ -269,17 +325,19 @@ class Orchestrator:
                 pass
 
             # Check timeout
-            elapsed = asyncio.get_event_loop().time() - start_time
-            if elapsed >= timeout:
+            if remaining() <= 0:
                 raise TimeoutError(f"Timeout waiting for task: {task_id}")
 
-            await asyncio.sleep(0.1)
+            await asyncio.sleep(min(0.1, remaining()))
 
     async def _process_queue(self) -> None:
         """Background task to process queued tasks."""
         while not self._shutdown:
-            # Clean up completed tasks
-            self._cleanup_completed_tasks()
+            await self._queue_event.wait()
+            self._queue_event.clear()
+            # shutdown() sets the event too; don't start tasks it won't wait for
+            if self._shutdown:
+                break
 
             # Execute queued tasks if under limit
             while not self.queue.empty and len(self._running_tasks) < self.config.max_concurrent:
@@ -287,8 +345,6 @@ class Orchestrator:
                 if task:
                     self._execute_task(task)
 
-            await asyncio.sleep(0.1)
-
     def _execute_task(self, task: ExecutableTask) -> None:
         """Execute a task asynchronously.
 
@@ -302,20 +358,28 @@ class Orchestrator:
         asyncio_task = asyncio.create_task(run_task())
         self._running_tasks[task.task_id] = asyncio_task
 
-        # Add cleanup callback
-        asyncio_task.add_done_callback(lambda t: self._running_tasks.pop(task.task_id, None))
+        # Free the slot and wake the queue processor when the task finishes
+        def on_done(_: asyncio.Task) -> None:
+            self._running_tasks.pop(task.task_id, None)
+            self._queue_event.set()
+
+        asyncio_task.add_done_callback(on_done)
+
+        dispatched = self._dispatched.pop(task.task_id, None)
+        if dispatched is not None:
+            dispatched.set_result(asyncio_task)
 
         logger.info(f"Executing task: {task.task_id}")
 
-    def _cleanup_completed_tasks(self) -> None:
-        """Clean up completed tasks."""
-        completed = [
-            task_id
-            for task_id, task in self._running_tasks.items()
-            if task.done()
-        ]
-        for task_id in completed:
-            self._running_tasks.pop(task_id, None)
+    def _abandon_dispatch(self, task_id: str) -> None:
+        """Forget a queued task that will never be dispatched.
+
+        Args:
+            task_id: ID of the task that left the queue unstarted
+        """
+        dispatched = self._dispatched.pop(task_id, None)
+        if dispatched is not None:
+            dispatched.cancel()
 
     def _get_agent(self, agent_name: str) -> BaseAgent:
         """Get or create an agent.
@@ -330,8 +394,6 @@ class Orchestrator:
             return self._agents[agent_name]
 
         # Load agent config
-        from ..config.paths import resolve_config_path
-
         try:
             config_path = resolve_config_path(agent_name, config_type="agents")
             config = load_agent_config(config_path)
@@ -4,6 +4,10 @@ This module provides automatic task dependency detection and parallel execution.
 """
 
 import asyncio
+import re
+import time
+from collections import OrderedDict, defaultdict, deque
+from collections.abc import Awaitable, Callable, Iterable, Mapping
 from typing import Any, Optional
 
 import networkx as nx
@@ -15,6 +19,25 @@ from ..utils import get_logger
 
 logger = get_logger(__name__)
 
+# (successors, predecessors): the task IDs on either end of each task's edges
+Adjacency = tuple[dict[str, list[str]], dict[str, list[str]]]
+
+# Sorted (task ID, description) pairs -> (created monotonic time, adjacency),
+# least recently used first
+_plan_cache: OrderedDict[tuple[tuple[str, str], ...], tuple[float, Adjacency]] = OrderedDict()
+
+# Maximum number of dependency plans kept in _plan_cache
+PLAN_CACHE_MAX_ENTRIES = 256
+
+# Keywords (with their trailing space) followed by the data a task produces
+_PRODUCES_KEYWORDS = ("create ", "generate ", "produce ", "write ", "make ")
+
+# Keywords (with their trailing space) followed by the data a task consumes
+_CONSUMES_KEYWORDS = ("use ", "read ", "load ", "process ", "analyze ")
+
+# Next whitespace-delimited word from a position; group 1 is the word
+_NEXT_WORD_RE = re.compile(r"\s*(\S+)")
+
 
 class TaskDependency:
     """Represents a dependency between tasks.
@@ -25,11 +48,13 @@ class TaskDependency:
         consumes: Data this task consumes
     """
 
+    __slots__ = ("task_id", "produces", "consumes")
+
     def __init__(
         self,
         task_id: str,
-        produces: list[str],
-        consumes: list[str],
+        produces: Iterable[str],
+        consumes: Iterable[str],
     ) -> None:
         """Initialize task dependency.
 
@@ -39,8 +64,8 @@ class TaskDependency:
             consumes: Data this task consumes
         """
         self.task_id = task_id
-        self.produces = produces
-        self.consumes = consumes
+        self.produces = frozenset(produces)
+        self.consumes = frozenset(consumes)
 
 
 class DependencyAnalyzer:
@@ -50,13 +75,15 @@ class DependencyAnalyzer:
     produces and consumes, then builds a DAG for execution planning.
     """
 
-    def __init__(self, llm_client: Any) -> None:
+    def __init__(self, llm_client: Any, max_concurrent: int = 100) -> None:
         """Initialize the dependency analyzer.
 
         Args:
             llm_client: LLM client for analysis
+            max_concurrent: Maximum tasks analyzed at once
         """
         self.llm_client = llm_client
+        self.max_concurrent = max_concurrent
 
     async def analyze_task_dependencies(
         self,
@@ -64,26 +91,27 @@ class DependencyAnalyzer:
     ) -> list[TaskDependency]:
         """Analyze dependencies between tasks.
 
+        Tasks are analyzed concurrently, at most max_concurrent at a time.
+
         Args:
             tasks: List of tasks to analyze
 
         Returns:
             List of task dependencies
         """
-        dependencies = []
+        semaphore = asyncio.Semaphore(self.max_concurrent)
 
-        for task in tasks:
+        async def analyze(task: TaskModel) -> TaskDependency:
+            """Extract produces/consumes for one task."""
             # Use LLM to extract produces/consumes from task description
-            produces = await self._extract_produces(task)
-            consumes = await self._extract_consumes(task)
+            async with semaphore:
+                produces, consumes = await asyncio.gather(
+                    self._extract_produces(task),
+                    self._extract_consumes(task),
+                )
+            return TaskDependency(task_id=task.id, produces=produces, consumes=consumes)
 
-            dependencies.append(TaskDependency(
-                task_id=task.id,
-                produces=produces,
-                consumes=consumes,
-            ))
-
-        return dependencies
+        return list(await asyncio.gather(*(analyze(task) for task in tasks)))
 
     async def _extract_produces(self, task: TaskModel) -> list[str]:
         """Extract data produced by a task.
@@ -94,21 +122,9 @@ class DependencyAnalyzer:
         Returns:
             List of data keys this task produces
         """
-        # Simple heuristic: extract words like "create", "generate", "produce"
+        # Simple heuristic: the word after "create", "generate", "produce", ...
         # In production, would use LLM for more accurate extraction
-        description = task.description.lower()
-        produces = []
-
-        keywords = ["create", "generate", "produce", "write", "make"]
-        for keyword in keywords:
-            if f"{keyword} " in description:
-                # Extract the object being created
-                parts = description.split(f"{keyword} ")
-                if len(parts) > 1:
-                    obj = parts[1].split()[0].strip(".,;")
-                    produces.append(obj)
-
-        return produces
+        return _keyword_objects(_PRODUCES_KEYWORDS, task.description)
 
     async def _extract_consumes(self, task: TaskModel) -> list[str]:
         """Extract data consumed by a task.
@@ -119,20 +135,8 @@ class DependencyAnalyzer:
         Returns:
             List of data keys this task consumes
         """
-        # Simple heuristic: extract words like "use", "read", "load"
-        description = task.description.lower()
-        consumes = []
-
-        keywords = ["use", "read", "load", "process", "analyze"]
-        for keyword in keywords:
-            if f"{keyword} " in description:
-                # Extract the object being used
-                parts = description.split(f"{keyword} ")
-                if len(parts) > 1:
-                    obj = parts[1].split()[0].strip(".,;")
-                    consumes.append(obj)
-
-        return consumes
+        # Simple heuristic: the word after "use", "read", "load", ...
+        return _keyword_objects(_CONSUMES_KEYWORDS, task.description)
 
     def build_dependency_graph(
         self,
@@ -152,20 +156,52 @@ class DependencyAnalyzer:
         for dep in dependencies:
             graph.add_node(dep.task_id, produces=dep.produces, consumes=dep.consumes)
 
-        # Add edges for dependencies
-        for producer in dependencies:
-            for consumer in dependencies:
-                if producer.task_id == consumer.task_id:
-                    continue
-
-                # Check if consumer depends on producer
-                for produced in producer.produces:
-                    if produced in consumer.consumes:
-                        graph.add_edge(producer.task_id, consumer.task_id)
-                        break
+        successors, _ = self.build_adjacency(dependencies)
+        graph.add_edges_from(
+            (task_id, successor) for task_id, targets in successors.items() for successor in targets
+        )
 
         return graph
 
+    def build_adjacency(
+        self,
+        dependencies: list[TaskDependency],
+    ) -> Adjacency:
+        """Build plain adjacency lists from task dependencies.
+
+        Same edges as build_dependency_graph, without the networkx layer,
+        for callers that only need to walk the graph.
+
+        Args:
+            dependencies: List of task dependencies
+
+        Returns:
+            Tuple of (successors, predecessors), each mapping every task ID
+            to the IDs on the other end of its edges
+        """
+        successors: dict[str, list[str]] = {dep.task_id: [] for dep in dependencies}
+        predecessors: dict[str, list[str]] = {dep.task_id: [] for dep in dependencies}
+
+        # Index consumers by data key so each producer only visits its consumers
+        consumers_by_key: defaultdict[str, list[str]] = defaultdict(list)
+        for dep in dependencies:
+            for key in dep.consumes:
+                consumers_by_key[key].append(dep.task_id)
+
+        for producer in dependencies:
+            # A consumer of several of the producer's keys still gets one edge
+            consumer_ids = dict.fromkeys(
+                consumer_id
+                for key in producer.produces
+                for consumer_id in consumers_by_key.get(key, ())
+                if consumer_id != producer.task_id
+            )
+            for consumer_id in consumer_ids:
+                successors[producer.task_id].append(consumer_id)
+                predecessors[consumer_id].append(producer.task_id)
+
+        return successors, predecessors
+
     def detect_circular_dependencies(self, graph: nx.DiGraph) -> list[list[str]]:
         """Detect circular dependencies in the graph.
 
@@ -194,38 +230,14 @@ class DependencyAnalyzer:
             graph: Dependency graph
 
         Returns:
-            List of batches, each batch is a list of task IDs
+            List of batches, each batch is a list of task IDs, or an empty
+            list if the graph has a cycle
         """
-        # Use topological sort to get execution order
-        try:
-            topo_order = list(nx.topological_sort(graph))
-        except nx.NetworkXError:
-            # Graph has cycles, return empty
+        batches, unresolved = _execution_levels(graph.adj, dict(graph.in_degree()))
+        if unresolved:
+            logger.warning(f"Unable to schedule tasks, possible circular dependency: {unresolved}")
             return []
 
-        # Group into levels where each level can run in parallel
-        batches: list[list[str]] = []
-        completed: set[str] = set()
-        remaining = set(topo_order)
-
-        while remaining:
-            # Find all tasks whose dependencies are satisfied
-            batch = []
-            for task_id in list(remaining):
-                # Get predecessors
-                predecessors = set(graph.predecessors(task_id))
-                if predecessors.issubset(completed):
-                    batch.append(task_id)
-
-            if not batch:
-                # Circular dependency detected
-                logger.warning("Unable to resolve next batch, possible circular dependency")
-                break
-
-            batches.append(batch)
-            completed.update(batch)
-            remaining -= set(batch)
-
         return batches
 
 
@@ -241,6 +253,7 @@ class ParallelExecutor:
         agents: dict[str, BaseAgent],
         tool_executor: Optional[ToolExecutor] = None,
         max_concurrent: int = 100,
+        plan_cache_ttl: Optional[float] = None,
     ) -> None:
         """Initialize the parallel executor.
 
@@ -248,113 +261,158 @@ class ParallelExecutor:
             agents: Available agents by name
             tool_executor: Tool executor
             max_concurrent: Maximum concurrent tasks
+            plan_cache_ttl: Seconds a cached dependency graph stays valid
+                (default: until evicted)
         """
         self.agents = agents
         self.tool_executor = tool_executor
         self.max_concurrent = max_concurrent
+        self.plan_cache_ttl = plan_cache_ttl
+        self._analyzer = DependencyAnalyzer(llm_client=None, max_concurrent=max_concurrent)
         self._semaphore = asyncio.Semaphore(max_concurrent)
 
     async def execute_tasks(
         self,
         tasks: list[TaskModel],
         initial_state: Optional[State] = None,
+        on_result: Optional[Callable[[str, Any], Awaitable[None]]] = None,
     ) -> dict[str, Any]:
         """Execute tasks with automatic parallelization.
 
         Args:
             tasks: List of tasks to execute
             initial_state: Optional initial state
+            on_result: Coroutine function called with each task ID and result
+                as soon as that task finishes
 
         Returns:
-            Dictionary of task results by task ID
+            Dictionary of task results by task ID, in completion order
         """
-        # Analyze dependencies
-        analyzer = DependencyAnalyzer(llm_client=None)
-        dependencies = await analyzer.analyze_task_dependencies(tasks)
-
-        # Build dependency graph
-        graph = analyzer.build_dependency_graph(dependencies)
+        successors, predecessors = await self._plan(tasks)
 
-        # Check for circular dependencies
-        cycles = analyzer.detect_circular_dependencies(graph)
-        if cycles:
+        levels, unresolved = _execution_levels(
+            successors, {task_id: len(preds) for task_id, preds in predecessors.items()}
+        )
+        if unresolved:
+            # Only enumerate the cycles once we know there is at least one
+            stuck = set(unresolved)
+            subgraph = nx.DiGraph(
+                (task_id, successor)
+                for task_id in unresolved
+                for successor in successors[task_id]
+                if successor in stuck
+            )
+            cycles = self._analyzer.detect_circular_dependencies(subgraph)
             logger.error(f"Circular dependencies detected: {cycles}")
             raise ValueError(f"Circular dependencies: {cycles}")
 
-        # Get execution batches
-        batches = analyzer.get_execution_batches(graph)
+        edge_count = sum(len(preds) for preds in predecessors.values())
+        logger.info(f"Executing {len(tasks)} tasks, {edge_count} dependencies")
 
-        logger.info(f"Executing {len(tasks)} tasks in {len(batches)} batches")
+        tasks_map = {t.id: t for t in tasks}
+        pending: dict[str, asyncio.Task] = {}
 
-        results: dict[str, Any] = {}
+        async def run_when_ready(task_id: str) -> tuple[str, Any]:
+            """Wait for the task's predecessors, then run it."""
+            waiting_on = [pending[p] for p in predecessors[task_id]]
+            if waiting_on:
+                await asyncio.gather(*waiting_on)
+            return task_id, await self._execute_task(tasks_map[task_id], initial_state)
 
-        # Execute each batch
-        for i, batch in enumerate(batches):
-            logger.info(f"Executing batch {i + 1}/{len(batches)} with {len(batch)} tasks")
+        # Start every task up front in dependency order; each one waits only on
+        # its own predecessors, so a slow task never holds up unrelated ones
+        for level in levels:
+            for task_id in level:
+                pending[task_id] = asyncio.create_task(run_when_ready(task_id))
 
-            # Execute batch in parallel
-            batch_results = await self._execute_batch(tasks, batch, initial_state)
-            results.update(batch_results)
+        results: dict[str, Any] = {}
+        try:
+            for finished in asyncio.as_completed(pending.values()):
+                task_id, result = await finished
+                results[task_id] = result
+                if on_result is not None:
+                    await on_result(task_id, result)
+        finally:
+            # Don't leave tasks running if a callback failed or we were cancelled
+            for task in pending.values():
+                task.cancel()
 
         return results
 
-    async def _execute_batch(
-        self,
-        all_tasks: list[TaskModel],
-        task_ids: list[str],
-        initial_state: Optional[State],
-    ) -> dict[str, Any]:
-        """Execute a batch of tasks in parallel.
+    async def _plan(self, tasks: list[TaskModel]) -> Adjacency:
+        """Get the dependency adjacency for a task set, reusing a cached one.
+
+        The adjacency only depends on task IDs and descriptions, so a
+        resubmitted task set skips dependency extraction. Callers must not
+        mutate it.
+
+        Args:
+            tasks: Tasks to plan
+
+        Returns:
+            Tuple of (successors, predecessors) by task ID
+        """
+        key = tuple(sorted((t.id, t.description) for t in tasks))
+        now = time.monotonic()
+
+        cached = _plan_cache.get(key)
+        if cached is not None:
+            created_at, adjacency = cached
+            if self.plan_cache_ttl is None or now - created_at < self.plan_cache_ttl:
+                _plan_cache.move_to_end(key)
+                return adjacency
+
+        dependencies = await self._analyzer.analyze_task_dependencies(tasks)
+        adjacency = self._analyzer.build_adjacency(dependencies)
+
+        _plan_cache[key] = (now, adjacency)
+        _plan_cache.move_to_end(key)
+        while len(_plan_cache) > PLAN_CACHE_MAX_ENTRIES:
+            _plan_cache.popitem(last=False)
+
+        return adjacency
+
+    async def _execute_task(self, task: TaskModel, initial_state: Optional[State]) -> Any:
+        """Execute a single task once a concurrency slot is free.
 
         Args:
-            all_tasks: All tasks (for lookup)
-            task_ids: Task IDs in this batch
+            task: Task to execute
             initial_state: Initial state
 
         Returns:
-            Results for tasks in this batch
+            Agent result, or an error dict if the task couldn't run
         """
-        tasks_map = {t.task_id: t for t in all_tasks}
-
-        async def execute_single(task_id: str) -> tuple[str, Any]:
-            """Execute a single task with semaphore."""
-            async with self._semaphore:
-                task = tasks_map[task_id]
-                agent = self.agents.get(task.agent_name)
-
-                if not agent:
-                    logger.error(f"Agent not found: {task.agent_name}")
-                    return task_id, {"error": f"Agent not found: {task.agent_name}"}
-
-                try:
-                    result = await agent.execute(
-                        task_description=task.description,
-                        initial_state=initial_state,
-                    )
-                    return task_id, result
-                except Exception as e:
-                    logger.error(f"Task execution failed: {task_id} - {e}")
-                    return task_id, {"error": str(e)}
-
-        # Execute all tasks in the batch concurrently
-        results = await asyncio.gather(
-            *[execute_single(tid) for tid in task_ids],
-            return_exceptions=True,
-        )
+        async with self._semaphore:
+            agent = self.agents.get(task.assigned_agent)
 
-        return dict(results)
+            if not agent:
+                logger.error(f"Agent not found: {task.assigned_agent}")
+                return {"error": f"Agent not found: {task.assigned_agent}"}
+
+            try:
+                return await agent.execute(
+                    task_description=task.description,
+                    initial_state=initial_state,
+                )
+            except Exception as e:
+                logger.error(f"Task execution failed: {task.id} - {e}")
+                return {"error": str(e)}
 
 
 class FIFOQueue:
     """FIFO queue for pending tasks.
 
-    Maintains order of tasks waiting to be executed.
+    Maintains order of tasks waiting to be executed. Removal is O(1): a
+    removed task is dropped from the ticket lookup and its deque entry is
+    skipped when it reaches the front of the queue.
     """
 
     def __init__(self) -> None:
         """Initialize the FIFO queue."""
-        self._queue: list[str] = []
-        self._set: set[str] = set()
+        self._queue: deque[tuple[int, str]] = deque()
+        # Task ID -> ticket of its live queue entry; stale entries don't match
+        self._tickets: dict[str, int] = {}
+        self._next_ticket = 0
 
     def put(self, task_id: str) -> None:
         """Add a task to the queue.
@@ -362,9 +420,10 @@ class FIFOQueue:
         Args:
             task_id: Task ID to add
         """
-        if task_id not in self._set:
-            self._queue.append(task_id)
-            self._set.add(task_id)
+        if task_id not in self._tickets:
+            self._queue.append((self._next_ticket, task_id))
+            self._tickets[task_id] = self._next_ticket
+            self._next_ticket += 1
 
     def get(self) -> Optional[str]:
         """Get the next task from the queue.
@@ -372,11 +431,12 @@ class FIFOQueue:
         Returns:
             Task ID or None if queue is empty
         """
-        if not self._queue:
+        task_id = self.peek()
+        if task_id is None:
             return None
 
-        task_id = self._queue.pop(0)
-        self._set.remove(task_id)
+        self._queue.popleft()
+        del self._tickets[task_id]
         return task_id
 
     def peek(self) -> Optional[str]:
@@ -385,7 +445,13 @@ class FIFOQueue:
         Returns:
             Next task ID or None if queue is empty
         """
-        return self._queue[0] if self._queue else None
+        while self._queue:
+            ticket, task_id = self._queue[0]
+            if self._tickets.get(task_id) == ticket:
+                return task_id
+            # Entry for a removed task
+            self._queue.popleft()
+        return None
 
     def remove(self, task_id: str) -> bool:
         """Remove a task from the queue.
@@ -396,20 +462,86 @@ class FIFOQueue:
         Returns:
             True if removed, False if not in queue
         """
-        if task_id not in self._set:
+        if self._tickets.pop(task_id, None) is None:
             return False
 
-        self._queue.remove(task_id)
-        self._set.remove(task_id)
+        # Drop entries for removed tasks once they outnumber the live ones
+        if len(self._queue) > 2 * len(self._tickets) + 1:
+            self._queue = deque(
+                entry for entry in self._queue if self._tickets.get(entry[1]) == entry[0]
+            )
         return True
 
     def __len__(self) -> int:
         """Get queue length."""
-        return len(self._queue)
+        return len(self._tickets)
 
     def __contains__(self, task_id: str) -> bool:
         """Check if task is in queue."""
-        return task_id in self._set
+        return task_id in self._tickets
+
+
+def _execution_levels(
+    successors: Mapping[str, Iterable[str]],
+    indegree: dict[str, int],
+) -> tuple[list[list[str]], list[str]]:
+    """Group tasks into dependency levels with Kahn's algorithm.
+
+    A level is every task whose predecessors are all in earlier levels.
+
+    Args:
+        successors: Successor task IDs by task ID
+        indegree: Predecessor count by task ID; consumed by the walk
+
+    Returns:
+        Tuple of (levels, unresolved task IDs); tasks are unresolved when
+        they are on or behind a cycle
+    """
+    frontier = [task_id for task_id, degree in indegree.items() if degree == 0]
+    levels: list[list[str]] = []
+    scheduled = 0
+
+    while frontier:
+        levels.append(frontier)
+        scheduled += len(frontier)
+        next_frontier = []
+        for task_id in frontier:
+            for successor in successors[task_id]:
+                indegree[successor] -= 1
+                if indegree[successor] == 0:
+                    next_frontier.append(successor)
+        frontier = next_frontier
+
+    if scheduled == len(indegree):
+        return levels, []
+    return levels, [task_id for task_id, degree in indegree.items() if degree > 0]
+
+
+def _keyword_objects(keywords: tuple[str, ...], description: str) -> list[str]:
+    """Extract the word following the first occurrence of each keyword.
+
+    Args:
+        keywords: Keywords to look for, each ending in a space
+        description: Task description
+
+    Returns:
+        Lowercased objects in keyword order, trailing punctuation removed
+    """
+    description = description.lower()
+    objects = []
+
+    for keyword in keywords:
+        index = description.find(keyword)
+        if index == -1:
+            continue
+        # Read the object in place rather than splitting the whole description
+        match = _NEXT_WORD_RE.match(description, index + len(keyword))
+        if match:
+            obj = match.group(1).strip(".,;")
+            if obj:
+                objects.append(obj)
+
+    return objects
 
 
 async def analyze_and_execute_parallel(
@@ -417,6 +549,7 @@ async def analyze_and_execute_parallel(
     agents: dict[str, BaseAgent],
     tool_executor: Optional[ToolExecutor] = None,
     max_concurrent: int = 100,
+    plan_cache_ttl: Optional[float] = None,
 ) -> dict[str, Any]:
     """Analyze dependencies and execute tasks in parallel.
 
@@ -427,9 +560,10 @@ async def analyze_and_execute_parallel(
         agents: Available agents
         tool_executor: Tool executor
         max_concurrent: Maximum concurrent tasks
+        plan_cache_ttl: Seconds a cached dependency graph stays valid
 
     Returns:
         Task results by task ID
     """
-    executor = ParallelExecutor(agents, tool_executor, max_concurrent)
+    executor = ParallelExecutor(agents, tool_executor, max_concurrent, plan_cache_ttl)
     return await executor.execute_tasks(tasks)
@@ -11,6 +11,7 @@ import yaml
 
 from ..agent import BaseAgent
 from ..agent.patterns import ChainOfThoughtPattern, Pattern, ReActPattern, ReflectionPattern
+from ..config.loader import YAMLLoader
 from ..config.paths import get_default_config_dir
 from ..config.schemas import WorkflowConfig
 from ..models import State, Workflow
@@ -197,8 +198,8 @@ def load_workflow_from_file(file_path: Path) -> Workflow:
         raise FileNotFoundError(f"Workflow file not found: {file_path}")
 
     try:
-        data = yaml.safe_load(file_path.read_text(encoding="utf-8"))
-        config = WorkflowConfig(**data)
+        data = yaml.load(file_path.read_text(encoding="utf-8"), Loader=YAMLLoader)
+        config = WorkflowConfig.model_validate(data)
         return config.to_workflow()
     except Exception as e:
         raise ValueError(f"Failed to load workflow from {file_path}: {e}")
@@ -6,7 +6,7 @@ This module defines the SubAgentSession entity for isolated sub-agent conversati
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from .state import Message
 
@@ -39,6 +39,9 @@ class SubAgentSession(BaseModel):
     status: str = Field(default="running", description="Session status (running/completed/failed)")
     created_at: datetime = Field(default_factory=datetime.now, description="Session creation timestamp")
 
+    # Summary messages keyed by (status, message count, include_details)
+    _summary_cache: dict[tuple[str, int, bool], Message] = PrivateAttr(default_factory=dict)
+
     def add_message(self, message: Message) -> None:
         """Add a message to the session history.
 
@@ -55,6 +58,7 @@ class SubAgentSession(BaseModel):
         """
         self.status = "completed"
         self.summary = summary
+        self._summary_cache.clear()
 
     def fail(self, error: str) -> None:
         """Mark the session as failed.
@@ -64,6 +68,7 @@ class SubAgentSession(BaseModel):
         """
         self.status = "failed"
         self.summary = f"Failed: {error}"
+        self._summary_cache.clear()
 
     @property
     def message_count(self) -> int:
@@ -3,10 +3,11 @@
 This module defines the State entity representing the shared execution context.
 """
 
+import json
 from datetime import datetime
 from typing import Any, Optional
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 
 class ToolCall(BaseModel):
@@ -26,6 +27,18 @@ class ToolCall(BaseModel):
     tool: str = Field(..., description="Tool name")
     arguments: dict[str, Any] = Field(default_factory=dict, description="Tool parameters")
 
+    def arguments_json(self) -> str:
+        """Get the JSON-serialized tool arguments.
+
+        Serialized on every call rather than memoized: arguments can be
+        replaced by model_copy(update=...) or mutated in place, and a cached
+        string would then send stale arguments to the LLM.
+
+        Returns:
+            JSON string of the arguments
+        """
+        return json.dumps(self.arguments)
+
 
 class Message(BaseModel):
     """Represents a message in the conversation history.
@@ -42,13 +55,21 @@ class Message(BaseModel):
     tool_calls: list[ToolCall] = Field(default_factory=list, description="Tool invocations")
     timestamp: datetime = Field(default_factory=datetime.now, description="Message timestamp")
 
+    _is_assistant: bool = PrivateAttr(default=False)
+    _is_system: bool = PrivateAttr(default=False)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Precompute role flags used by the per-turn predicates."""
+        self._is_assistant = self.role == "assistant"
+        self._is_system = self.role == "system"
+
     def is_from_assistant(self) -> bool:
         """Check if this message is from the assistant.
 
         Returns:
             True if role is "assistant"
         """
-        return self.role == "assistant"
+        return self._is_assistant
 
     def is_from_user(self) -> bool:
         """Check if this message is from the user.
@@ -72,7 +93,7 @@ class Message(BaseModel):
         Returns:
             True if role is "system"
         """
-        return self.role == "system"
+        return self._is_system
 
 
 class State(BaseModel):
@@ -95,6 +116,9 @@ class State(BaseModel):
     routing_key: Optional[str] = Field(None, description="Key for conditional routing")
     metadata: dict[str, Any] = Field(default_factory=dict, description="Additional context")
 
+    # (indexed messages list, indexed length, system message indices, last assistant index)
+    _message_index: Optional[tuple[list[Message], int, tuple[int, ...], int]] = PrivateAttr(default=None)
+
     def add_message(self, message: Message) -> "State":
         """Add a message to the state.
 
@@ -104,9 +128,7 @@ class State(BaseModel):
         Returns:
             Updated state (immutable pattern)
         """
-        updated_messages = list(self.messages)
-        updated_messages.append(message)
-        return self.model_copy(update={"messages": updated_messages})
+        return self.add_messages([message])
 
     def add_messages(self, messages: list[Message]) -> "State":
         """Add multiple messages to the state.
@@ -119,7 +141,65 @@ class State(BaseModel):
         """
         updated_messages = list(self.messages)
         updated_messages.extend(messages)
-        return self.model_copy(update={"messages": updated_messages})
+        updated = self.model_copy(update={"messages": updated_messages})
+
+        # Extend the role index incrementally instead of rescanning the history
+        system_indices, last_assistant_index = self._get_message_index()
+        offset = len(self.messages)
+        new_system_indices = tuple(offset + i for i, m in enumerate(messages) if m.is_system())
+        for i in range(len(messages) - 1, -1, -1):
+            if messages[i].is_from_assistant():
+                last_assistant_index = offset + i
+                break
+        updated._message_index = (
+            updated_messages,
+            len(updated_messages),
+            system_indices + new_system_indices,
+            last_assistant_index,
+        )
+        return updated
+
+    def _get_message_index(self) -> tuple[tuple[int, ...], int]:
+        """Get the system message indices and the last assistant message index.
+
+        The index is rebuilt only when the messages list was replaced or
+        modified outside of add_message(s).
+
+        Returns:
+            Tuple of (system message indices, last assistant index or -1)
+        """
+        index = self._message_index
+        messages = self.messages
+        if index is None or index[0] is not messages or index[1] != len(messages):
+            system_indices = tuple(i for i, m in enumerate(messages) if m.is_system())
+            last_assistant_index = -1
+            for i in range(len(messages) - 1, -1, -1):
+                if messages[i].is_from_assistant():
+                    last_assistant_index = i
+                    break
+            index = (messages, len(messages), system_indices, last_assistant_index)
+            self._message_index = index
+        return index[2], index[3]
+
+    @property
+    def system_messages(self) -> list[Message]:
+        """Get all system messages in order.
+
+        Returns:
+            List of system messages
+        """
+        system_indices, _ = self._get_message_index()
+        return [self.messages[i] for i in system_indices]
+
+    @property
+    def last_assistant_message(self) -> Optional[Message]:
+        """Get the most recent assistant message.
+
+        Returns:
+            Last assistant message or None if there is none
+        """
+        _, last_assistant_index = self._get_message_index()
+        return self.messages[last_assistant_index] if last_assistant_index >= 0 else None
 
     def update(self, **kwargs: Any) -> "State":
         """Update state fields (except messages, which are appended).
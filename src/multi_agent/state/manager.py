@@ -68,14 +68,15 @@ class StateManager:
         """
         return self.task_dir / "messages.json"
 
-    def save_state(self, state: State) -> None:
+    def save_state(self, state: State, serialized: Optional[str] = None) -> None:
         """Save state to disk (incremental save).
 
         Args:
             state: State to save
+            serialized: JSON already produced for state, written as-is
         """
         with self._lock:
-            self.serializer.save(state, self.state_file)
+            self.serializer.save(state, self.state_file, serialized)
 
     def load_state(self) -> Optional[State]:
         """Load state from disk.
@@ -166,6 +167,21 @@ class StateManager:
             path = session_dir / f"{session.session_id}.json"
             self.serializer.save(session, path)
 
+    def save_sessions_batch(self, sessions: list[SubAgentSession]) -> None:
+        """Save several sub-agent sessions to disk under a single lock.
+
+        Args:
+            sessions: Sessions to save
+        """
+        if not sessions:
+            return
+
+        with self._lock:
+            session_dir = self.task_dir / "sessions"
+            session_dir.mkdir(exist_ok=True)
+            for session in sessions:
+                self.serializer.save(session, session_dir / f"{session.session_id}.json")
+
     def load_session(self, session_id: str) -> Optional[SubAgentSession]:
         """Load a sub-agent session from disk.
 
@@ -6,7 +6,7 @@ This module provides serialization and deserialization of state objects.
 import json
 from datetime import datetime
 from pathlib import Path
-from typing import Any, TypeVar
+from typing import Any, Optional, TypeVar
 
 from pydantic import BaseModel
 
@@ -184,12 +184,14 @@ class FileStateSerializer:
         self,
         state: State | Task | Checkpoint | SubAgentSession,
         file_path: Path | str,
+        serialized: Optional[str] = None,
     ) -> None:
         """Save state to a file.
 
         Args:
             state: State object to save
             file_path: Path to save the file
+            serialized: JSON already produced for state, written as-is
         """
         path = Path(file_path)
 
@@ -203,7 +205,9 @@ class FileStateSerializer:
 
         # Write to temporary file first, then rename (atomic operation)
         temp_path = path.with_suffix(f"{path.suffix}.tmp")
-        temp_path.write_text(StateSerializer.serialize(state), encoding="utf-8")
+        if serialized is None:
+            serialized = StateSerializer.serialize(state)
+        temp_path.write_text(serialized, encoding="utf-8")
         temp_path.replace(path)
 
     def load(
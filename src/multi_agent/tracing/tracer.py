@@ -37,6 +37,7 @@ class Tracer:
         self.task_id = task_id
         self.state_manager = state_manager
         self.trace = TraceLog(task_id=task_id)
+        self._unsaved = False
 
     def log_step(
         self,
@@ -114,6 +115,7 @@ class Tracer:
         agent: str,
         message_count: int,
         status: str,
+        save: bool = True,
     ) -> None:
         """Log a sub-agent session.
 
@@ -122,6 +124,8 @@ class Tracer:
             agent: Sub-agent name
             message_count: Number of messages in session
             status: Session status
+            save: Save the trace now; if False, the record is kept in memory
+                until the next save or flush()
         """
         info = SubAgentSessionInfo(
             session_id=session_id,
@@ -131,7 +135,15 @@ class Tracer:
         )
 
         self.trace.add_sub_agent_session(session_id, info)
-        self._save_incremental()
+        if save:
+            self._save_incremental()
+        else:
+            self._unsaved = True
+
+    def flush(self) -> None:
+        """Save the trace if records were logged without saving."""
+        if self._unsaved:
+            self._save_incremental()
 
     def get_trace(self) -> TraceLog:
         """Get the current trace log.
@@ -151,7 +163,7 @@ class Tracer:
             trace_file = self.state_manager.task_dir / "trace.json"
             if trace_file.exists():
                 data = json.loads(trace_file.read_text(encoding="utf-8"))
-                return TraceLog(**data)
+                return TraceLog.model_validate(data)
         except Exception as e:
             logger.error(f"Error loading trace: {e}")
 
@@ -162,6 +174,7 @@ class Tracer:
         try:
             trace_file = self.state_manager.task_dir / "trace.json"
             trace_file.write_text(self.trace.model_dump_json(indent=2), encoding="utf-8")
+            self._unsaved = False
         except Exception as e:
             logger.error(f"Error saving trace: {e}")
 
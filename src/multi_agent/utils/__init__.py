@@ -1,5 +1,7 @@
 """Utility modules for multi-agent framework."""
 
+from .env import env_number
+from .eventloop import install_uvloop
 from .id import (
     extract_task_id,
     generate_checkpoint_id,
@@ -15,6 +17,7 @@ from .retry import (
     is_retryable_error,
     retry_with_exponential_backoff,
 )
+from .serialization import json_dumps, json_loads
 from .timeout import TimeoutContext, TimeoutError, async_timeout, execute_with_timeout_retry, timeout
 
 __all__ = [
@@ -36,6 +39,13 @@ __all__ = [
     "TimeoutContext",
     "TimeoutError",
     "execute_with_timeout_retry",
+    # Serialization
+    "json_loads",
+    "json_dumps",
+    # Environment
+    "env_number",
+    # Event loop
+    "install_uvloop",
     # Logging
     "setup_logging",
     "get_logger",
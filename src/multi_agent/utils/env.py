@@ -0,0 +1,35 @@
+"""Environment variable utilities for multi-agent framework.
+
+This module provides parsing for settings that can be tuned from the environment.
+"""
+
+import os
+from collections.abc import Callable
+from typing import TypeVar
+
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+def env_number(name: str, default: T, parse: Callable[[str], T]) -> T:
+    """Read a numeric setting from the environment.
+
+    Args:
+        name: Environment variable name
+        default: Value used when the variable is unset, empty or malformed
+        parse: Converter such as int or float
+
+    Returns:
+        Parsed value, or the default
+    """
+    value = os.environ.get(name)
+    if not value:
+        return default
+    try:
+        return parse(value)
+    except ValueError:
+        logger.warning(f"Ignoring invalid {name}={value!r}, using {default}")
+        return default
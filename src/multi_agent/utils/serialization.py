@@ -0,0 +1,51 @@
+"""JSON serialization utilities for multi-agent framework.
+
+This module provides JSON helpers that use orjson when it is installed and
+fall back to the standard library otherwise.
+"""
+
+import json
+from collections.abc import Callable
+from typing import Any, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+
+def json_loads(data: str | bytes) -> Any:
+    """Parse a JSON document.
+
+    Args:
+        data: JSON text or UTF-8 encoded bytes (bytes skip a decode step with orjson)
+
+    Returns:
+        Parsed Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(
+    obj: Any,
+    indent: bool = False,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> str:
+    """Serialize an object to a JSON string.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with two-space indentation
+        default: Fallback serializer for unsupported types
+
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=default, option=option).decode("utf-8")
+    return json.dumps(obj, indent=2 if indent else None, default=default, ensure_ascii=False)
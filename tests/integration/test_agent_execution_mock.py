@@ -201,3 +201,51 @@ class TestAgentStateManagementWithMock:
 
             assert result.state.metadata.get("user_id") == "test_user"
             assert result.state.metadata.get("session_id") == "123"
+
+
+class TestAgentToolDefinitionsWithMock:
+    """Integration tests for tool definition preparation."""
+
+    @pytest.fixture
+    def tool_executor(self):
+        """Create a tool executor with a single MCP tool."""
+        from multi_agent.models import Tool
+        from multi_agent.tools import BuiltinRegistry, MCPToolManager, ToolExecutor
+
+        manager = MCPToolManager()
+        manager.tools["search_server:search"] = Tool(
+            name="search",
+            server="search_server",
+            description="Search the web",
+            input_schema={"type": "object", "properties": {}},
+        )
+        return ToolExecutor(manager=manager, builtin_registry=BuiltinRegistry())
+
+    def test_tools_built_once_at_construction(self, llm_config, tool_executor):
+        """Test tool definitions are prepared when the agent is created."""
+        agent = Agent(
+            name="searcher",
+            role="Searcher",
+            system_prompt="You search.",
+            llm_config=llm_config,
+            tools=["search"],
+        )
+
+        base_agent = BaseAgent(agent=agent, tool_executor=tool_executor)
+
+        tools = base_agent._prepare_tools()
+        assert [t["function"]["name"] for t in tools] == ["search"]
+        assert base_agent._prepare_tools() is tools
+
+    def test_unknown_tool_fails_fast(self, llm_config, tool_executor):
+        """Test an unregistered tool name raises at construction."""
+        agent = Agent(
+            name="searcher",
+            role="Searcher",
+            system_prompt="You search.",
+            llm_config=llm_config,
+            tools=["search", "missing_tool"],
+        )
+
+        with pytest.raises(ValueError, match="missing_tool"):
+            BaseAgent(agent=agent, tool_executor=tool_executor)
@@ -0,0 +1,119 @@
+"""Unit tests for checkpoint CLI commands."""
+
+import asyncio
+import json
+from datetime import datetime
+
+import pytest
+from click.testing import CliRunner
+
+from multi_agent.cli import checkpoint as checkpoint_module
+from multi_agent.cli.checkpoint import checkpoint_cli
+from multi_agent.execution import hitl as hitl_module
+from multi_agent.execution.hitl import (
+    CheckpointMetadata,
+    list_all_checkpoints,
+    list_all_checkpoints_async,
+)
+from multi_agent.models import State
+
+
+@pytest.fixture
+def checkpoints_dir(tmp_path, monkeypatch):
+    """Point the checkpoint CLI at a temporary config directory."""
+    monkeypatch.setattr(checkpoint_module, "get_default_config_dir", lambda: tmp_path)
+    monkeypatch.setattr(hitl_module, "get_default_config_dir", lambda: tmp_path)
+    directory = tmp_path / "tasks" / "task-1" / "checkpoints"
+    directory.mkdir(parents=True)
+    return directory
+
+
+def write_checkpoint(checkpoints_dir, checkpoint_id: str, sequence_number: int, **kwargs) -> None:
+    """Write a checkpoint metadata file."""
+    metadata = CheckpointMetadata(
+        checkpoint_id=checkpoint_id,
+        task_id="task-1",
+        sequence_number=sequence_number,
+        node_name="review",
+        state=State(current_agent="agent"),
+        created_at=datetime(2024, 1, 2, 3, 4, 5),
+        **kwargs,
+    )
+    (checkpoints_dir / f"{checkpoint_id}.json").write_text(metadata.model_dump_json(indent=2), encoding="utf-8")
+
+
+class TestCheckpointList:
+    """Tests for the checkpoint list command."""
+
+    def test_list_renders_rows_in_batches(self, checkpoints_dir, monkeypatch):
+        """Test every checkpoint is listed when rows span several batches."""
+        monkeypatch.setattr(checkpoint_module, "LIST_BATCH_SIZE", 2)
+        for seq in range(1, 4):
+            write_checkpoint(checkpoints_dir, f"cp-{seq}", seq, human_feedback="x" * 40 if seq == 1 else None)
+
+        result = CliRunner().invoke(checkpoint_cli, ["list", "task-1"])
+
+        assert result.exit_code == 0
+        assert result.output.count("Checkpoint ID") == 1
+        for seq in range(1, 4):
+            assert f"cp-{seq}" in result.output
+        assert "x" * 30 + "..." in result.output
+        assert "2024-01-02 03:04:05" in result.output
+
+    def test_list_json_output(self, checkpoints_dir):
+        """Test --json emits the checkpoint metadata as a JSON array."""
+        write_checkpoint(checkpoints_dir, "cp-1", 1, human_feedback="Looks good")
+
+        result = CliRunner().invoke(checkpoint_cli, ["list", "task-1", "--json"])
+
+        assert result.exit_code == 0
+        data = json.loads(result.output)
+        assert [c["checkpoint_id"] for c in data] == ["cp-1"]
+        assert data[0]["human_feedback"] == "Looks good"
+        assert data[0]["created_at"] == "2024-01-02T03:04:05"
+
+    def test_table_listing_skips_state_validation(self, checkpoints_dir):
+        """Test the table is built from summaries without validating checkpoint state."""
+        write_checkpoint(checkpoints_dir, "cp-1", 1)
+        data = json.loads((checkpoints_dir / "cp-1.json").read_text(encoding="utf-8"))
+        data["state"] = {"unexpected": "shape"}
+        (checkpoints_dir / "cp-1.json").write_text(json.dumps(data), encoding="utf-8")
+
+        result = CliRunner().invoke(checkpoint_cli, ["list", "task-1"])
+
+        assert result.exit_code == 0
+        assert "cp-1" in result.output
+        assert "review" in result.output
+
+    def test_list_skips_unreadable_checkpoints(self, checkpoints_dir):
+        """Test a corrupt file doesn't stop the other checkpoints being listed."""
+        write_checkpoint(checkpoints_dir, "cp-2", 2)
+        write_checkpoint(checkpoints_dir, "cp-1", 1)
+        (checkpoints_dir / "broken.json").write_text("{not json", encoding="utf-8")
+
+        checkpoints = asyncio.run(list_all_checkpoints_async("task-1"))
+
+        assert [c.checkpoint_id for c in checkpoints] == ["cp-1", "cp-2"]
+        assert checkpoints == list_all_checkpoints("task-1")
+
+class TestCheckpointDelete:
+    """Tests for checkpoint deletion commands."""
+
+    def test_delete_all_matching_pattern(self, checkpoints_dir):
+        """Test delete-all removes only checkpoints matching the pattern."""
+        for checkpoint_id in ["keep-1", "drop-1", "drop-2"]:
+            (checkpoints_dir / f"{checkpoint_id}.json").write_text("{}", encoding="utf-8")
+        (checkpoints_dir / ".sequence").write_text("3", encoding="utf-8")
+
+        result = CliRunner().invoke(checkpoint_cli, ["delete-all", "task-1", "--pattern", "drop-*", "--yes"])
+
+        assert result.exit_code == 0
+        assert "Deleted 2 of 2" in result.output
+        assert sorted(p.name for p in checkpoints_dir.iterdir()) == [".sequence", "keep-1.json"]
+
+    def test_delete_all_no_match(self, checkpoints_dir):
+        """Test delete-all reports when nothing matches."""
+        result = CliRunner().invoke(checkpoint_cli, ["delete-all", "task-1", "--pattern", "none-*", "--yes"])
+
+        assert result.exit_code == 0
+        assert "No checkpoints matching" in result.output
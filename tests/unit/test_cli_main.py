@@ -0,0 +1,174 @@
+"""Unit tests for the main CLI entry point."""
+
+import json
+import subprocess
+import sys
+from datetime import datetime
+from types import SimpleNamespace
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from multi_agent.cli.main import main
+
+
+class TestLazyGroup:
+    """Tests for lazily registered subcommands."""
+
+    def test_help_lists_lazy_subcommands(self):
+        """Test lazy command groups appear in the top-level help."""
+        result = CliRunner().invoke(main, ["--help"])
+
+        assert result.exit_code == 0
+        for name in ["agents", "checkpoint", "task", "trace", "workflows"]:
+            assert name in result.output
+
+    def test_lazy_subcommand_resolves(self):
+        """Test a lazy command group is imported and invoked on demand."""
+        ctx = click.Context(main)
+        command = main.get_command(ctx, "checkpoint")
+
+        assert isinstance(command, click.Group)
+        assert "delete-all" in command.commands
+
+        result = CliRunner().invoke(main, ["checkpoint", "--help"])
+        assert result.exit_code == 0
+        assert "Checkpoint management commands." in result.output
+
+    def test_cli_import_skips_core_modules(self):
+        """Test importing the CLI doesn't load models or execution."""
+        code = (
+            "import sys, multi_agent.cli.main; "
+            "print(sorted(m for m in ('multi_agent.models', 'multi_agent.execution') if m in sys.modules))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+        assert result.stdout.strip() == "[]"
+
+    def test_execution_exports_load_only_their_submodule(self):
+        """Test importing one execution helper doesn't import the orchestrator."""
+        code = (
+            "import sys; from multi_agent.execution import load_workflow_from_file; "
+            "print(sorted(m for m in sys.modules if m.startswith('multi_agent.execution.')))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+        assert result.stdout.strip() == "['multi_agent.execution.workflow']"
+
+
+class TestCleanup:
+    """Tests for the cleanup command."""
+
+    def test_dry_run_reports_old_tasks_with_size(self, tmp_path, monkeypatch):
+        """Test dry run lists expired tasks with the size of all their files."""
+        monkeypatch.setattr("multi_agent.config.paths.get_default_config_dir", lambda: tmp_path)
+        old_task = tmp_path / "tasks" / "task-old"
+        (old_task / "sessions").mkdir(parents=True)
+        (old_task / "task.json").write_text(
+            json.dumps({"created_at": "2000-01-01T00:00:00"}).ljust(1024), encoding="utf-8"
+        )
+        (old_task / "sessions" / "s1.json").write_text("x" * 1024, encoding="utf-8")
+        new_task = tmp_path / "tasks" / "task-new"
+        new_task.mkdir()
+        (new_task / "task.json").write_text(
+            json.dumps({"created_at": datetime.now().isoformat()}), encoding="utf-8"
+        )
+
+        result = CliRunner().invoke(main, ["cleanup", "--seconds", "3600", "--dry-run"])
+
+        assert result.exit_code == 0
+        assert "Would delete: task-old (2.0 KB)" in result.output
+        assert "task-new" not in result.output
+        assert old_task.exists()
+
+    def test_deletes_expired_task_trees(self, tmp_path, monkeypatch):
+        """Test expired task directories are removed with their nested files."""
+        monkeypatch.setattr("multi_agent.config.paths.get_default_config_dir", lambda: tmp_path)
+        for index in range(3):
+            task_dir = tmp_path / "tasks" / f"task-{index}"
+            (task_dir / "sessions" / "nested").mkdir(parents=True)
+            (task_dir / "task.json").write_text(
+                json.dumps({"created_at": "2000-01-01T00:00:00"}).ljust(512), encoding="utf-8"
+            )
+            (task_dir / "sessions" / "nested" / "s1.json").write_text("x" * 512, encoding="utf-8")
+        kept = tmp_path / "tasks" / "task-new"
+        kept.mkdir()
+        (kept / "task.json").write_text(json.dumps({"created_at": datetime.now().isoformat()}), encoding="utf-8")
+
+        result = CliRunner().invoke(main, ["cleanup", "--seconds", "3600"])
+
+        assert result.exit_code == 0
+        assert "Deleted 3 tasks (3.0 KB freed)" in result.output
+        assert sorted(p.name for p in (tmp_path / "tasks").iterdir()) == ["task-new"]
+
+
+class TestAgents:
+    """Tests for the agents command."""
+
+    def test_list_reads_summary_fields_without_validation(self, tmp_path, monkeypatch):
+        """Test the listing shows name, role and model straight from the YAML."""
+        monkeypatch.setattr("multi_agent.config.paths.get_default_config_dir", lambda: tmp_path)
+        monkeypatch.setattr(
+            "multi_agent.config.loader.validate_agent_config",
+            lambda data: pytest.fail("agent list should not validate configs"),
+        )
+        agents_dir = tmp_path / "agents"
+        agents_dir.mkdir()
+        (agents_dir / "researcher.yaml").write_text(
+            "name: researcher\nrole: Research Assistant\nllm_config:\n  model: gpt-4\n",
+            encoding="utf-8",
+        )
+        (agents_dir / "broken.yaml").write_text("name: broken\n", encoding="utf-8")
+
+        result = CliRunner().invoke(main, ["agents", "--format", "json"])
+
+        assert result.exit_code == 0
+        assert json.loads(result.output) == [
+            {"name": "researcher", "role": "Research Assistant", "model": "gpt-4"}
+        ]
+
+
+class TestWorkflows:
+    """Tests for the workflows command."""
+
+    def test_list_includes_yaml_and_yml_files(self, tmp_path, monkeypatch):
+        """Test workflows in both YAML extensions are listed."""
+        monkeypatch.setattr("multi_agent.config.paths.get_default_config_dir", lambda: tmp_path)
+        monkeypatch.setattr(
+            "multi_agent.execution.load_workflow_from_file",
+            lambda path: SimpleNamespace(name=path.stem, patterns=[], node_count=1),
+        )
+        monkeypatch.setattr("multi_agent.execution.validate_workflow", lambda workflow: [])
+        workflows_dir = tmp_path / "workflows"
+        workflows_dir.mkdir()
+        (workflows_dir / "second.yml").write_text("name: second\n", encoding="utf-8")
+        (workflows_dir / "first.yaml").write_text("name: first\n", encoding="utf-8")
+        (workflows_dir / "notes.txt").write_text("not a workflow", encoding="utf-8")
+
+        result = CliRunner().invoke(main, ["workflows", "--format", "json"])
+
+        assert result.exit_code == 0
+        assert [w["name"] for w in json.loads(result.output)] == ["first", "second"]
+
+    def test_list_limit_stops_loading_early(self, tmp_path, monkeypatch):
+        """Test --limit caps the listing and skips loading the remaining files."""
+        monkeypatch.setattr("multi_agent.config.paths.get_default_config_dir", lambda: tmp_path)
+        loaded = []
+
+        def fake_load(path):
+            loaded.append(path.stem)
+            return SimpleNamespace(name=path.stem, patterns=[], node_count=1)
+
+        monkeypatch.setattr("multi_agent.execution.load_workflow_from_file", fake_load)
+        monkeypatch.setattr("multi_agent.execution.validate_workflow", lambda workflow: [])
+        workflows_dir = tmp_path / "workflows"
+        workflows_dir.mkdir()
+        for name in ["a", "b", "c"]:
+            (workflows_dir / f"{name}.yaml").write_text(f"name: {name}\n", encoding="utf-8")
+
+        result = CliRunner().invoke(main, ["workflows", "--format", "json", "--limit", "2"])
+
+        assert result.exit_code == 0
+        assert [w["name"] for w in json.loads(result.output)] == ["a", "b"]
+        assert loaded == ["a", "b"]
@@ -0,0 +1,66 @@
+"""Unit tests for task CLI commands."""
+
+import json
+import os
+
+import pytest
+from click.testing import CliRunner
+
+from multi_agent.cli import task as task_module
+from multi_agent.cli.task import _format_created, task_cli
+
+
+@pytest.fixture
+def tasks_dir(tmp_path, monkeypatch):
+    """Point the task CLI at a temporary config directory."""
+    monkeypatch.setattr(task_module, "get_default_config_dir", lambda: tmp_path)
+    directory = tmp_path / "tasks"
+    directory.mkdir()
+    return directory
+
+
+def write_task(tasks_dir, task_id: str, mtime: int, **fields) -> None:
+    """Write a task.json file with a fixed modification time."""
+    task_dir = tasks_dir / task_id
+    task_dir.mkdir()
+    data = {"task_id": task_id, "status": "completed", "agent_name": "researcher", **fields}
+    (task_dir / "task.json").write_text(json.dumps(data), encoding="utf-8")
+    os.utime(task_dir, (mtime, mtime))
+
+
+class TestTaskList:
+    """Tests for the task list command."""
+
+    def test_list_filters_newest_first_and_stops_at_limit(self, tasks_dir, monkeypatch):
+        """Test filtering, ordering and that tasks past the limit aren't read."""
+        write_task(tasks_dir, "task-old", 1000)
+        write_task(tasks_dir, "task-failed", 2000, status="failed")
+        write_task(tasks_dir, "task-mid", 3000)
+        write_task(tasks_dir, "task-new", 4000)
+
+        read_tasks = []
+        original_iter = task_module._iter_tasks
+
+        def tracking_iter(directory):
+            for data in original_iter(directory):
+                read_tasks.append(data["task_id"])
+                yield data
+
+        monkeypatch.setattr(task_module, "_iter_tasks", tracking_iter)
+
+        result = CliRunner().invoke(task_cli, ["list", "--status", "completed", "--limit", "2", "--json"])
+
+        assert result.exit_code == 0
+        assert [t["task_id"] for t in json.loads(result.output)["tasks"]] == ["task-new", "task-mid"]
+        assert read_tasks == ["task-new", "task-mid"]
+
+    @pytest.mark.parametrize("created, expected", [
+        ("2024-01-02T03:04:05.123456", "2024-01-02 03:04"),
+        ("2024-01-02 03:04:05+00:00", "2024-01-02 03:04"),
+        ("2024-01-02", "2024-01-02 00:00"),
+        ("not a date", "not a date"),
+        ("", ""),
+    ])
+    def test_format_created(self, created, expected):
+        """Test creation times are shortened to minutes."""
+        assert _format_created(created) == expected
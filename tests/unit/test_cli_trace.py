@@ -0,0 +1,170 @@
+"""Unit tests for trace CLI commands."""
+
+import os
+
+import pytest
+from click.testing import CliRunner
+
+from multi_agent.cli import trace as trace_module
+from multi_agent.cli.trace import trace_cli
+from multi_agent.models import TraceLog
+from multi_agent.models.tracer import StepRecord, ToolCallRecord
+
+
+@pytest.fixture
+def tasks_dir(tmp_path, monkeypatch):
+    """Point the trace CLI at a temporary config directory."""
+    monkeypatch.setattr(trace_module, "get_default_config_dir", lambda: tmp_path)
+    directory = tmp_path / "tasks"
+    directory.mkdir()
+    return directory
+
+
+def write_trace(tasks_dir, task_id: str, steps: list[StepRecord]) -> None:
+    """Write a trace.json file for a task."""
+    task_dir = tasks_dir / task_id
+    task_dir.mkdir()
+    trace = TraceLog(task_id=task_id, steps=steps)
+    (task_dir / "trace.json").write_text(trace.model_dump_json(indent=2), encoding="utf-8")
+
+
+class TestTraceSearch:
+    """Tests for the trace search command."""
+
+    @pytest.fixture
+    def traces(self, tasks_dir):
+        """Write one trace with a failing tool call and one clean trace."""
+        write_trace(tasks_dir, "task-failing", [
+            StepRecord(step_name="plan", message="Planning", agent="researcher"),
+            StepRecord(
+                step_name="search",
+                message="Searching",
+                agent="researcher",
+                tool_calls=[ToolCallRecord(server="web", tool="search", error="timeout")],
+            ),
+        ])
+        write_trace(tasks_dir, "task-clean", [
+            StepRecord(
+                step_name="write",
+                message="Writing",
+                agent="writer",
+                tool_calls=[ToolCallRecord(server="fs", tool="write_file")],
+            ),
+        ])
+
+    def test_search_by_tool_and_errors(self, traces):
+        """Test tool and error filters select only matching traces."""
+        result = CliRunner().invoke(trace_cli, ["search", "--tool", "web:search", "--errors"])
+
+        assert result.exit_code == 0
+        assert "task-failing" in result.output
+        assert "task-clean" not in result.output
+
+    def test_non_matching_traces_are_not_validated(self, traces, monkeypatch):
+        """Test traces ruled out by the raw pre-filter skip model validation."""
+        validated = []
+
+        original_validate = TraceLog.model_validate
+
+        def tracking_validate(data):
+            validated.append(data["task_id"])
+            return original_validate(data)
+
+        monkeypatch.setattr(TraceLog, "model_validate", tracking_validate)
+
+        result = CliRunner().invoke(trace_cli, ["search", "--agent", "writer"])
+
+        assert result.exit_code == 0
+        assert "task-clean" in result.output
+        assert validated == ["task-clean"]
+
+    def test_unfiltered_search_skips_validation(self, traces, monkeypatch):
+        """Test browsing without filters answers from the raw trace data."""
+        monkeypatch.setattr(
+            TraceLog, "model_validate", lambda data: pytest.fail("unfiltered search should not validate traces")
+        )
+
+        result = CliRunner().invoke(trace_cli, ["search"])
+
+        assert result.exit_code == 0
+        assert "| task-failing |                2 |             2 |" in result.output
+        assert "| task-clean   |                1 |             1 |" in result.output
+
+    def test_search_returns_newest_matches_up_to_limit(self, tasks_dir):
+        """Test results are newest first and capped at the limit."""
+        for index in range(6):
+            task_id = f"task-{index}"
+            write_trace(tasks_dir, task_id, [StepRecord(step_name="run", message="Running", agent="researcher")])
+            os.utime(tasks_dir / task_id, (1000 + index, 1000 + index))
+
+        result = CliRunner().invoke(trace_cli, ["search", "--agent", "researcher", "--limit", "2"])
+
+        assert result.exit_code == 0
+        assert "task-5" in result.output
+        assert "task-4" in result.output
+        assert result.output.index("task-5") < result.output.index("task-4")
+        for index in range(4):
+            assert f"task-{index}" not in result.output
+
+
+class TestToolSummary:
+    """Tests for the trace summary command."""
+
+    def test_summary_aggregates_per_tool(self, tasks_dir):
+        """Test calls, errors and durations are totalled per server and tool."""
+        write_trace(tasks_dir, "task-1", [
+            StepRecord(
+                step_name="search",
+                message="Searching",
+                agent="researcher",
+                tool_calls=[
+                    ToolCallRecord(server="web", tool="search", duration_ms=100),
+                    ToolCallRecord(server="web", tool="search", error="timeout", duration_ms=300),
+                ],
+            ),
+            StepRecord(
+                step_name="save",
+                message="Saving",
+                agent="writer",
+                tool_calls=[ToolCallRecord(server="fs", tool="write_file", duration_ms=50)],
+            ),
+        ])
+
+        result = CliRunner().invoke(trace_cli, ["summary", "task-1"])
+
+        assert result.exit_code == 0
+        assert "Total calls: 3" in result.output
+        assert "Failed calls: 1" in result.output
+        assert "Total duration: 450ms" in result.output
+        rows = [line for line in result.output.splitlines() if line.startswith("| ")]
+        assert [row.split("|")[1].strip() for row in rows[1:]] == ["fs:write_file", "web:search"]
+        assert "| web:search    |       2 |        1 | 400ms" in result.output
+
+
+class TestTraceShow:
+    """Tests for the trace show command."""
+
+    def test_show_renders_steps_and_tool_calls(self, tasks_dir):
+        """Test the report lists each step with its tool calls."""
+        write_trace(tasks_dir, "task-1", [
+            StepRecord(step_name="plan", message="Planning", agent="researcher"),
+            StepRecord(
+                step_name="search",
+                message="Searching",
+                agent="researcher",
+                status="error",
+                tool_calls=[ToolCallRecord(server="web", tool="search", error="timeout", duration_ms=5)],
+            ),
+        ])
+
+        result = CliRunner().invoke(trace_cli, ["show", "task-1"])
+
+        assert result.exit_code == 0
+        lines = result.output.splitlines()
+        assert lines[0] == "Trace for task: task-1"
+        assert "Total steps: 2" in lines
+        assert any(line.startswith("ℹ️ [") and line.endswith("plan (researcher)") for line in lines)
+        assert any(line.startswith("❌ [") and line.endswith("search (researcher)") for line in lines)
+        assert "    ✗ web:search (5ms)" in lines
+        assert "      Error: timeout" in lines
+        assert result.output.endswith("\n\n")
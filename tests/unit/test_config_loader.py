@@ -0,0 +1,341 @@
+"""Unit tests for configuration file loading."""
+
+import os
+from pathlib import Path
+
+import pytest
+import yaml
+from pydantic import ValidationError
+
+from multi_agent.config import loader as loader_module
+from multi_agent.config.loader import (
+    YAMLLoader,
+    clear_config_cache,
+    find_all_configs,
+    load_agent_config,
+    load_config_file,
+    load_yaml_file,
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_config_cache():
+    """Start and finish each test with an empty config cache."""
+    clear_config_cache()
+    yield
+    clear_config_cache()
+
+
+class TestConfigCache:
+    """Tests for reuse of parsed configuration files."""
+
+    def test_unchanged_file_is_parsed_once(self, tmp_path, monkeypatch):
+        """Test repeated loads reuse the parse but still expand env vars."""
+        config_file = tmp_path / "agent.yaml"
+        config_file.write_text("name: ${AGENT_NAME:-default}\ntools: [search]\n", encoding="utf-8")
+        parses = []
+        original_load = loader_module.load_yaml_file
+        monkeypatch.setattr(loader_module, "load_yaml_file", lambda path: parses.append(path) or original_load(path))
+
+        monkeypatch.setenv("AGENT_NAME", "first")
+        first = load_config_file(config_file)
+        first["tools"].append("mutated")
+        monkeypatch.setenv("AGENT_NAME", "second")
+        second = load_config_file(config_file)
+
+        assert len(parses) == 1
+        assert first["name"] == "first"
+        assert second == {"name": "second", "tools": ["search"]}
+        assert load_config_file(config_file, expand_env=False) == {
+            "name": "${AGENT_NAME:-default}",
+            "tools": ["search"],
+        }
+
+    def test_modified_file_is_reparsed(self, tmp_path):
+        """Test a changed file is parsed again."""
+        config_file = tmp_path / "agent.json"
+        config_file.write_text('{"name": "old"}', encoding="utf-8")
+        assert load_config_file(config_file) == {"name": "old"}
+
+        config_file.write_text('{"name": "newer"}', encoding="utf-8")
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert load_config_file(config_file) == {"name": "newer"}
+
+    def test_least_recently_used_entries_are_evicted(self, tmp_path, monkeypatch):
+        """Test the cache stays bounded and keeps recently used files."""
+        monkeypatch.setattr(loader_module, "CONFIG_CACHE_MAX_ENTRIES", 2)
+        files = []
+        for name in ["a", "b", "c"]:
+            config_file = tmp_path / f"{name}.json"
+            config_file.write_text(f'{{"name": "{name}"}}', encoding="utf-8")
+            files.append(config_file)
+
+        load_config_file(files[0])
+        load_config_file(files[1])
+        load_config_file(files[0])
+        load_config_file(files[2])
+
+        cached = [Path(path).stem for path, _ in loader_module._config_data_cache]
+        assert cached == ["a", "c"]
+
+    def test_missing_file_raises(self, tmp_path):
+        """Test loading a missing file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError, match="Configuration file not found"):
+            load_config_file(tmp_path / "missing.yaml")
+
+
+AGENT_YAML = """\
+name: researcher
+role: Research Assistant
+system_prompt: You research things.
+llm_config:
+  endpoint: ${LLM_ENDPOINT:-https://api.example.com}
+  model: gpt-4
+  api_key_env: OPENAI_API_KEY
+"""
+
+
+class TestValidatedConfigCache:
+    """Tests for reuse of validated config objects."""
+
+    @pytest.fixture
+    def agent_file(self, tmp_path, monkeypatch):
+        """Write an agent config and count validations."""
+        monkeypatch.delenv("LLM_ENDPOINT", raising=False)
+        config_file = tmp_path / "researcher.yaml"
+        config_file.write_text(AGENT_YAML, encoding="utf-8")
+        return config_file
+
+    @pytest.fixture
+    def validations(self, monkeypatch):
+        """Record each call to the agent validator."""
+        calls = []
+        original_validate = loader_module.validate_agent_config
+        monkeypatch.setattr(
+            loader_module, "validate_agent_config", lambda data: calls.append(data) or original_validate(data)
+        )
+        return calls
+
+    def test_unchanged_file_is_validated_once(self, agent_file, validations):
+        """Test repeated loads return the same validated object."""
+        first = load_agent_config(agent_file)
+        second = load_agent_config(agent_file)
+
+        assert second is first
+        assert len(validations) == 1
+        assert first.llm_config.endpoint == "https://api.example.com"
+
+    def test_referenced_env_change_revalidates(self, agent_file, validations, monkeypatch):
+        """Test a change to a referenced variable produces a fresh object."""
+        load_agent_config(agent_file)
+        monkeypatch.setenv("UNRELATED_VAR", "ignored")
+        load_agent_config(agent_file)
+        monkeypatch.setenv("LLM_ENDPOINT", "https://llm.internal")
+        config = load_agent_config(agent_file)
+
+        assert len(validations) == 2
+        assert config.llm_config.endpoint == "https://llm.internal"
+
+    def test_modified_file_revalidates(self, agent_file, validations):
+        """Test a changed file is validated again."""
+        load_agent_config(agent_file)
+        agent_file.write_text(AGENT_YAML.replace("gpt-4", "gpt-4o"), encoding="utf-8")
+
+        assert load_agent_config(agent_file).llm_config.model == "gpt-4o"
+        assert len(validations) == 2
+
+
+class TestLoadAllConfigs:
+    """Tests for loading every config of a type at once."""
+
+    def test_loads_every_agent(self, tmp_path):
+        """Test each agent file is loaded and keyed by its file name."""
+        agents_dir = tmp_path / "agents"
+        agents_dir.mkdir()
+        names = [f"agent_{index}" for index in range(5)]
+        for name in names:
+            (agents_dir / f"{name}.yaml").write_text(
+                AGENT_YAML.replace("name: researcher", f"name: {name}"), encoding="utf-8"
+            )
+
+        configs = loader_module.load_all_agent_configs(tmp_path)
+
+        assert list(configs) == names
+        assert [config.name for config in configs.values()] == names
+
+    def test_invalid_config_raises(self, tmp_path):
+        """Test a validation error from any file propagates."""
+        agents_dir = tmp_path / "agents"
+        agents_dir.mkdir()
+        (agents_dir / "good.yaml").write_text(AGENT_YAML, encoding="utf-8")
+        (agents_dir / "bad.yaml").write_text("name: Bad Name\n", encoding="utf-8")
+
+        with pytest.raises(ValidationError):
+            loader_module.load_all_agent_configs(tmp_path)
+
+
+class TestYAMLLoader:
+    """Tests for the YAML parser selection."""
+
+    @pytest.mark.skipif(not hasattr(yaml, "CSafeLoader"), reason="PyYAML built without libyaml")
+    def test_uses_libyaml_when_available(self):
+        """Test the C safe loader is used when PyYAML has libyaml."""
+        assert YAMLLoader is yaml.CSafeLoader
+
+    def test_missing_file_raises(self, tmp_path):
+        """Test a missing YAML file raises FileNotFoundError with its path."""
+        with pytest.raises(FileNotFoundError, match="Configuration file not found: .*missing.yaml"):
+            load_yaml_file(str(tmp_path / "missing.yaml"))
+
+    def test_loader_stays_safe(self, tmp_path):
+        """Test arbitrary Python object tags are rejected."""
+        config_file = tmp_path / "evil.yaml"
+        config_file.write_text("value: !!python/object/apply:os.getcwd []\n", encoding="utf-8")
+
+        with pytest.raises(yaml.YAMLError):
+            load_yaml_file(config_file)
+
+
+class TestEnvVarExpansion:
+    """Tests for ${VAR} substitution in config values."""
+
+    def test_expands_nested_values(self, monkeypatch):
+        """Test references are expanded in nested dicts and lists."""
+        monkeypatch.setenv("API_HOST", "example.com")
+        monkeypatch.delenv("API_PORT", raising=False)
+        data = {
+            "url": "https://${API_HOST}:${API_PORT:-443}/v1",
+            "servers": [{"host": "${API_HOST}"}, "plain", 3],
+            "missing": "${API_PORT}",
+        }
+
+        expected = {
+            "url": "https://example.com:443/v1",
+            "servers": [{"host": "example.com"}, "plain", 3],
+            "missing": "",
+        }
+
+        copied = loader_module._expand_env_vars_copy(data)
+        assert copied == expected
+        assert data["url"] == "https://${API_HOST}:${API_PORT:-443}/v1"
+
+        assert loader_module._expand_env_vars(data) is data
+        assert data == expected
+
+    @pytest.mark.parametrize("value, expected", [
+        ("${}", "${}"),
+        ("${API_HOST:x}", "${API_HOST:x}"),
+        ("${API_HOST", "${API_HOST"),
+        ("$${API_HOST}}", "$example.com}"),
+        ("${API_PORT:-a:b}", "a:b"),
+        ("${API_PORT:-}", ""),
+    ])
+    def test_malformed_references_stay_literal(self, monkeypatch, value, expected):
+        """Test only well-formed references are substituted."""
+        monkeypatch.setenv("API_HOST", "example.com")
+        monkeypatch.delenv("API_PORT", raising=False)
+
+        assert loader_module._expand_env_vars(value) == expected
+
+    def test_each_variable_is_read_once_per_pass(self, monkeypatch):
+        """Test repeated references reuse the first lookup, defaults included."""
+        monkeypatch.setenv("API_HOST", "example.com")
+        monkeypatch.delenv("API_PORT", raising=False)
+        lookups = []
+        original_get = os.environ.get
+        monkeypatch.setattr(os.environ, "get", lambda name, *args: lookups.append(name) or original_get(name, *args))
+        data = {"urls": [f"https://${{API_HOST}}:${{API_PORT:-{port}}}" for port in (80, 443)] * 10}
+
+        expanded = loader_module._expand_env_vars_copy(data)
+
+        assert expanded["urls"][:2] == ["https://example.com:80", "https://example.com:443"]
+        assert sorted(lookups) == ["API_HOST", "API_PORT"]
+
+    def test_expands_plain_string(self, monkeypatch):
+        """Test a top-level string is expanded and returned."""
+        monkeypatch.setenv("API_HOST", "example.com")
+
+        assert loader_module._expand_env_vars("${API_HOST}") == "example.com"
+        assert loader_module._expand_env_vars(42) == 42
+
+
+class TestFindAllConfigs:
+    """Tests for config discovery."""
+
+    def test_finds_yaml_and_yml_files(self, tmp_path):
+        """Test both extensions are found and .yml wins a name clash."""
+        agents_dir = tmp_path / "agents"
+        (agents_dir / "nested.yaml").mkdir(parents=True)
+        for name in ["writer.yaml", "researcher.yml", "dup.yaml", "dup.yml", "notes.txt"]:
+            (agents_dir / name).write_text("name: x\n", encoding="utf-8")
+
+        configs = find_all_configs(tmp_path, "agents")
+
+        assert {name: path.name for name, path in configs.items()} == {
+            "dup": "dup.yml",
+            "researcher": "researcher.yml",
+            "writer": "writer.yaml",
+        }
+        assert find_all_configs(tmp_path, "workflows") == {}
+
+    def test_listing_is_reused_until_directory_changes(self, tmp_path, monkeypatch):
+        """Test an unchanged directory isn't rescanned and new files are picked up."""
+        agents_dir = tmp_path / "agents"
+        agents_dir.mkdir()
+        (agents_dir / "writer.yaml").write_text("name: writer\n", encoding="utf-8")
+        scans = []
+        original_list = loader_module.list_config_files
+        monkeypatch.setattr(loader_module, "list_config_files", lambda path: scans.append(path) or original_list(path))
+
+        first = find_all_configs(tmp_path, "agents")
+        assert find_all_configs(tmp_path, "agents") is first
+        with pytest.raises(TypeError):
+            first["other"] = agents_dir / "other.yaml"
+
+        (agents_dir / "researcher.yaml").write_text("name: researcher\n", encoding="utf-8")
+        stat = agents_dir.stat()
+        os.utime(agents_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert sorted(find_all_configs(tmp_path, "agents")) == ["researcher", "writer"]
+        assert len(scans) == 2
+
+
+class TestYAMLHeader:
+    """Tests for header-only YAML parsing."""
+
+    def test_cut_keeps_only_complete_top_level_keys(self, tmp_path):
+        """Test a long file is cut before the last top-level key in range."""
+        config_file = tmp_path / "agent.yaml"
+        config_file.write_text(
+            "name: researcher\n"
+            "tools:\n- search\n- fetch\n"
+            "system_prompt: |\n" + "  Research carefully.\n" * 20 +
+            "role: Research Assistant\n",
+            encoding="utf-8",
+        )
+
+        header = loader_module.load_yaml_header(config_file, max_bytes=80)
+
+        assert header == {"name": "researcher", "tools": ["search", "fetch"]}
+        assert loader_module.load_yaml_header(config_file)["role"] == "Research Assistant"
+
+    def test_flow_style_falls_back_to_full_parse(self, tmp_path, monkeypatch):
+        """Test files the cut can't split are parsed whole, with env vars expanded."""
+        monkeypatch.setenv("AGENT_ROLE", "Writer")
+        config_file = tmp_path / "agent.yaml"
+        config_file.write_text('{"name": "writer", "role": "${AGENT_ROLE}", "notes": "' + "x" * 200 + '"}',
+                               encoding="utf-8")
+
+        assert loader_module.load_yaml_header(config_file, max_bytes=40)["role"] == "Writer"
+
+    def test_find_all_config_headers(self, tmp_path):
+        """Test discovery returns each file's path with its header."""
+        agents_dir = tmp_path / "agents"
+        agents_dir.mkdir()
+        (agents_dir / "writer.yaml").write_text("name: writer\nrole: Writer\n", encoding="utf-8")
+
+        configs = loader_module.find_all_config_headers(tmp_path, "agents")
+
+        assert configs == {"writer": (agents_dir / "writer.yaml", {"name": "writer", "role": "Writer"})}
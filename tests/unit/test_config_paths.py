@@ -0,0 +1,61 @@
+"""Unit tests for configuration path helpers."""
+
+from pathlib import Path
+
+import pytest
+
+from multi_agent.config import loader as loader_module
+from multi_agent.config import paths as paths_module
+from multi_agent.config.paths import (
+    get_agents_dir,
+    get_task_dir,
+    get_tasks_dir,
+    resolve_config_path,
+)
+
+
+class TestDirectoryCreation:
+    """Tests for directory creation in the get_*_dir helpers."""
+
+    def test_base_dirs_are_created_once(self, tmp_path, monkeypatch):
+        """Test repeat lookups of a base directory skip mkdir."""
+        created = []
+        original_mkdir = Path.mkdir
+        monkeypatch.setattr(Path, "mkdir", lambda self, *a, **kw: created.append(self) or original_mkdir(self, *a, **kw))
+
+        first = get_agents_dir(tmp_path)
+        second = get_agents_dir(tmp_path)
+
+        assert first == second == tmp_path / "agents"
+        assert first.is_dir()
+        assert created.count(tmp_path / "agents") == 1
+
+    def test_deleted_task_dir_is_recreated(self, tmp_path):
+        """Test task directories are recreated after being removed."""
+        task_dir = get_task_dir("task-1", tmp_path)
+        task_dir.rmdir()
+
+        assert get_task_dir("task-1", tmp_path).is_dir()
+        assert get_tasks_dir(tmp_path) in paths_module._ensured_dirs
+
+
+def test_loader_shares_default_config_dir():
+    """Test the loader uses the single cached default config dir helper."""
+    assert loader_module.get_default_config_dir is paths_module.get_default_config_dir
+
+
+class TestResolveConfigPath:
+    """Tests for config name resolution."""
+
+    def test_resolves_by_type_and_extension(self, tmp_path):
+        """Test names resolve within the type's subdirectory."""
+        (tmp_path / "config").mkdir()
+        servers_file = tmp_path / "config" / "mcp_servers.yml"
+        servers_file.write_text("{}\n", encoding="utf-8")
+
+        assert resolve_config_path("mcp_servers", "mcp_servers", tmp_path) == servers_file
+
+    def test_unknown_type_raises(self, tmp_path):
+        """Test an unknown config type is rejected."""
+        with pytest.raises(ValueError, match="Unknown config type"):
+            resolve_config_path("x", "plugins", tmp_path)
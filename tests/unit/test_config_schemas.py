@@ -0,0 +1,78 @@
+"""Unit tests for configuration schemas."""
+
+import pytest
+from pydantic import ValidationError
+
+from multi_agent.config.schemas import (
+    MCPServerConfig,
+    MCPServerConfigSSE,
+    MCPServerConfigStdio,
+    MCPServerConfigStreamableHTTP,
+    validate_agent_config,
+    validate_mcp_server_config,
+    validate_workflow_config,
+)
+
+AGENT_DATA = {
+    "name": "researcher",
+    "role": "Research Assistant",
+    "system_prompt": "You research things.",
+    "llm_config": {"endpoint": "https://api.example.com", "model": "gpt-4", "api_key_env": "OPENAI_API_KEY"},
+}
+
+
+class TestConfigModels:
+    """Tests for config model strictness."""
+
+    def test_configs_are_read_only(self):
+        """Test loaded configs can't be modified."""
+        config = validate_agent_config(AGENT_DATA)
+
+        with pytest.raises(ValidationError):
+            config.name = "writer"
+        with pytest.raises(ValidationError):
+            config.llm_config.model = "gpt-4o"
+
+    def test_unknown_keys_are_rejected(self):
+        """Test misspelled keys raise instead of being ignored."""
+        with pytest.raises(ValidationError, match="max_iteration"):
+            validate_agent_config({**AGENT_DATA, "max_iteration": 5})
+
+    def test_edges_accept_from_alias(self):
+        """Test edges still accept the 'from' key alongside strict settings."""
+        config = validate_workflow_config({
+            "name": "flow",
+            "entry_point": "start",
+            "nodes": {"start": {"type": "agent", "agent": "researcher"}},
+            "edges": [{"from": "start", "to": "END"}],
+        })
+
+        assert config.edges[0].from_node == "start"
+
+
+class TestMCPServerConfig:
+    """Tests for transport-specific MCP server configs."""
+
+    def test_transport_selects_config_model(self):
+        """Test the config is validated as the declared transport's model."""
+        servers = validate_mcp_server_config({
+            "local": {"transport": "stdio", "config": {"command": "npx", "args": ["server"]}},
+            "remote": {"transport": "streamable-http", "config": {"url": "https://mcp.example.com", "timeout": 5}},
+        })
+
+        assert isinstance(servers["local"].config, MCPServerConfigStdio)
+        assert isinstance(servers["remote"].config, MCPServerConfigStreamableHTTP)
+        assert servers["remote"].config.timeout == 5
+
+    def test_config_errors_are_reported_under_config(self):
+        """Test a config that doesn't fit its transport fails with field locations."""
+        with pytest.raises(ValidationError) as exc_info:
+            MCPServerConfig.model_validate({"transport": "stdio", "config": {"url": "https://mcp.example.com"}})
+
+        locations = {error["loc"] for error in exc_info.value.errors()}
+        assert locations == {("config", "command"), ("config", "url")}
+
+    def test_mismatched_config_instance_is_rejected(self):
+        """Test a prebuilt config for another transport is rejected."""
+        with pytest.raises(ValidationError, match="stdio transport requires MCPServerConfigStdio config"):
+            MCPServerConfig(transport="stdio", config=MCPServerConfigSSE(url="https://mcp.example.com"))
@@ -0,0 +1,342 @@
+"""Unit tests for HITL checkpoint management."""
+
+import asyncio
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from multi_agent.execution import hitl as hitl_module
+from multi_agent.execution.hitl import (
+    CheckpointMetadata,
+    CheckpointSummary,
+    HITLManager,
+    list_all_checkpoints,
+    list_checkpoint_summaries_async,
+    load_checkpoint_global,
+    save_checkpoint_file,
+)
+from multi_agent.models import Message, State
+from multi_agent.state import StateManager
+from multi_agent.utils import json_dumps
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Create a HITL manager backed by a temporary config directory."""
+    return HITLManager("task-1", StateManager("task-1", config_dir=tmp_path))
+
+
+def write_checkpoint(manager, checkpoint_id: str, sequence_number: int, **kwargs) -> CheckpointMetadata:
+    """Write a checkpoint metadata file into the manager's checkpoint directory."""
+    metadata = CheckpointMetadata(
+        checkpoint_id=checkpoint_id,
+        task_id="task-1",
+        sequence_number=sequence_number,
+        node_name="review",
+        state=State(current_agent="agent", messages=[Message(role="assistant", content="draft")]),
+        created_at=datetime(2024, 1, 2, 3, 4, 5),
+        **kwargs,
+    )
+    save_checkpoint_file(manager._checkpoints_dir / f"{checkpoint_id}.json", metadata)
+    return metadata
+
+
+class TestCheckpointLoading:
+    """Tests for reading checkpoints back from disk."""
+
+    def test_load_checkpoint_restores_nested_models(self, manager):
+        """Test the state, its messages and timestamps come back as typed values."""
+        written = write_checkpoint(manager, "cp-1", 1)
+
+        loaded = manager.load_checkpoint("cp-1")
+
+        assert loaded == written
+        assert isinstance(loaded.state.messages[0], Message)
+        assert isinstance(loaded.created_at, datetime)
+
+    def test_list_checkpoints_skips_invalid_files(self, manager):
+        """Test unreadable checkpoint files are skipped and the rest sorted."""
+        write_checkpoint(manager, "cp-b", 2)
+        write_checkpoint(manager, "cp-a", 1)
+        (manager._checkpoints_dir / "broken.json").write_text('{"checkpoint_id": "broken"}', encoding="utf-8")
+
+        checkpoints = manager.list_checkpoints()
+
+        assert [c.checkpoint_id for c in checkpoints] == ["cp-a", "cp-b"]
+
+    def test_full_load_still_validates_state(self, manager):
+        """Test a checkpoint whose state is malformed doesn't load as full metadata."""
+        written = write_checkpoint(manager, "cp-1", 1)
+        data = written.model_dump(mode="json")
+        data["state"] = {"messages": "not a list"}
+        (manager._checkpoints_dir / "cp-1.json").write_text(json_dumps(data), encoding="utf-8")
+
+        assert manager.load_checkpoint("cp-1") is None
+        assert manager.list_checkpoints() == []
+
+    def test_load_missing_checkpoint_returns_none(self, manager):
+        """Test loading an unknown checkpoint returns None."""
+        assert manager.load_checkpoint("missing") is None
+
+    def test_list_checkpoints_async_matches_sync(self, manager):
+        """Test the async listing returns the same checkpoints as the sync one."""
+        write_checkpoint(manager, "cp-b", 2)
+        write_checkpoint(manager, "cp-a", 1)
+        (manager._checkpoints_dir / "broken.json").write_text("{", encoding="utf-8")
+
+        checkpoints = asyncio.run(manager.list_checkpoints_async())
+
+        assert checkpoints == manager.list_checkpoints()
+        assert [c.checkpoint_id for c in checkpoints] == ["cp-a", "cp-b"]
+
+    def test_global_loaders_match_manager(self, manager, monkeypatch):
+        """Test the task-id based loaders return the same typed metadata as the manager."""
+        monkeypatch.setattr(hitl_module, "get_default_config_dir", lambda: manager.state_manager.task_dir.parent.parent)
+        written = write_checkpoint(manager, "cp-1", 1, human_feedback="looks good")
+
+        assert load_checkpoint_global("task-1", "cp-1") == written
+        assert list_all_checkpoints("task-1") == manager.list_checkpoints() == [written]
+        assert load_checkpoint_global("task-1", "missing") is None
+        assert list_all_checkpoints("unknown-task") == []
+
+    def test_summaries_match_full_metadata(self, manager, monkeypatch):
+        """Test summaries carry the same fields as the full metadata, minus the state."""
+        monkeypatch.setattr(hitl_module, "get_default_config_dir", lambda: manager.state_manager.task_dir.parent.parent)
+        written = write_checkpoint(manager, "cp-1", 1, human_feedback="looks good")
+
+        summaries = asyncio.run(list_checkpoint_summaries_async("task-1"))
+
+        assert summaries == [CheckpointSummary(**written.model_dump(exclude={"state"}))]
+
+    def test_listing_ignores_non_checkpoint_entries(self, manager):
+        """Test temp files, hidden files and directories are not loaded as checkpoints."""
+        write_checkpoint(manager, "cp-2", 2)
+        write_checkpoint(manager, "cp-1", 1)
+        (manager._checkpoints_dir / "cp-3.json.tmp").write_text("{", encoding="utf-8")
+        (manager._checkpoints_dir / ".hidden.json").write_text("{", encoding="utf-8")
+        (manager._checkpoints_dir / "nested.json").mkdir()
+
+        assert [c.checkpoint_id for c in manager.list_checkpoints()] == ["cp-1", "cp-2"]
+
+    def test_load_round_trips_non_ascii_content(self, manager):
+        """Test message content outside ASCII survives a save and load."""
+        state = State(current_agent="agent", messages=[Message(role="user", content="résumé — 検証 ✓")])
+        manager.create_checkpoint(state, "review")
+
+        assert manager.load_latest_checkpoint().state == state
+
+    def test_checkpoint_files_are_compact(self, manager):
+        """Test checkpoint files are written without indentation."""
+        write_checkpoint(manager, "cp-1", 1)
+
+        content = (manager._checkpoints_dir / "cp-1.json").read_text(encoding="utf-8")
+
+        assert "\n" not in content
+        assert content.startswith('{"checkpoint_id":"cp-1"')
+
+    def test_failed_write_keeps_previous_checkpoint(self, manager, monkeypatch):
+        """Test a write that dies partway leaves the existing checkpoint file intact."""
+        written = write_checkpoint(manager, "cp-1", 1)
+
+        def partial_write(self, data, encoding=None):
+            with open(self, "w", encoding=encoding) as f:
+                f.write(data[:10])
+            raise OSError("disk full")
+
+        monkeypatch.setattr(Path, "write_text", partial_write)
+        with pytest.raises(OSError):
+            save_checkpoint_file(manager._checkpoints_dir / "cp-1.json", written.model_copy(update={"node_name": "x"}))
+        monkeypatch.undo()
+
+        assert manager.load_checkpoint("cp-1") == written
+        assert [c.checkpoint_id for c in manager.list_checkpoints()] == ["cp-1"]
+
+
+class TestCreateCheckpoint:
+    """Tests for checkpoint creation."""
+
+    def test_create_writes_checkpoint_and_state(self, manager):
+        """Test the checkpoint file and the quick-resume state hold the same state."""
+        state = State(current_agent="agent", messages=[Message(role="user", content="hi")])
+
+        checkpoint = manager.create_checkpoint(state, "review", human_feedback="check this")
+
+        assert checkpoint.sequence == 1
+        assert checkpoint.position == "review"
+        loaded = manager.load_checkpoint(checkpoint.checkpoint_id)
+        assert loaded.state == state
+        assert loaded.human_feedback == "check this"
+        assert manager.state_manager.load_state() == state
+
+    def test_create_dumps_state_once(self, manager, monkeypatch):
+        """Test the state is dumped once for both files it is written to."""
+        calls = []
+        original_dump = State.model_dump
+
+        def counting_dump(self, **kwargs):
+            calls.append(kwargs)
+            return original_dump(self, **kwargs)
+
+        monkeypatch.setattr(State, "model_dump", counting_dump)
+
+        manager.create_checkpoint(State(current_agent="agent"), "review")
+
+        assert len(calls) == 1
+
+    def test_sequence_continues_from_index(self, manager):
+        """Test a new manager picks up numbering from the index, deleted entries included."""
+        manager.create_checkpoint(State(current_agent="agent"), "review")
+        second = manager.create_checkpoint(State(current_agent="agent"), "review")
+        manager.delete_checkpoint(second.checkpoint_id)
+
+        reopened = HITLManager("task-1", manager.state_manager)
+        third = reopened.create_checkpoint(State(current_agent="agent"), "review")
+
+        assert third.sequence == 3
+        assert not (manager._checkpoints_dir / ".sequence").exists()
+
+    def test_legacy_sequence_file_is_honoured(self, tmp_path):
+        """Test numbering continues from a counter file written by older versions."""
+        state_manager = StateManager("task-1", config_dir=tmp_path)
+        (state_manager.task_dir / "checkpoints").mkdir()
+        (state_manager.task_dir / "checkpoints" / ".sequence").write_text("4", encoding="utf-8")
+
+        checkpoint = HITLManager("task-1", state_manager).create_checkpoint(State(current_agent="agent"), "review")
+
+        assert checkpoint.sequence == 5
+
+
+class TestSequenceIndex:
+    """Tests for sequence lookups through the checkpoint index."""
+
+    @pytest.fixture
+    def created(self, manager):
+        """Create three checkpoints and return their IDs in sequence order."""
+        return [
+            manager.create_checkpoint(State(current_agent=f"agent-{i}"), "review").checkpoint_id
+            for i in range(3)
+        ]
+
+    def test_lookups_do_not_scan_checkpoints(self, manager, created, monkeypatch):
+        """Test sequence and latest lookups read only the index and one file."""
+        monkeypatch.setattr(manager, "list_checkpoints", lambda: pytest.fail("lookup should use the index"))
+
+        assert manager.load_checkpoint_by_sequence(2).checkpoint_id == created[1]
+        assert manager.load_latest_checkpoint().checkpoint_id == created[2]
+        assert manager.load_checkpoint_by_sequence(7) is None
+
+    def test_deleted_checkpoints_are_tombstoned(self, manager, created):
+        """Test deleting a checkpoint removes it from sequence lookups."""
+        assert manager.delete_checkpoint(created[2])
+
+        assert manager.load_checkpoint_by_sequence(3) is None
+        assert manager.load_latest_checkpoint().checkpoint_id == created[1]
+        assert manager._index_file.read_text(encoding="utf-8").endswith("3\tDEL\n")
+
+    def test_latest_skips_files_removed_outside_the_manager(self, manager, created):
+        """Test index entries whose file is gone are skipped."""
+        (manager._checkpoints_dir / f"{created[2]}.json").unlink()
+
+        assert manager.load_latest_checkpoint().checkpoint_id == created[1]
+
+    def test_index_is_rebuilt_for_existing_checkpoints(self, tmp_path):
+        """Test a checkpoint directory without an index gets one on first use."""
+        state_manager = StateManager("task-1", config_dir=tmp_path)
+        checkpoints_dir = state_manager.task_dir / "checkpoints"
+        checkpoints_dir.mkdir()
+        for sequence in (1, 2):
+            metadata = CheckpointMetadata(
+                checkpoint_id=f"cp-{sequence}",
+                task_id="task-1",
+                sequence_number=sequence,
+                node_name="review",
+                state=State(current_agent="agent"),
+                created_at=datetime(2024, 1, 2),
+            )
+            save_checkpoint_file(checkpoints_dir / f"cp-{sequence}.json", metadata)
+
+        manager = HITLManager("task-1", state_manager)
+
+        assert manager.load_checkpoint_by_sequence(1).checkpoint_id == "cp-1"
+        assert manager.load_latest_checkpoint().checkpoint_id == "cp-2"
+
+    def test_latest_falls_back_to_full_index(self, manager, created, monkeypatch):
+        """Test the latest lookup reads the whole index when the tail has no live entry."""
+        monkeypatch.setattr(hitl_module, "INDEX_TAIL_BYTES", 16)
+        for checkpoint_id in created[1:]:
+            manager.delete_checkpoint(checkpoint_id)
+
+        assert manager.load_latest_checkpoint().checkpoint_id == created[0]
+
+    def test_latest_of_empty_index_is_none(self, manager):
+        """Test a task without checkpoints has no latest checkpoint."""
+        assert manager.load_latest_checkpoint() is None
+
+
+class TestResume:
+    """Tests for resuming from a checkpoint."""
+
+    def test_resume_with_feedback_appends_message(self, manager):
+        """Test feedback is added to the resumed state and recorded on the checkpoint."""
+        checkpoint = manager.create_checkpoint(State(current_agent="agent"), "review")
+
+        state = manager.resume_from_checkpoint(checkpoint.checkpoint_id, feedback="approved")
+
+        assert [(m.role, m.content) for m in state.messages] == [("human", "approved")]
+        assert manager.load_checkpoint(checkpoint.checkpoint_id).human_feedback == "approved"
+
+    def test_resume_missing_checkpoint_returns_none(self, manager):
+        """Test resuming from an unknown checkpoint returns None."""
+        assert manager.resume_from_checkpoint("missing", feedback="approved") is None
+
+
+class TestCheckpointCache:
+    """Tests for reusing parsed checkpoints."""
+
+    def test_unchanged_file_is_parsed_once(self, manager, monkeypatch):
+        """Test repeat loads of an unchanged file skip parsing."""
+        write_checkpoint(manager, "cp-1", 1)
+        parsed = []
+        original_parse = hitl_module._parse_checkpoint
+
+        def counting_parse(data, model=CheckpointMetadata):
+            parsed.append(model)
+            return original_parse(data, model)
+
+        monkeypatch.setattr(hitl_module, "_parse_checkpoint", counting_parse)
+
+        first = manager.load_checkpoint("cp-1")
+        second = manager.load_checkpoint("cp-1")
+        manager.list_checkpoints()
+
+        assert parsed == [CheckpointMetadata]
+        assert first == second
+        assert first is not second
+
+    def test_rewritten_file_is_reloaded(self, manager):
+        """Test a checkpoint updated on disk is parsed again."""
+        checkpoint = manager.create_checkpoint(State(current_agent="agent"), "review")
+        manager.load_checkpoint(checkpoint.checkpoint_id)
+
+        manager.resume_from_checkpoint(checkpoint.checkpoint_id, feedback="approved")
+
+        assert manager.load_checkpoint(checkpoint.checkpoint_id).human_feedback == "approved"
+
+    def test_mutating_a_result_does_not_leak(self, manager):
+        """Test changing a loaded checkpoint doesn't affect later loads."""
+        write_checkpoint(manager, "cp-1", 1)
+
+        manager.load_checkpoint("cp-1").human_feedback = "changed"
+
+        assert manager.load_checkpoint("cp-1").human_feedback is None
+
+    def test_deleted_checkpoint_is_not_served_from_cache(self, manager):
+        """Test a deleted checkpoint can't be loaded from the cache."""
+        checkpoint = manager.create_checkpoint(State(current_agent="agent"), "review")
+        manager.load_checkpoint(checkpoint.checkpoint_id)
+
+        manager.delete_checkpoint(checkpoint.checkpoint_id)
+
+        assert manager.load_checkpoint(checkpoint.checkpoint_id) is None
+        assert (manager._checkpoints_dir / f"{checkpoint.checkpoint_id}.json") not in hitl_module._checkpoint_cache
@@ -156,6 +156,17 @@ class TestToolCall:
         assert tool_call.tool == "search"
         assert tool_call.arguments == {"query": "test"}
 
+    def test_arguments_json_follows_argument_changes(self):
+        """Test serialized arguments reflect copies and in-place edits."""
+        tool_call = ToolCall(id="call-1", tool="search", arguments={"a": 1})
+        assert tool_call.arguments_json() == '{"a": 1}'
+
+        copied = tool_call.model_copy(update={"arguments": {"b": 2}})
+        assert copied.arguments_json() == '{"b": 2}'
+
+        tool_call.arguments["a"] = 3
+        assert tool_call.arguments_json() == '{"a": 3}'
+
 
 class TestState:
     """Tests for State model."""
@@ -218,6 +229,28 @@ class TestState:
         state = state.add_message(Message(role="user", content="Test"))
         assert state.message_count == 1
 
+    def test_system_and_last_assistant_messages(self):
+        """Test role index lookups stay correct across updates."""
+        state = State(
+            current_agent="test_agent",
+            messages=[Message(role="system", content="Be helpful")],
+        )
+        assert [m.content for m in state.system_messages] == ["Be helpful"]
+        assert state.last_assistant_message is None
+
+        state = state.add_messages([
+            Message(role="user", content="Hi"),
+            Message(role="assistant", content="Hello"),
+            Message(role="system", content="Be brief"),
+        ])
+        assert [m.content for m in state.system_messages] == ["Be helpful", "Be brief"]
+        assert state.last_assistant_message.content == "Hello"
+
+        # Replacing messages outside add_message(s) rebuilds the index
+        replaced = state.model_copy(update={"messages": [Message(role="assistant", content="Only")]})
+        assert replaced.system_messages == []
+        assert replaced.last_assistant_message.content == "Only"
+
 
 class TestAgent:
     """Tests for Agent model."""
@@ -0,0 +1,198 @@
+"""Unit tests for the orchestrator."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from multi_agent.execution import orchestrator as orchestrator_module
+from multi_agent.execution.orchestrator import Orchestrator, OrchestratorConfig, TaskQueue
+
+
+def make_task(task_id: str) -> SimpleNamespace:
+    """Create a stand-in for an executable task."""
+    return SimpleNamespace(task_id=task_id)
+
+
+class TestTaskQueue:
+    """Tests for the FIFO task queue."""
+
+    def test_fifo_order_with_removals(self):
+        """Test removed tasks are skipped and the rest come out in order."""
+        queue = TaskQueue()
+        for task_id in ["a", "b", "c", "d"]:
+            queue.put(make_task(task_id))
+
+        assert queue.remove("a")
+        assert queue.remove("c")
+        assert not queue.remove("c")
+
+        assert queue.size == 2
+        assert "b" in queue
+        assert "c" not in queue
+        assert queue.peek().task_id == "b"
+        assert [queue.get().task_id, queue.get().task_id] == ["b", "d"]
+        assert queue.get() is None
+        assert queue.empty
+
+    def test_requeued_task_takes_new_position(self):
+        """Test a task removed and queued again runs once, from its new position."""
+        queue = TaskQueue()
+        first = make_task("a")
+        queue.put(first)
+        queue.put(make_task("b"))
+        queue.remove("a")
+        again = make_task("a")
+        queue.put(again)
+
+        assert queue.get().task_id == "b"
+        assert queue.get() is again
+        assert queue.get() is None
+
+    def test_capacity_counts_only_live_tasks(self):
+        """Test removed tasks free their slot and stale entries are compacted."""
+        queue = TaskQueue(max_size=2)
+        assert queue.put(make_task("a"))
+        assert queue.put(make_task("b"))
+        assert not queue.put(make_task("c"))
+
+        for index in range(10):
+            queue.remove("a" if index == 0 else f"x{index - 1}")
+            assert queue.put(make_task(f"x{index}"))
+
+        assert len(queue.queue) <= 2 * queue.size + 1
+        assert [queue.get().task_id, queue.get().task_id] == ["b", "x9"]
+
+    def test_duplicate_task_is_rejected(self):
+        """Test a task already waiting can't be queued twice."""
+        queue = TaskQueue()
+        assert queue.put(make_task("a"))
+        assert not queue.put(make_task("a"))
+        assert queue.size == 1
+
+
+class GatedTask:
+    """Executable task stand-in that finishes when its gate is opened."""
+
+    gates: dict[str, asyncio.Event] = {}
+
+    def __init__(self, description, agent, task_id=None, **kwargs):
+        self.task_id = task_id
+        self.gates[task_id] = asyncio.Event()
+
+    async def run(self, tool_executor):
+        await self.gates[self.task_id].wait()
+        return f"result-{self.task_id}"
+
+    @classmethod
+    def load(cls, task_id):
+        raise FileNotFoundError(task_id)
+
+
+class TestOrchestratorDispatch:
+    """Tests for event-driven task dispatch."""
+
+    @pytest.fixture
+    async def orchestrator(self, monkeypatch):
+        """Create an orchestrator that runs one gated task at a time."""
+        monkeypatch.setattr(orchestrator_module, "ExecutableTask", GatedTask)
+        orchestrator = Orchestrator(OrchestratorConfig(max_concurrent=1))
+        monkeypatch.setattr(orchestrator, "_get_agent", lambda name: SimpleNamespace(name=name))
+        await orchestrator.initialize()
+        yield orchestrator
+        for gate in GatedTask.gates.values():
+            gate.set()
+        await orchestrator.shutdown()
+
+    async def test_queued_task_starts_when_a_slot_frees(self, orchestrator):
+        """Test a queued task is dispatched and its result returned without polling delays."""
+        await orchestrator.submit_task("first", "agent", task_id="t1")
+        await orchestrator.submit_task("second", "agent", task_id="t2")
+        assert orchestrator.running_count == 1
+        assert orchestrator.queued_count == 1
+
+        result_waiter = asyncio.create_task(orchestrator.get_task_result("t2", timeout=5))
+        GatedTask.gates["t1"].set()
+        GatedTask.gates["t2"].set()
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+
+        assert await result_waiter == "result-t2"
+        assert loop.time() - started < 0.05
+        assert orchestrator.queued_count == 0
+
+    async def test_waiting_on_queued_task_times_out(self, orchestrator):
+        """Test waiting on a task that never leaves the queue raises TimeoutError."""
+        await orchestrator.submit_task("first", "agent", task_id="t1")
+        await orchestrator.submit_task("second", "agent", task_id="t2")
+
+        with pytest.raises(TimeoutError):
+            await orchestrator.get_task_result("t2", timeout=0.01)
+
+    async def test_unknown_task_times_out_on_schedule(self, orchestrator):
+        """Test waiting on a task that never appears gives up at the deadline."""
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+
+        with pytest.raises(TimeoutError):
+            await orchestrator.get_task_result("missing", timeout=0.02)
+
+        assert 0.02 <= loop.time() - started < 0.09
+
+    async def test_submit_rejects_tasks_when_queue_is_full(self, monkeypatch):
+        """Test submissions beyond the running and queued capacity are refused."""
+        monkeypatch.setattr(orchestrator_module, "ExecutableTask", GatedTask)
+        orchestrator = Orchestrator(OrchestratorConfig(max_concurrent=1, queue_size=1))
+        monkeypatch.setattr(orchestrator, "_get_agent", lambda name: SimpleNamespace(name=name))
+
+        await orchestrator.submit_task("first", "agent", task_id="t1")
+        await orchestrator.submit_task("second", "agent", task_id="t2")
+        with pytest.raises(RuntimeError, match="Task queue is full"):
+            await orchestrator.submit_task("third", "agent", task_id="t3")
+
+        GatedTask.gates["t1"].set()
+        await orchestrator.shutdown()
+
+    async def test_removed_queued_task_releases_waiters(self, orchestrator):
+        """Test removing a queued task fails its waiters instead of leaving them blocked."""
+        await orchestrator.submit_task("first", "agent", task_id="t1")
+        await orchestrator.submit_task("second", "agent", task_id="t2")
+        result_waiter = asyncio.create_task(orchestrator.get_task_result("t2", timeout=5))
+        await asyncio.sleep(0)
+
+        assert orchestrator.queue.remove("t2")
+
+        with pytest.raises(RuntimeError, match="removed from the queue before it started: t2"):
+            await asyncio.wait_for(result_waiter, timeout=1)
+        assert "t2" not in orchestrator._dispatched
+
+    async def test_shutdown_drops_queued_tasks(self, monkeypatch):
+        """Test queued tasks are not started once shutdown begins."""
+        monkeypatch.setattr(orchestrator_module, "ExecutableTask", GatedTask)
+        orchestrator = Orchestrator(OrchestratorConfig(max_concurrent=1))
+        monkeypatch.setattr(orchestrator, "_get_agent", lambda name: SimpleNamespace(name=name))
+        await orchestrator.initialize()
+        dispatched = []
+        execute_task = orchestrator._execute_task
+        monkeypatch.setattr(
+            orchestrator,
+            "_execute_task",
+            lambda task: (dispatched.append(task.task_id), execute_task(task)),
+        )
+
+        await orchestrator.submit_task("first", "agent", task_id="t1")
+        await orchestrator.submit_task("second", "agent", task_id="t2")
+        result_waiter = asyncio.create_task(orchestrator.get_task_result("t2", timeout=5))
+        await asyncio.sleep(0)
+
+        GatedTask.gates["t1"].set()
+        await orchestrator.shutdown()
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        assert dispatched == ["t1"]
+        assert orchestrator.running_count == 0
+        assert orchestrator.queued_count == 0
+        assert orchestrator._dispatched == {}
+        with pytest.raises(RuntimeError, match="before it started: t2"):
+            await asyncio.wait_for(result_waiter, timeout=1)
@@ -0,0 +1,417 @@
+"""Unit tests for dependency-driven parallel execution."""
+
+import asyncio
+import pickle
+
+import networkx as nx
+import pytest
+
+from multi_agent.execution import parallel as parallel_module
+from multi_agent.execution.parallel import (
+    DependencyAnalyzer,
+    FIFOQueue,
+    ParallelExecutor,
+    TaskDependency,
+)
+from multi_agent.models import Task
+
+
+@pytest.fixture(autouse=True)
+def clear_plan_cache():
+    """Start every test with an empty dependency plan cache."""
+    parallel_module._plan_cache.clear()
+    yield
+    parallel_module._plan_cache.clear()
+
+
+def make_task(task_id: str, description: str, agent: str = "worker") -> Task:
+    """Build a task assigned to the given agent."""
+    return Task(id=task_id, description=description, assigned_agent=agent)
+
+
+class RecordingAgent:
+    """Agent stand-in that records calls and can hold a task until released."""
+
+    def __init__(self) -> None:
+        self.started: list[str] = []
+        self.finished: list[str] = []
+        self.gates: dict[str, asyncio.Event] = {}
+
+    async def execute(self, task_description: str, initial_state=None) -> str:
+        self.started.append(task_description)
+        gate = self.gates.get(task_description)
+        if gate is not None:
+            await gate.wait()
+        self.finished.append(task_description)
+        return f"done: {task_description}"
+
+
+class TestTaskDependency:
+    """Tests for the TaskDependency record."""
+
+    def test_slots_record_pickles(self):
+        """Test the slotted record has no instance dict and survives pickling."""
+        dependency = TaskDependency("t1", produces=["data"], consumes=["notes"])
+
+        copy = pickle.loads(pickle.dumps(dependency))
+
+        assert not hasattr(dependency, "__dict__")
+        assert (copy.task_id, copy.produces, copy.consumes) == (
+            "t1",
+            frozenset({"data"}),
+            frozenset({"notes"}),
+        )
+
+
+class TestDependencyAnalyzer:
+    """Tests for dependency graph construction."""
+
+    def test_graph_links_producers_to_consumers(self):
+        """Test edges run from each producer to every task consuming its data."""
+        dependencies = [
+            TaskDependency("fetch", produces=["data", "data"], consumes=[]),
+            TaskDependency("clean", produces=["table"], consumes=["data"]),
+            TaskDependency("chart", produces=[], consumes=["table", "data"]),
+            TaskDependency("loop", produces=["notes"], consumes=["notes"]),
+        ]
+
+        graph = DependencyAnalyzer(llm_client=None).build_dependency_graph(dependencies)
+
+        assert set(graph.nodes) == {"fetch", "clean", "chart", "loop"}
+        assert set(graph.edges) == {("fetch", "clean"), ("fetch", "chart"), ("clean", "chart")}
+        assert graph.nodes["fetch"]["produces"] == frozenset({"data"})
+
+    def test_adjacency_matches_graph_edges(self):
+        """Test the plain adjacency lists hold one entry per graph edge."""
+        dependencies = [
+            TaskDependency("fetch", produces=["data", "schema"], consumes=[]),
+            TaskDependency("clean", produces=["table"], consumes=["data", "schema"]),
+            TaskDependency("chart", produces=[], consumes=["table", "data"]),
+        ]
+        analyzer = DependencyAnalyzer(llm_client=None)
+
+        successors, predecessors = analyzer.build_adjacency(dependencies)
+
+        assert sorted(successors["fetch"]) == ["chart", "clean"]
+        assert successors["clean"] == ["chart"]
+        assert successors["chart"] == []
+        assert predecessors["fetch"] == []
+        assert predecessors["clean"] == ["fetch"]
+        assert sorted(predecessors["chart"]) == ["clean", "fetch"]
+        edges = {(u, v) for u, targets in successors.items() for v in targets}
+        assert edges == set(analyzer.build_dependency_graph(dependencies).edges)
+
+    async def test_extractors_read_the_word_after_each_keyword(self):
+        """Test extraction lowercases and strips the object of each keyword."""
+        analyzer = DependencyAnalyzer(llm_client=None)
+        task = make_task(
+            "t1", "Read Sales.csv, then CREATE summary; write charts and write notes. Use"
+        )
+
+        assert await analyzer._extract_produces(task) == ["summary", "charts"]
+        assert await analyzer._extract_consumes(task) == ["sales.csv"]
+
+    def test_batches_follow_dependency_levels(self):
+        """Test each batch holds the tasks whose predecessors ran in earlier batches."""
+        graph = nx.DiGraph()
+        graph.add_nodes_from(["report", "chart", "clean", "fetch", "notes"])
+        graph.add_edges_from([
+            ("fetch", "clean"),
+            ("clean", "chart"),
+            ("fetch", "chart"),
+            ("chart", "report"),
+            ("notes", "report"),
+        ])
+
+        batches = DependencyAnalyzer(llm_client=None).get_execution_batches(graph)
+
+        assert batches == [["fetch", "notes"], ["clean"], ["chart"], ["report"]]
+
+    def test_batches_are_empty_for_cyclic_graph(self):
+        """Test a cycle anywhere in the graph yields no batches."""
+        graph = nx.DiGraph([("a", "b"), ("b", "c"), ("c", "b")])
+
+        assert DependencyAnalyzer(llm_client=None).get_execution_batches(graph) == []
+
+    async def test_tasks_are_analyzed_concurrently_up_to_limit(self):
+        """Test extraction overlaps across tasks but stays within max_concurrent."""
+        release = asyncio.Event()
+        in_flight = []
+
+        class SlowAnalyzer(DependencyAnalyzer):
+            async def _extract_produces(self, task):
+                in_flight.append(task.id)
+                await release.wait()
+                return [f"{task.id}-out"]
+
+        analyzer = SlowAnalyzer(llm_client=None, max_concurrent=3)
+        tasks = [make_task(f"t{i}", f"step {i}") for i in range(5)]
+
+        run = asyncio.create_task(analyzer.analyze_task_dependencies(tasks))
+        for _ in range(20):
+            await asyncio.sleep(0)
+
+        assert in_flight == ["t0", "t1", "t2"]
+
+        release.set()
+        dependencies = await run
+
+        assert [dep.task_id for dep in dependencies] == [task.id for task in tasks]
+        assert dependencies[4].produces == frozenset({"t4-out"})
+
+
+class TestParallelExecutor:
+    """Tests for ParallelExecutor scheduling."""
+
+    async def test_ready_task_is_not_blocked_by_unrelated_slow_task(self):
+        """Test a task starts as soon as its own predecessors finish."""
+        agent = RecordingAgent()
+        agent.gates["create report"] = asyncio.Event()
+        tasks = [
+            make_task("slow", "create report"),
+            make_task("fast", "create summary"),
+            make_task("after-fast", "use summary"),
+        ]
+        executor = ParallelExecutor({"worker": agent})
+
+        run = asyncio.create_task(executor.execute_tasks(tasks))
+        for _ in range(20):
+            await asyncio.sleep(0)
+
+        assert agent.finished == ["create summary", "use summary"]
+        assert not run.done()
+
+        agent.gates["create report"].set()
+        results = await run
+
+        assert results == {
+            "slow": "done: create report",
+            "fast": "done: create summary",
+            "after-fast": "done: use summary",
+        }
+
+    async def test_consumer_waits_for_producer(self):
+        """Test a dependent task doesn't start before its producer completes."""
+        agent = RecordingAgent()
+        agent.gates["create data"] = asyncio.Event()
+        tasks = [make_task("consumer", "use data"), make_task("producer", "create data")]
+        executor = ParallelExecutor({"worker": agent})
+
+        run = asyncio.create_task(executor.execute_tasks(tasks))
+        for _ in range(20):
+            await asyncio.sleep(0)
+
+        assert agent.started == ["create data"]
+
+        agent.gates["create data"].set()
+        await run
+
+        assert agent.finished == ["create data", "use data"]
+
+    async def test_single_task_invokes_its_agent(self):
+        """Test a real Task is looked up by id and run by its assigned agent."""
+        agent = RecordingAgent()
+        task = Task(id="task-1", description="summarize notes", assigned_agent="writer")
+        executor = ParallelExecutor({"writer": agent})
+
+        results = await executor.execute_tasks([task])
+
+        assert results == {"task-1": "done: summarize notes"}
+        assert agent.started == ["summarize notes"]
+
+    async def test_results_stream_as_tasks_finish(self):
+        """Test on_result sees each result before slower tasks complete."""
+        agent = RecordingAgent()
+        agent.gates["create report"] = asyncio.Event()
+        tasks = [make_task("slow", "create report"), make_task("fast", "create summary")]
+        streamed = []
+
+        async def on_result(task_id, result):
+            streamed.append((task_id, result))
+
+        run = asyncio.create_task(ParallelExecutor({"worker": agent}).execute_tasks(
+            tasks, on_result=on_result
+        ))
+        for _ in range(20):
+            await asyncio.sleep(0)
+
+        assert streamed == [("fast", "done: create summary")]
+
+        agent.gates["create report"].set()
+        results = await run
+
+        assert streamed[1] == ("slow", "done: create report")
+        assert list(results) == ["fast", "slow"]
+
+    async def test_failing_callback_cancels_remaining_tasks(self):
+        """Test an on_result error propagates and stops the unfinished tasks."""
+        agent = RecordingAgent()
+        agent.gates["create report"] = asyncio.Event()
+        tasks = [make_task("slow", "create report"), make_task("fast", "create summary")]
+
+        async def on_result(task_id, result):
+            raise RuntimeError("sink closed")
+
+        with pytest.raises(RuntimeError, match="sink closed"):
+            await ParallelExecutor({"worker": agent}).execute_tasks(tasks, on_result=on_result)
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        assert agent.finished == ["create summary"]
+        assert [t for t in asyncio.all_tasks() if t is not asyncio.current_task()] == []
+
+    async def test_acyclic_plan_skips_cycle_enumeration(self, monkeypatch):
+        """Test cycles are only enumerated when the graph can't be ordered."""
+        monkeypatch.setattr(
+            DependencyAnalyzer,
+            "detect_circular_dependencies",
+            lambda self, graph: pytest.fail("acyclic plans should not enumerate cycles"),
+        )
+        tasks = [make_task("producer", "create data"), make_task("consumer", "use data")]
+
+        results = await ParallelExecutor({"worker": RecordingAgent()}).execute_tasks(tasks)
+
+        assert set(results) == {"producer", "consumer"}
+
+    async def test_circular_dependencies_are_rejected(self):
+        """Test a dependency cycle raises before any task runs."""
+        agent = RecordingAgent()
+        tasks = [
+            make_task("a", "create alpha and use beta"),
+            make_task("b", "create beta and use alpha"),
+            make_task("c", "create gamma"),
+        ]
+
+        with pytest.raises(ValueError, match="Circular dependencies"):
+            await ParallelExecutor({"worker": agent}).execute_tasks(tasks)
+
+        assert agent.started == []
+
+    async def test_concurrency_is_bounded(self):
+        """Test no more than max_concurrent tasks run at once."""
+        agent = RecordingAgent()
+        tasks = [make_task(f"t{i}", f"step {i}") for i in range(5)]
+        for task in tasks:
+            agent.gates[task.description] = asyncio.Event()
+        executor = ParallelExecutor({"worker": agent}, max_concurrent=2)
+
+        run = asyncio.create_task(executor.execute_tasks(tasks))
+        for _ in range(20):
+            await asyncio.sleep(0)
+
+        assert len(agent.started) == 2
+
+        for gate in agent.gates.values():
+            gate.set()
+        results = await run
+
+        assert len(results) == 5
+        assert len(agent.finished) == 5
+
+
+class TestPlanCache:
+    """Tests for reusing dependency graphs across executions."""
+
+    @pytest.fixture
+    def analyzed(self, monkeypatch):
+        """Record the task IDs of every dependency analysis."""
+        calls = []
+        original = DependencyAnalyzer.analyze_task_dependencies
+
+        async def tracking_analyze(self, tasks):
+            calls.append([task.id for task in tasks])
+            return await original(self, tasks)
+
+        monkeypatch.setattr(DependencyAnalyzer, "analyze_task_dependencies", tracking_analyze)
+        return calls
+
+    async def test_resubmitted_tasks_reuse_the_plan(self, analyzed):
+        """Test the same task set is analyzed once, whatever its order."""
+        agent = RecordingAgent()
+        executor = ParallelExecutor({"worker": agent})
+        tasks = [make_task("producer", "create data"), make_task("consumer", "use data")]
+
+        await executor.execute_tasks(tasks)
+        results = await ParallelExecutor({"worker": agent}).execute_tasks(list(reversed(tasks)))
+
+        assert analyzed == [["producer", "consumer"]]
+        assert agent.finished == ["create data", "use data", "create data", "use data"]
+        assert set(results) == {"producer", "consumer"}
+
+    async def test_changed_description_is_reanalyzed(self, analyzed):
+        """Test a task set with a different description misses the cache."""
+        executor = ParallelExecutor({"worker": RecordingAgent()})
+
+        await executor.execute_tasks([make_task("t1", "create data")])
+        await executor.execute_tasks([make_task("t1", "create report")])
+
+        assert analyzed == [["t1"], ["t1"]]
+
+    async def test_expired_plan_is_reanalyzed(self, analyzed, monkeypatch):
+        """Test a cached plan older than plan_cache_ttl is rebuilt."""
+        now = [1000.0]
+        monkeypatch.setattr(parallel_module.time, "monotonic", lambda: now[0])
+        executor = ParallelExecutor({"worker": RecordingAgent()}, plan_cache_ttl=60)
+        tasks = [make_task("t1", "create data")]
+
+        await executor.execute_tasks(tasks)
+        now[0] += 30
+        await executor.execute_tasks(tasks)
+        now[0] += 60
+        await executor.execute_tasks(tasks)
+
+        assert analyzed == [["t1"], ["t1"]]
+
+    async def test_cache_is_bounded(self, monkeypatch):
+        """Test the least recently used plans are evicted past the limit."""
+        monkeypatch.setattr(parallel_module, "PLAN_CACHE_MAX_ENTRIES", 2)
+        executor = ParallelExecutor({"worker": RecordingAgent()})
+
+        for index in range(3):
+            await executor.execute_tasks([make_task(f"t{index}", "create data")])
+
+        assert list(parallel_module._plan_cache) == [
+            (("t1", "create data"),),
+            (("t2", "create data"),),
+        ]
+
+
+class TestFIFOQueue:
+    """Tests for the pending-task FIFO queue."""
+
+    def test_removed_tasks_are_skipped(self):
+        """Test removed tasks never come out and don't count toward the length."""
+        queue = FIFOQueue()
+        for task_id in ["a", "b", "c"]:
+            queue.put(task_id)
+
+        assert queue.remove("a") is True
+        assert queue.remove("a") is False
+        assert len(queue) == 2
+        assert "a" not in queue
+        assert queue.peek() == "b"
+        assert [queue.get(), queue.get(), queue.get()] == ["b", "c", None]
+
+    def test_requeued_task_goes_to_the_back(self):
+        """Test a removed then re-added task takes a new place at the back."""
+        queue = FIFOQueue()
+        for task_id in ["a", "b"]:
+            queue.put(task_id)
+        queue.remove("a")
+        queue.put("a")
+        queue.put("b")
+
+        assert len(queue) == 2
+        assert [queue.get(), queue.get(), queue.get()] == ["b", "a", None]
+
+    def test_stale_entries_are_compacted(self):
+        """Test removing most tasks doesn't leave the backing deque growing."""
+        queue = FIFOQueue()
+        for index in range(100):
+            queue.put(f"t{index}")
+        for index in range(99):
+            queue.remove(f"t{index}")
+
+        assert len(queue) == 1
+        assert len(queue._queue) <= 3
+        assert queue.get() == "t99"
@@ -0,0 +1,322 @@
+"""Unit tests for supervisor delegation and sub-agent sessions.
+
+These tests replace sub-agent execution with mocks, so no LLM API
+calls are made.
+"""
+
+import asyncio
+import dataclasses
+from unittest.mock import ANY, AsyncMock, MagicMock
+
+import pytest
+
+from multi_agent.agent import (
+    AgentExecutionResult,
+    BaseAgent,
+    SubAgentSessionManager,
+    SupervisorAgent,
+    create_summary_message,
+)
+from multi_agent.agent.session import DEFAULT_SESSION_CACHE_SIZE
+from multi_agent.agent.supervisor import DEFAULT_MAX_CONCURRENT_SUBAGENTS
+from multi_agent.config.schemas import LLMConfig
+from multi_agent.models import Agent, Message, State, SubAgentSession
+from multi_agent.tracing import Tracer
+
+
+@pytest.fixture
+def llm_config():
+    """Create LLM config using mock credentials."""
+    return LLMConfig(
+        endpoint="https://mock.api/v1",
+        model="mock-model",
+        api_key_env="OPENAI_API_KEY"
+    )
+
+
+def make_sub_agent(llm_config, name: str, delay: float = 0.0) -> BaseAgent:
+    """Create a sub-agent whose execute() returns a canned answer."""
+    sub_agent = BaseAgent(
+        agent=Agent(name=name, role=name, system_prompt=f"You are {name}.", llm_config=llm_config)
+    )
+
+    async def execute(task_description, initial_state=None):
+        await asyncio.sleep(delay)
+        state = State(current_agent=name, messages=[Message(role="assistant", content=f"{name} done")])
+        return AgentExecutionResult(output=f"{name}: {task_description}", state=state, steps=1, completed=True)
+
+    sub_agent.execute = AsyncMock(side_effect=execute)
+    return sub_agent
+
+
+@pytest.fixture
+def supervisor(llm_config):
+    """Create a supervisor with two mocked sub-agents and a session manager."""
+    sup = SupervisorAgent(
+        agent=Agent(name="supervisor", role="Supervisor", system_prompt="Delegate.", llm_config=llm_config),
+        sub_agents={
+            "researcher": make_sub_agent(llm_config, "researcher", delay=0.2),
+            "writer": make_sub_agent(llm_config, "writer", delay=0.2),
+        },
+    )
+    sup.session_manager = SubAgentSessionManager(
+        parent_task_id="task-1",
+        state_manager=MagicMock(),
+        tracer=MagicMock(),
+    )
+    return sup
+
+
+class TestSupervisorDelegation:
+    """Tests for SupervisorAgent delegation handling."""
+
+    async def test_delegations_run_concurrently_in_order(self, supervisor):
+        """Test delegations fan out and results keep tool call order."""
+        state = State(current_agent="supervisor")
+        tool_calls = [
+            {"id": "call-1", "tool": "delegate_writer", "arguments": {"task": "write"}},
+            {"id": "call-2", "tool": "delegate_researcher", "arguments": {"task": "research"}},
+        ]
+
+        entered = []
+        both_started = asyncio.Event()
+
+        for name, sub_agent in supervisor.sub_agents.items():
+            async def execute(task_description, initial_state=None, name=name):
+                # Each call only returns once the other one has started too
+                entered.append(name)
+                if len(entered) == 2:
+                    both_started.set()
+                await both_started.wait()
+                state = State(current_agent=name)
+                return AgentExecutionResult(
+                    output=f"{name}: {task_description}", state=state, steps=1, completed=True
+                )
+
+            sub_agent.execute = AsyncMock(side_effect=execute)
+
+        new_state = await asyncio.wait_for(
+            supervisor._execute_tool_calls_with_delegation(state, tool_calls), timeout=5
+        )
+
+        assert sorted(entered) == ["researcher", "writer"]
+        assert [m.content for m in new_state.messages] == ["writer: write", "researcher: research"]
+        assert [m.tool_calls[0].id for m in new_state.messages] == ["call-1", "call-2"]
+
+    async def test_sessions_saved_in_one_batch_on_flush(self, supervisor):
+        """Test finished sessions are persisted together by flush()."""
+        state = State(current_agent="supervisor")
+        tool_calls = [
+            {"id": "call-1", "tool": "delegate_writer", "arguments": {"task": "write"}},
+            {"id": "call-2", "tool": "delegate_researcher", "arguments": {"task": "research"}},
+        ]
+        state_manager = supervisor.session_manager.state_manager
+
+        await supervisor._execute_tool_calls_with_delegation(state, tool_calls)
+        state_manager.save_session.assert_not_called()
+        state_manager.save_sessions_batch.assert_not_called()
+
+        await supervisor.session_manager.flush()
+        state_manager.save_sessions_batch.assert_called_once()
+        saved = state_manager.save_sessions_batch.call_args.args[0]
+        assert sorted(s.agent_name for s in saved) == ["researcher", "writer"]
+
+    async def test_unknown_sub_agent_reports_error(self, supervisor):
+        """Test delegating to an unknown sub-agent adds an error message."""
+        state = State(current_agent="supervisor")
+        tool_calls = [{"id": "call-1", "tool": "delegate_editor", "arguments": {"task": "edit"}}]
+
+        new_state = await supervisor._execute_tool_calls_with_delegation(state, tool_calls)
+
+        assert len(new_state.messages) == 1
+        assert "Sub-agent not found: editor" in new_state.messages[0].content
+
+    async def test_concurrent_sub_agents_are_bounded(self, supervisor, monkeypatch):
+        """Test MULTI_AGENT_MAX_CONCURRENT_SUBAGENTS limits parallel delegations."""
+        monkeypatch.setenv("MULTI_AGENT_MAX_CONCURRENT_SUBAGENTS", "1")
+        bounded = SupervisorAgent(
+            agent=supervisor.agent,
+            sub_agents=supervisor.sub_agents,
+        )
+        bounded.session_manager = supervisor.session_manager
+        state = State(current_agent="supervisor")
+        tool_calls = [
+            {"id": "call-1", "tool": "delegate_writer", "arguments": {"task": "write"}},
+            {"id": "call-2", "tool": "delegate_researcher", "arguments": {"task": "research"}},
+        ]
+
+        in_flight = 0
+        peak = 0
+
+        for name, sub_agent in bounded.sub_agents.items():
+            async def execute(task_description, initial_state=None, name=name):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                # Yield so an unbounded fan-out would let the other call enter
+                for _ in range(5):
+                    await asyncio.sleep(0)
+                in_flight -= 1
+                state = State(current_agent=name)
+                return AgentExecutionResult(
+                    output=f"{name}: {task_description}", state=state, steps=1, completed=True
+                )
+
+            sub_agent.execute = AsyncMock(side_effect=execute)
+
+        new_state = await bounded._execute_tool_calls_with_delegation(state, tool_calls)
+
+        assert peak == 1
+        assert [m.content for m in new_state.messages] == ["writer: write", "researcher: research"]
+
+    @pytest.mark.parametrize(
+        "name", ["MULTI_AGENT_MAX_CONCURRENT_SUBAGENTS", "MULTI_AGENT_SUBAGENT_TIMEOUT"]
+    )
+    def test_malformed_env_settings_fall_back_to_defaults(self, supervisor, monkeypatch, name):
+        """Test an unparsable env value is ignored instead of failing construction."""
+        monkeypatch.setenv(name, "lots")
+
+        configured = SupervisorAgent(agent=supervisor.agent, sub_agents=supervisor.sub_agents)
+
+        assert configured._delegation_semaphore._value == DEFAULT_MAX_CONCURRENT_SUBAGENTS
+        assert configured._delegation_timeout is None
+
+    async def test_sub_agent_timeout_reports_error(self, supervisor):
+        """Test a sub-agent exceeding the deadline yields an error message."""
+        supervisor._delegation_timeout = 0.05
+        state = State(current_agent="supervisor")
+        tool_calls = [{"id": "call-1", "tool": "delegate_writer", "arguments": {"task": "write"}}]
+
+        new_state = await supervisor._execute_tool_calls_with_delegation(state, tool_calls)
+
+        assert len(new_state.messages) == 1
+        assert "Sub-agent timed out after 0.05s: writer" in new_state.messages[0].content
+        assert new_state.messages[0].tool_calls[0].id == "call-1"
+
+        session_manager = supervisor.session_manager
+        session_manager.tracer.log_sub_agent_session.assert_called_with(
+            session_id=ANY, agent="writer", message_count=0, status="failed", save=False
+        )
+        await session_manager.flush()
+        session_manager.state_manager.save_sessions_batch.assert_called_once()
+        [saved] = session_manager.state_manager.save_sessions_batch.call_args.args[0]
+        assert saved.agent_name == "writer"
+        assert saved.status == "failed"
+        assert saved.summary == "Failed: Sub-agent timed out after 0.05s: writer"
+
+    def test_sub_agent_tools_built_once(self, supervisor):
+        """Test sub-agent tool definitions are prepared at construction."""
+        tools = supervisor._prepare_sub_agent_tools()
+
+        assert [t["function"]["name"] for t in tools] == ["delegate_researcher", "delegate_writer"]
+        assert supervisor._prepare_sub_agent_tools() is tools
+
+    def test_sub_agent_tool_is_immutable(self, supervisor):
+        """Test sub-agent tool wrappers can't be changed after construction."""
+        sub_tool = supervisor.sub_agent_tools[0]
+
+        assert sub_tool.name == "delegate_researcher"
+        assert sub_tool.agent is supervisor.sub_agents["researcher"]
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            sub_tool.name = "delegate_other"
+
+    def test_aggregate_results(self, supervisor):
+        """Test session summaries are listed per agent."""
+        session = SubAgentSession(
+            session_id="session-1",
+            parent_task_id="task-1",
+            agent_name="writer",
+            task_description="Write intro",
+        )
+        session.complete("Intro written")
+
+        assert supervisor.aggregate_results([session]) == "\n\nAggregated Results:\n- writer: Intro written"
+        assert supervisor.aggregate_results([]) == "\n\nAggregated Results:\n"
+
+        supervisor.session_manager = None
+        assert supervisor.aggregate_results([session]) == "\n\nAggregated Results:\n"
+
+
+class TestSubAgentSessionSummary:
+    """Tests for sub-agent session summary messages."""
+
+    def make_session(self) -> SubAgentSession:
+        """Create a running session with a short history."""
+        return SubAgentSession(
+            session_id="session-1",
+            parent_task_id="task-1",
+            agent_name="researcher",
+            task_description="Find facts",
+            message_history=[
+                Message(role="user", content="Find facts"),
+                Message(role="assistant", content="x" * 150),
+            ],
+        )
+
+    def test_summary_message_is_cached_until_status_changes(self):
+        """Test repeated summaries reuse the cached message."""
+        session = self.make_session()
+
+        first = create_summary_message(session, include_details=True)
+        assert create_summary_message(session, include_details=True) is first
+        assert "Task in progress: Find facts (2 messages)" in first.content
+        assert "ASSISTANT: " + "x" * 100 + "..." in first.content
+
+        session.complete("Found three facts")
+        completed = create_summary_message(session)
+        assert completed is not first
+        assert completed.content == "Found three facts"
+
+    async def test_session_trace_records_saved_on_flush(self, llm_config, tmp_path):
+        """Test sub-agent trace records are buffered until flush()."""
+        state_manager = MagicMock()
+        state_manager.task_dir = tmp_path
+        tracer = Tracer(task_id="task-1", state_manager=state_manager)
+        manager = SubAgentSessionManager(parent_task_id="task-1", state_manager=state_manager, tracer=tracer)
+        sub_agent = make_sub_agent(llm_config, "researcher")
+
+        session = await manager.create_session(sub_agent, "research")
+        await manager.execute_session(session, sub_agent)
+
+        assert tracer.trace.sub_agent_sessions[session.session_id].status == "completed"
+        assert not (tmp_path / "trace.json").exists()
+
+        await manager.flush()
+        assert session.session_id in (tmp_path / "trace.json").read_text(encoding="utf-8")
+
+
+class TestSubAgentSessionCache:
+    """Tests for the bounded session cache."""
+
+    async def test_least_recently_used_session_is_evicted(self, llm_config):
+        """Test evicted sessions are reloaded from the state manager."""
+        state_manager = MagicMock()
+        state_manager.load_session.return_value = None
+        manager = SubAgentSessionManager(
+            parent_task_id="task-1",
+            state_manager=state_manager,
+            tracer=MagicMock(),
+            max_cached_sessions=2,
+        )
+        sub_agent = make_sub_agent(llm_config, "researcher")
+
+        first = await manager.create_session(sub_agent, "one")
+        second = await manager.create_session(sub_agent, "two")
+        assert manager.get_session(first.session_id) is first  # first is now most recent
+        third = await manager.create_session(sub_agent, "three")
+
+        assert list(manager.sessions) == [first.session_id, third.session_id]
+
+        state_manager.load_session.return_value = second
+        assert manager.get_session(second.session_id) is second
+        state_manager.load_session.assert_called_once_with(second.session_id)
+
+    def test_malformed_env_settings_fall_back_to_defaults(self, monkeypatch):
+        """Test an unparsable cache size is ignored instead of failing construction."""
+        monkeypatch.setenv("MULTI_AGENT_SESSION_CACHE_SIZE", "lots")
+
+        manager = SubAgentSessionManager(
+            parent_task_id="task-1", state_manager=MagicMock(), tracer=MagicMock()
+        )
+
+        assert manager.max_cached_sessions == DEFAULT_SESSION_CACHE_SIZE